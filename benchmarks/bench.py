@@ -0,0 +1,210 @@
+"""
+Headless micro-benchmarks for pyWin.
+
+Needs a display, on a Linux box without one run it under Xvfb:
+
+    xvfb-run -a python benchmarks/bench.py --output results.json
+    xvfb-run -a python benchmarks/bench.py --compare results.json
+
+or without Tk at all, on the null backend (only compare it with itself):
+
+    python benchmarks/bench.py --backend null
+
+"window_memory" is the python memory allocated per widget while building a window
+(bytes, traced with tracemalloc), the Tcl side is not counted.
+"""
+import argparse
+import gc
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import pyWin  # noqa: E402
+
+LANG_KEYS = 50
+
+
+def write_app(root: str, size: int):
+    os.makedirs(os.path.join(root, "interface"), exist_ok=True)
+    os.makedirs(os.path.join(root, "lang"), exist_ok=True)
+    types = ["label", "entry", "button"]
+    with open(os.path.join(root, "interface", "main.yaml"), "w") as f:
+        f.write("title: $title$\nsize: 800, 600\nwidgets:\n")
+        for i in range(size):
+            f.write(f"  - type: {types[i % 3]}\n"
+                    f"    tag: w{i}\n"
+                    f"    text: $k{i % LANG_KEYS}$\n"
+                    f"    pos: grid {i // 10} {i % 10}\n"
+                    f"    events: [\"<Ping> ping\"]\n")
+    with open(os.path.join(root, "interface", "empty.yaml"), "w") as f:
+        f.write("title: root\nsize: 10, 10\n")
+    for lang in ["en", "fr"]:
+        with open(os.path.join(root, "lang", lang + ".yaml"), "w") as f:
+            f.write(f"title: {lang} title\n")
+            for k in range(LANG_KEYS):
+                f.write(f"k{k}: {lang} text {k}\n")
+
+
+class BenchApp(pyWin.App):
+    def run(self):
+        self.pings = 0
+
+    def command_ping(self, window, widget):
+        self.pings += 1
+
+    def command_noop(self, window, widget):
+        pass
+
+
+def timeit(func, repeat: int, setup=None, teardown=None):
+    times = []
+    for _ in range(repeat):
+        state = setup() if setup else None
+        start = time.perf_counter()
+        func(state)
+        times.append(time.perf_counter() - start)
+        if teardown:
+            teardown(state)
+    return {"min_ms": min(times) * 1000, "median_ms": statistics.median(times) * 1000, "repeat": repeat}
+
+
+def bench_size(root: str, size: int, repeat: int, backend: str = "tk"):
+    write_app(root, size)
+    results = {}
+    app = BenchApp(root, cacheDir=None, backend=backend)
+    rootWindow = app.create_window(app.get_interface("empty"))
+    rootWindow._window.withdraw()
+
+    def parse_cold(_):
+        app.cache.clear()
+        app._interfaces.clear()
+        app._langs.clear()
+        app.get_interface("main", app.get_lang("en"))
+
+    results["interface_parse_cold"] = timeit(parse_cold, repeat)
+    results["interface_parse_warm"] = timeit(lambda _: app.get_interface("main", app.get_lang("en")), repeat)
+
+    en, fr = app.get_lang("en"), app.get_lang("fr")
+    interface = app.get_interface("main", en)
+
+    def build(_):
+        window = app.create_window(interface)
+        window._window.update_idletasks()
+        return window
+
+    windows = []
+    results["window_build"] = timeit(lambda _: windows.append(build(None)), repeat,
+                                     teardown=lambda _: windows.pop().close())
+
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    window = build(None)
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    results["window_memory"] = {"bytes_per_widget": used / max(len(window.widgets), 1),
+                                "widgets": len(window.widgets)}
+
+    def switch(_):
+        window.set_lang(fr if window.lang is en else en)
+        window._window.update_idletasks()
+
+    results["set_lang"] = timeit(switch, repeat)
+
+    def churn(_):
+        created = [window.create_widget("label", text="x", pos="grid 0 0") for _ in range(100)]
+        for w in created:
+            w.delete()
+
+    results["create_delete_100"] = timeit(churn, repeat)
+
+    widgets = window.widgets
+
+    def set_loop(_):
+        for i, w in enumerate(widgets):
+            w.set("bg", "white" if i % 2 else "grey")
+        window._window.update_idletasks()
+
+    def set_loop_batch(_):
+        with window.batch():
+            for i, w in enumerate(widgets):
+                w.set("bg", "grey" if i % 2 else "white")
+        window._window.update_idletasks()
+
+    results["widget_set_loop"] = timeit(set_loop, repeat)
+    results["widget_set_loop_batch"] = timeit(set_loop_batch, repeat)
+
+    target = widgets[len(widgets) // 2] if widgets else None
+    if target:
+        count = 1000
+        results["cmd_dispatch_1000"] = timeit(lambda _: [window.cmd("noop", target) for _ in range(count)], repeat)
+
+        def events(_):
+            for _ in range(count):
+                target._widget.event_generate("<<Ping>>")
+
+        pings = app.pings
+        results["event_dispatch_1000"] = timeit(events, repeat)
+        results["event_dispatch_1000"]["handled"] = app.pings - pings
+
+    window.close()
+    rootWindow.close()
+    return results
+
+
+def compare(results: dict, baseline: dict, threshold: float):
+    regressions = 0
+    for size, benches in results["sizes"].items():
+        for name, result in benches.items():
+            base = baseline.get("sizes", {}).get(size, {}).get(name)
+            if not base:
+                continue
+            key, unit = ("min_ms", "ms") if "min_ms" in result else ("bytes_per_widget", "B")
+            ratio = result[key] / base[key] if base[key] else 1
+            flag = ""
+            if ratio > 1 + threshold:
+                flag = "  REGRESSION"
+                regressions += 1
+            elif ratio < 1 - threshold:
+                flag = "  faster"
+            print(f"{size:>6} {name:<26} {base[key]:10.3f} -> {result[key]:10.3f} {unit:<2}  x{ratio:5.2f}{flag}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000, 10000])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", help="write the results to this JSON file")
+    parser.add_argument("--compare", help="compare the results with this JSON baseline")
+    parser.add_argument("--threshold", type=float, default=0.10, help="relative slowdown reported as a regression")
+    parser.add_argument("--backend", default="tk", choices=["tk", "null"])
+    args = parser.parse_args()
+
+    results = {"python": platform.python_version(), "platform": platform.platform(), "backend": args.backend,
+               "sizes": {}}
+    with tempfile.TemporaryDirectory(prefix="pyWin-bench-") as tmp:
+        for size in args.sizes:
+            results["sizes"][str(size)] = bench_size(os.path.join(tmp, str(size)), size, args.repeat, args.backend)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        sys.exit(1 if compare(results, baseline, args.threshold) else 0)
+    if not args.output:
+        json.dump(results, sys.stdout, indent=2)
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,174 +1,591 @@
+import time
+
+_importStart = time.perf_counter()
+
+import array
+import hashlib
+import heapq
+import operator
 import os.path
+import pickle
+import string
 import sys
+import threading
 import tkinter as tk
-import tkinter.messagebox as msgbox
+from collections import OrderedDict, deque
+from contextlib import contextmanager, ExitStack
+from itertools import compress
+from types import MappingProxyType
 
-from yaml import safe_load
+# yaml, asyncio, concurrent.futures, ttk, messagebox and numpy (optional) are imported on first use
+_yamlLoad = None
+_numpyModule = False
 
 
 class InvalidWidgetError(Exception): pass
 class InvalidEventError(Exception): pass
 class ScriptNotFoundError(Exception): pass
 class CommandNotFoundError(ScriptNotFoundError): pass
+class InvalidFileError(Exception): pass
+
+
+def _parse_yaml(content):
+    global _yamlLoad
+    if _yamlLoad is None:
+        import yaml
+        loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+        _yamlLoad = lambda c: yaml.load(c, Loader=loader)
+    return _yamlLoad(content)
+
+
+def _numpy():
+    global _numpyModule
+    if _numpyModule is False:
+        try:
+            import numpy as _numpyModule
+        except ImportError:
+            _numpyModule = None
+    return _numpyModule
+
+
+def _is_coroutine_function(func):
+    # same as inspect.iscoroutinefunction, without importing inspect
+    code = getattr(getattr(func, "__func__", func), "__code__", None)
+    return bool(code and code.co_flags & 0x80)
+
+
+class _YamlCache:
+    version = 1
+
+    def __init__(self, cacheDir: (str, None) = None):
+        self.cacheDir = cacheDir
+        self._memo = {}
+        self._bundled = {}
+
+    def add_bundle(self, root: str, files: dict):
+        for name, data in files.items():
+            self._bundled[root + "/" + name] = data
+
+    def _cache_path(self, path):
+        key = hashlib.sha1(os.path.abspath(path).encode()).hexdigest()[:16]
+        return os.path.join(self.cacheDir, os.path.basename(path) + "." + key + ".pywin")
+
+    def _read_cache(self, path):
+        try:
+            with open(self._cache_path(path), "rb") as f:
+                entry = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ValueError):
+            return None
+        if type(entry) != dict or entry.get("version") != self.version or entry.get("path") != os.path.abspath(path):
+            return None
+        return entry
+
+    def _write_cache(self, path, entry):
+        try:
+            os.makedirs(self.cacheDir, exist_ok=True)
+            tmp = self._cache_path(path) + ".tmp"
+            with open(tmp, "wb") as f:
+                pickle.dump(entry, f, pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, self._cache_path(path))
+        except OSError:
+            pass
+
+    def load(self, path: str):
+        if path in self._bundled:
+            return self._bundled[path]
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"No such file or directory: '{path}'")
+        key = (stat.st_mtime_ns, stat.st_size)
+        memo = self._memo.get(path)
+        if memo and memo[0] == key:
+            return memo[1]
+
+        entry = self._read_cache(path) if self.cacheDir else None
+        if entry and entry["mtime"] == stat.st_mtime_ns and entry["size"] == stat.st_size:
+            self._memo[path] = (key, entry["data"])
+            return entry["data"]
+
+        with open(path, "rb") as f:
+            content = f.read()
+        digest = hashlib.sha1(content).hexdigest()
+        if entry and entry["hash"] == digest:
+            data = entry["data"]
+        else:
+            data = _parse_yaml(content)
+            if data is None:
+                data = {}
+            if type(data) != dict:
+                raise InvalidFileError(f"Invalid file '{path}', expected a mapping")
+        if self.cacheDir:
+            self._write_cache(path, {"version": self.version, "path": os.path.abspath(path),
+                                     "mtime": stat.st_mtime_ns, "size": stat.st_size, "hash": digest, "data": data})
+        self._memo[path] = (key, data)
+        return data
+
+    def clear(self):
+        self._memo.clear()
+
+
+_yamlCache = _YamlCache()
+
+
+def drop_if_running(func):
+    func._dropIfRunning = True
+    return func
+
+
+def background(func):
+    func._background = True
+    return func
+
+
+def _is_lang_key(value):
+    return type(value) == str and len(value) >= 2 and value[0] == "$" and value[-1] == "$"
+
+
+def _parse_widget(app, w, lang, i):
+    try:
+        type = w["type"]
+    except (KeyError, TypeError):
+        raise InvalidWidgetError(f"Invalid widget with id {i}")
+    return _MetaWidget(app, type, lang, **{k: v for k, v in w.items() if k != "type"})
 
 
 class _MetaWidget:
+    __slots__ = ["app", "type", "lang", "raw", "children", "repeat", "translated", "args", "_spec"]
+
     def __init__(self, app, type: str, lang = None, **kwargs):
         self.app = app
         self.type = type.lower()
-        self.args = {}
-        if lang:
-            for k, v in kwargs.items():
-                self.args[k] = lang.get(v)
+        self.lang = lang
+        self.raw = kwargs
+        self.children = None
+        self._spec = None
+        if self.type == "notebook":
+            self.children = [_MetaWidget(app, "frame", lang, title=p.get("title", ""), children=p.get("widgets", []))
+                             for p in kwargs.get("pages", [])]
+        elif "children" in kwargs:
+            self.children = [_parse_widget(app, w, lang, i) for i, w in enumerate(kwargs["children"])]
+        self.repeat = None
+        if "repeat" in kwargs:
+            # row templates, parsed once and instantiated for every item given to window.render
+            repeat = kwargs["repeat"]
+            if not isinstance(repeat, dict):
+                repeat = {"widgets": repeat}
+            self.repeat = {"widgets": [_parse_widget(app, w, lang, i) for i, w in enumerate(repeat.get("widgets") or [])],
+                           "key": repeat.get("key"), "chunk": int(repeat.get("chunk", 100))}
+        self.translated = tuple(k for k, v in kwargs.items() if _is_lang_key(v))
+        if lang and self.translated:
+            self.args = kwargs.copy()
+            for k in self.translated:
+                self.args[k] = lang.get(kwargs[k])
         else:
             self.args = kwargs
 
 
+def _parse_pos(pos, id: int):
+    if type(pos) == str:
+        pos = pos.split(" ")
+    try:
+        posType = pos[0]
+        if posType == "pack":
+            if len(pos) == 2:
+                if str(pos[1]).lower() not in ["left", "right", "top", "bottom"]:
+                    raise InvalidWidgetError(f"Invalid widget with id {id}, invalid position")
+                return ("pack", str(pos[1]).lower())
+            else:
+                return ("pack", "top")
+        elif posType == "place":
+            return ("place", pos[1], pos[2])
+        elif posType == "grid":
+            return ("grid", pos[1], pos[2])
+        else:
+            raise InvalidWidgetError(f"Invalid widget with id {id}, invalid position type '{posType}'")
+    except IndexError:
+        raise InvalidWidgetError(f"Invalid widget with id {id}, invalid position")
+
+
+_stringVarTypes = ("entry", "label")
+_intVarTypes = ("checkbutton", "scale")
+_varTypes = _stringVarTypes + _intVarTypes
+_inputTypes = ("entry", "checkbutton", "scale")
+_textTypes = _stringVarTypes + ("text",)
+_structuralKeys = ("children", "pages", "lazy", "repeat", "pos", "events", "action", "tag", "thread", "bind")
+
+
+class _WidgetSpec:
+    # what every widget built from the same meta has in common, shared and never modified
+    __slots__ = ["args", "page", "title", "text", "image", "pos", "binds", "action", "tag", "thread", "bind"]
+
+    def __init__(self, type: str, margs: dict, id: int, page: bool):
+        self.args = args = margs.copy()
+        for k in _structuralKeys:
+            args.pop(k, None)
+        self.page = page
+        self.title = args.pop("title", "") if page else None
+        self.text = args.pop("text") if "text" in args and type in _stringVarTypes else None
+        self.image = args.pop("image", None) or None
+        if "from" in args and type == "scale":
+            args["from_"] = args.pop("from")
+        if "disabled" in args:
+            args["state"] = "disabled" if args.pop("disabled") else "normal"
+        # a "{field}" position of a repeat template is parsed for each row
+        self.pos = _parse_pos(margs["pos"], id) if "pos" in margs and "{" not in str(margs["pos"]) else ("pack", "top")
+        binds = list(margs.get("events", []))
+        self.action = margs.get("action")
+        if "action" in margs:
+            if type in ["entry", "text", "label"]:
+                binds.append(("Return", self.action))
+            elif type in ["virtuallist", "table"]:
+                binds.append(("<Select>", self.action))
+        self.binds = tuple(binds)
+        self.tag = str(margs["tag"]) if "tag" in margs else None
+        self.thread = bool(margs.get("thread", False))
+        self.bind = margs.get("bind")
+
+
+def _widget_spec(window, meta, id: int, page: bool):
+    if meta.translated and (meta.lang is not window.lang or window.langVars):
+        margs = meta.raw.copy()
+        for k in meta.translated:
+            margs[k] = window.lang.get(meta.raw[k], **window.langVars)
+        return _WidgetSpec(meta.type, margs, id, page)
+    if meta._spec is None or meta._spec.page != page:
+        meta._spec = _WidgetSpec(meta.type, meta.args, id, page)
+    return meta._spec
+
+
 class _Widget:
-    nextId = 0
+    __slots__ = ["window", "parent", "children", "_expanded", "fromInterface", "id", "_widget", "type", "meta",
+                 "_spec", "_args", "title", "pos", "_image", "_var", "_binding"]
 
-    def __init__(self, window, meta):
+    def __init__(self, window, meta, parent=None):
         self.window = window
-        self.app = meta.app
-        self.id = _Widget.nextId
-        _Widget.nextId += 1
+        self.parent = parent
+        self.children = []
+        self._expanded = False
+        self.fromInterface = False
+        self.id = window._nextId
+        window._nextId += 1
+        self._widget = None
         self.type = meta.type
-        self.args = meta.args.copy()
-        self.var = tk.StringVar() if self.type in ["entry", "text", "label"] else None
-        self.intVar = tk.IntVar() if self.type in ["checkbutton", "scale"] else None
-        if self.var:
-            self.args["textvariable"] = self.var
-        if self.intVar:
-            self.args["variable"] = self.intVar
-        self.binds = []
-        if "from" in meta.args and self.type == "scale":
-            del self.args["from"]
-            self.args["from_"] = meta.args["from"]
-        if "disabled" in meta.args:
-            del self.args["disabled"]
-            if meta.args["disabled"]:
-                self.args["state"] = "disabled"
-            else:
-                self.args["state"] = "normal"
-        if "text" in meta.args and self.var:
-            del self.args["text"]
-            self.var.set(meta.args["text"])
-        if "pos" in meta.args:
-            del self.args["pos"]
-            pos = meta.args["pos"]
-            if type(pos) == str:
-                pos = pos.split(" ")
-            try:
-                posType = pos[0]
-                if posType == "pack":
-                    if len(pos) == 2:
-                        if str(pos[1]).lower() not in ["left", "right", "top", "bottom"]:
-                            raise InvalidWidgetError(f"Invalid widget with id {self.id}, invalid position")
-                        self.pos = ("pack", str(pos[1]).lower())
-                    else:
-                        self.pos = ("pack", "top")
-                elif posType == "place":
-                    self.pos = ("place", pos[1], pos[2])
-                elif posType == "grid":
-                    self.pos = ("grid", pos[1], pos[2])
-                else:
-                    raise InvalidWidgetError(f"Invalid widget with id {self.id}, invalid position type '{posType}'")
-            except IndexError:
-                raise InvalidWidgetError(f"Invalid widget with id {self.id}, invalid position")
-        else:
-            self.pos = ("pack", "top")
-        if "events" in meta.args:
-            del self.args["events"]
-            for e in meta.args["events"]:
-                self.binds.append(e)
-        if "action" in meta.args:
-            del self.args["action"]
-            if self.type in ["button", "scale"]:
-                self.args["command"] = lambda: self.window.cmd(meta.args["action"], self)
-            elif self.type in ["entry", "text", "label"]:
-                self.binds.append(("Return", meta.args["action"]))
-        if "tag" in meta.args:
-            del self.args["tag"]
-            self.tag = str(meta.args["tag"])
-            self.window._tags[self.tag] = self
+        self.meta = meta
+        self._spec = spec = _widget_spec(window, meta, self.id, parent is not None and parent.type == "notebook")
+        # own copy of the options, only made the first time one of them is changed
+        self._args = None
+        self.title = spec.title
+        self.pos = spec.pos
+        self._image = spec.image
+        # tkinter variable wrapper, only made when the value is first read or written from python
+        self._var = None
+        self._binding = None
+
+    @property
+    def app(self):
+        return self.meta.app
+
+    @property
+    def args(self):
+        # read only: until set() copies them, the args are shared with every widget built from the same meta
+        return MappingProxyType(self._spec.args if self._args is None else self._args)
+
+    def _is_row(self):
+        return self.parent is not None and self.parent.meta.repeat is not None
+
+    def _own_args(self):
+        if self._args is None:
+            self._args = self._spec.args.copy()
+        return self._args
+
+    @property
+    def binds(self):
+        return self._spec.binds
+
+    @property
+    def tag(self):
+        return self._spec.tag
+
+    @property
+    def thread(self):
+        return self._spec.thread
+
+    @property
+    def bind(self):
+        return self._spec.bind
+
+    @property
+    def _var_name(self):
+        return f"pyWin{id(self.window)}_{self.id}"
+
+    @property
+    def var(self):
+        if self._var is None and self.type in _stringVarTypes:
+            self._var = tk.StringVar(self.window._window, name=self._var_name)
+        return self._var if self.type in _stringVarTypes else None
+
+    @property
+    def intVar(self):
+        if self._var is None and self.type in _intVarTypes:
+            self._var = tk.IntVar(self.window._window, name=self._var_name)
+        return self._var if self.type in _intVarTypes else None
 
     @property
     def checked(self):
-        return bool(self.type == "checkbutton" and self.intVar.get())
+        return bool(self.type == "checkbutton" and self.get_value())
+
+    @property
+    def selection(self):
+        if self.type in ["virtuallist", "table"]:
+            return self._widget.selection
 
     def set(self, key, value):
-        if key == "text" and self.var:
-            self.var.set(value)
+        if key == "text" and self.type in _textTypes:
+            self.set_value(value)
+            return
+        if threading.get_ident() != self.app._mainThread:
+            self.app._post_update(self, key, value)
             return
-        self.args[key] = value
+        if key == "image":
+            self._set_image(value)
+            return
+        self._own_args()[key] = value
+
+        self.window._configure(self, {key: value})
 
-        self.window._widgets[self.window.widgets.index(self)].config(**{key: value})
+    def _set_image(self, path):
+        # the Tk image is shared with every widget showing the same file
+        old, self._image = self._image, path or None
+        image = self.app.resources.acquire(path, self.window._window) if path else ""
+        if old:
+            self.app.resources.release(old)
+        self.window._configure(self, {"image": image})
 
     def get_value(self):
-        if self.var:
+        if self.type in ["text", "virtuallist", "table"]:
+            return self._widget.get_value()
+        if self in self.window._pendingValues:
+            return self.window._pendingValues[self]
+        if self.type in _stringVarTypes:
             return self.var.get()
-        if self.intVar:
+        if self.type in _intVarTypes:
             return self.intVar.get()
 
     def set_value(self, value):
-        if self.var:
-            self.var.set(value)
-        if self.intVar:
-            self.intVar.set(value)
+        if threading.get_ident() != self.app._mainThread:
+            self.app._post_update(self, None, value)
+            return
+        if self.type == "text":
+            self._widget.set_value(value)
+            return
+        if self.type == "virtuallist":
+            self._widget.set_items(value)
+            return
+        if self.type == "table":
+            self._widget.set_rows(value)
+            return
+        if self.type not in _varTypes:
+            return
+        if self.window._batchDepth:
+            self.window._pendingValues[self] = value
+            return
+        if self.app._stats is not None:
+            self.app._stats.count("set_value")
+        (self.var or self.intVar).set(value)
+
+    def set_items(self, items, count: int = None):
+        if threading.get_ident() != self.app._mainThread:
+            self.app.post(self.set_items, items, count)
+            return
+        if self.type == "virtuallist":
+            self._widget.set_items(items, count)
+
+    def append_rows(self, rows):
+        if threading.get_ident() != self.app._mainThread:
+            self.app.post(self.append_rows, rows)
+            return
+        if self.type == "table":
+            return self._widget.append_rows(rows)
+
+    def update_row(self, id: int, **values):
+        if threading.get_ident() != self.app._mainThread:
+            self.app.post(self.update_row, id, **values)
+            return
+        if self.type == "table":
+            self._widget.update_row(id, **values)
+
+    def delete_rows(self, *ids):
+        if threading.get_ident() != self.app._mainThread:
+            self.app.post(self.delete_rows, *ids)
+            return
+        if self.type == "table":
+            self._widget.delete_rows(*ids)
+
+    def sort(self, column: str = None, reverse: bool = False):
+        if threading.get_ident() != self.app._mainThread:
+            self.app.post(self.sort, column, reverse)
+            return
+        if self.type == "table":
+            self._widget.sort(column, reverse)
+
+    def filter(self, *conditions):
+        if threading.get_ident() != self.app._mainThread:
+            self.app.post(self.filter, *conditions)
+            return
+        if self.type == "table":
+            self._widget.filter(*conditions)
+
+    def draw(self, kind: str, items, group: str = None, **options):
+        if threading.get_ident() != self.app._mainThread:
+            self.app.post(self.draw, kind, items, group, **options)
+            return
+        if self.type == "canvas":
+            if self.app._stats is not None:
+                self.app._stats.count("canvas_draw")
+            return self._widget.draw(kind, items, group, **options)
+
+    def plot(self, group: str, ys, xs=None, decimate: bool = True, **options):
+        if threading.get_ident() != self.app._mainThread:
+            self.app.post(self.plot, group, ys, xs, decimate, **options)
+            return
+        if self.type == "canvas":
+            if self.app._stats is not None:
+                self.app._stats.count("canvas_draw")
+            return self._widget.plot(group, ys, xs, decimate, **options)
 
     def insert(self, text):
-        if self.var:
+        if threading.get_ident() != self.app._mainThread:
+            self.app.post(self.insert, text)
+            return
+        if self.type == "text":
+            self._widget.append(text)
+        elif self.type in _stringVarTypes:
             self.set_value(self.get_value() + text)
 
+    def append(self, text: str):
+        self.insert(text)
+
+    def extend(self, lines):
+        if threading.get_ident() != self.app._mainThread:
+            self.app.post(self.extend, list(lines))
+            return
+        if self.type == "text":
+            self._widget.extend(lines)
+        else:
+            self.insert("".join(lines))
+
     def back(self, n=1):
-        if self.var:
+        if threading.get_ident() != self.app._mainThread:
+            self.app.post(self.back, n)
+            return
+        if self.type == "text":
+            self._widget.back(n)
+        elif self.type in _stringVarTypes:
             self.set_value(self.get_value()[0:-n])
 
     def clear(self):
-        if self.var:
+        if threading.get_ident() != self.app._mainThread:
+            self.app.post(self.clear)
+            return
+        if self.type in _textTypes:
             self.set_value("")
+        elif self.type in ["canvas", "table"]:
+            self._widget.clear()
 
     def focus(self):
-        self.window._widgets[self.window.widgets.index(self)].focus()
+        if threading.get_ident() != self.app._mainThread:
+            self.app.post(self.focus)
+            return
+        if self.app._stats is not None:
+            self.app._stats.count("focus")
+        self._widget.focus()
+
+    def invoke(self):
+        # clicks a button, checkbutton or radiobutton
+        if threading.get_ident() != self.app._mainThread:
+            self.app.post(self.invoke)
+            return
+        return self._widget.tk.call(self._widget._w, "invoke")
+
+    def fire(self, sequence: str, **fields):
+        # generates a Tk event on the widget, e.g. fire("Button-1", x=10, y=4), fire("Key", keysym="Return")
+        if threading.get_ident() != self.app._mainThread:
+            self.app.post(lambda: self.fire(sequence, **fields))
+            return
+        self._widget.event_generate(sequence if sequence.startswith("<") else "<" + sequence + ">", **fields)
+
+    def _translate(self, old, oldValues: dict, names=None):
+        new, values = self.window.lang, self.window.langVars
+        options = {}
+        for k in self.meta.translated:
+            if k in ["pos", "tag", "events", "action"]:
+                continue
+            if names is not None and not new.fields(self.meta.raw[k]) & names:
+                continue
+            value = new.get(self.meta.raw[k], **values)
+            if k == "title" and self.title is not None:
+                self.title = value
+                self.parent._widget.tab(self._widget, text=value)
+                continue
+            if k == "text" and self.type in _textTypes:
+                if self.get_value() == old.get(self.meta.raw[k], **oldValues):
+                    self.set_value(value)
+                continue
+            if k == "image":
+                if value != self._image:
+                    self._set_image(value)
+                continue
+            if k == "disabled":
+                k, value = "state", "disabled" if value else "normal"
+            elif k == "from" and self.type == "scale":
+                k = "from_"
+            if self.args.get(k) != value:
+                self._own_args()[k] = value
+                options[k] = value
+        return options
 
     def disable(self):
-        self.window._widgets[self.window.widgets.index(self)]["state"] = "disabled"
+        self.set("state", "disabled")
 
     def enable(self):
-        self.window._widgets[self.window.widgets.index(self)]["state"] = "normal"
+        self.set("state", "normal")
 
     def delete(self):
         self.window._delete_widget(self)
-        if self.id == _Widget.nextId - 1: _Widget.nextId -= 1
-        if self.tag: del self.window._tags[self.tag]
 
 
 # Code récupéré sur stackoverflow (Ne me juge pas)
 class _TextWidget(tk.Text):
-    def __init__(self, parent, *args, **kwargs):
-        try:
-            self._textvariable = kwargs.pop("textvariable")
-        except KeyError:
-            self._textvariable = None
-
+    def __init__(self, parent, *args, text="", maxlines=None, **kwargs):
         tk.Text.__init__(self, parent, *args, **kwargs)
+        self.maxlines = int(maxlines) if maxlines else None
+
+        # python side copy of the content, as a list of chunks joined on
+        # read, or None when it has to be read back from the widget
+        self._chunks = None
 
-        # if the variable has data in it, use it to initialize
-        # the widget
-        if self._textvariable is not None:
-            self.insert("1.0", self._textvariable.get())
+        if text:
+            self.insert("1.0", text)
 
-        # this defines an internal proxy which generates a
-        # virtual event whenever text is inserted or deleted
+        # this defines an internal proxy which calls back into python and
+        # generates a virtual event whenever text is inserted or deleted
         self.tk.eval('''
-            proc widget_proxy {widget widget_command args} {
+            proc widget_proxy {widget widget_command callback args} {
 
                 # call the real tk widget command with the real args
                 set result [uplevel [linsert $args 0 $widget_command]]
 
-                # if the contents changed, generate an event we can bind to
+                # if the contents changed, drop the python copy and generate an event we can bind to,
+                # only when something is bound to it
                 if {([lindex $args 0] in {insert replace delete})} {
-                    event generate $widget <<Change>> -when tail
+                    $callback
+                    foreach tag [bindtags $widget] {
+                        if {[bind $tag <<Change>>] ne ""} {
+                            event generate $widget <<Change>> -when tail
+                            break
+                        }
+                    }
                 }
                 # return the result from the real widget command
                 return $result
@@ -178,363 +595,3528 @@ class _TextWidget(tk.Text):
         # this replaces the underlying widget with the proxy
         self.tk.eval('''
             rename {widget} _{widget}
-            interp alias {{}} ::{widget} {{}} widget_proxy {widget} _{widget}
-        '''.format(widget=str(self)))
+            interp alias {{}} ::{widget} {{}} widget_proxy {widget} _{widget} {callback}
+        '''.format(widget=str(self), callback=self.register(self._on_widget_change)))
 
-        # set up a binding to update the variable whenever
-        # the widget changes
-        self.bind("<<Change>>", self._on_widget_change)
+    def _on_widget_change(self):
+        self._chunks = None
 
-        # set up a trace to update the text widget when the
-        # variable changes
-        if self._textvariable is not None:
-            self._textvariable.trace("wu", self._on_var_change)
+    def get_value(self):
+        if self._chunks is None:
+            self._chunks = [self.get("1.0", "end-1c")]
+        elif len(self._chunks) > 1:
+            self._chunks = ["".join(self._chunks)]
+        return self._chunks[0]
 
-    def _on_var_change(self, *args):
-        '''Change the text widget when the associated textvariable changes'''
+    def set_value(self, value):
+        self.delete("1.0", "end")
+        self.insert("1.0", value)
+        self._chunks = [value]
 
-        # only change the widget if something actually
-        # changed, otherwise we'll get into an endless
-        # loop
-        text_current = self.get("1.0", "end-1c")
-        var_current = self._textvariable.get()
-        if text_current != var_current:
-            self.delete("1.0", "end")
-            self.insert("1.0", var_current)
+    def append(self, text: str):
+        if not text:
+            return
+        chunks = self._chunks
+        self.insert("end-1c", text)
+        if chunks is not None:
+            chunks.append(text)
+            self._chunks = chunks
+        if self.maxlines:
+            self._trim()
 
-    def _on_widget_change(self, event=None):
-        '''Change the variable when the widget changes'''
-        if self._textvariable is not None:
-            self._textvariable.set(self.get("1.0", "end-1c"))
+    def extend(self, lines):
+        text = "".join(line if line.endswith("\n") else line + "\n" for line in lines)
+        self.append(text)
 
+    def back(self, n=1):
+        self.delete(f"end-1c-{int(n)}c", "end-1c")
 
-class _Lang:
-    def __init__(self, path: (str, None)):
-        if not path:
-            self.data = {}
-        else:
-            try:
-                with open(path, "r") as f:
-                    self.data = safe_load(f) or {}
-            except FileNotFoundError:
-                raise FileNotFoundError(f"No such file or directory: '{path}'")
-
-    def get(self, name):
-        if type(name) == str and name[0] == "$" and name[-1] == "$" and name[1:-1] in super().__getattribute__("data"):
-            return self[name[1:-1]]
-        else:
-            return name
+    def _trim(self):
+        line, column = self.index("end-1c").split(".")
+        lines = int(line) - (column == "0")
+        if lines > self.maxlines:
+            self.delete("1.0", f"{lines - self.maxlines + 1}.0")
 
-    def __getattribute__(self, name):
-        if name == "get": return super().__getattribute__("get")
-        try:
-            return super().__getattribute__("data")[name]
-        except KeyError:
-            return None
 
-    def __getitem__(self, name):
-        try:
-            return super().__getattribute__("data")[name]
-        except KeyError:
-            return None
+class _VirtualList(tk.Frame):
+    # the frame takes these options and the background, the rows every other (font, fg, anchor...)
+    _frameOptions = ("width", "height", "relief", "borderwidth", "bd")
 
+    def __init__(self, parent, rows=10, items=(), count=None, selectbackground="#0078d7", selectforeground="white",
+                 **kwargs):
+        frameArgs = {k: kwargs.pop(k) for k in self._frameOptions if k in kwargs}
+        frameArgs.update((k, kwargs[k]) for k in ["background", "bg"] if k in kwargs)
+        kwargs.pop("text", None)
+        tk.Frame.__init__(self, parent, **frameArgs)
 
-class _Interface:
-    def __init__(self, app, path: str, lang: _Lang = None):
-        try:
-            with open(path, "r") as f:
-                data = safe_load(f) or {}
-        except FileNotFoundError:
-            raise FileNotFoundError(f"No such file or directory: '{path}'")
-        self.path = path
-        self.lang = lang or _Lang(None)
-        self.title = self.lang.get(data.get("title", "PyWinApp"))
-        self.icon = self.lang.get(data.get("icon", None))
-        self.events = data.get("events", [])
-        size = data.get("size", "200, 200").split(",")
-        self.size = (int(size[0].strip()), int(size[1].strip()))
-        pos = data.get("pos")
-        if pos:
-            if pos == "center":
-                self.pos = "center"
-            elif pos == "auto":
-                self.pos = None
-            else:
-                pos = pos.split(",")
-                self.pos = (pos[0].strip(), pos[1].strip())
-        else:
-            self.pos = None
-        self.widgets = []
-        i = 0
-        for w in data.get("widgets", []):
-            try:
-                type = w["type"]
-                del w["type"]
-            except KeyError:
-                raise InvalidWidgetError(f"Invalid widget with id {i}")
-            self.widgets.append(_MetaWidget(app, type, self.lang, **w))
+        self._scrollbar = tk.Scrollbar(self, command=self.yview)
+        self._scrollbar.pack(side="right", fill="y")
 
+        # a fixed pool of rows, whatever the size of the data
+        self._rows = []
+        self._shown = []
+        for i in range(int(rows)):
+            row = tk.Label(self, anchor="w", **kwargs)
+            row.pack(side="top", fill="x")
+            row.bind("<Button-1>", lambda _, i=i: self.select(self._first + i))
+            row.bind("<MouseWheel>", lambda e: self.yview("scroll", -1 if e.delta > 0 else 1, "units"))
+            row.bind("<Button-4>", lambda _: self.yview("scroll", -1, "units"))
+            row.bind("<Button-5>", lambda _: self.yview("scroll", 1, "units"))
+            self._rows.append(row)
+            self._shown.append(None)
+        self._colors = ((self._rows[0].cget("bg"), self._rows[0].cget("fg")) if self._rows else None,
+                        (selectbackground, selectforeground))
 
-class _Window:
-    def __init__(self, app, interface: _Interface):
-        self._tags = {}
-        self.app = app
-        if len(app.windows) >= 1:
-            self._window = tk.Toplevel(app.windows[0]._window)
-        else:
-            self._window = tk.Tk()
-        self.interface = interface
-        self.lang = interface.lang
-        self._title = interface.title
-        self._iconPath = ((self.app.path + "/" + interface.icon) if not interface.icon.startswith(
-            "c:/") and not interface.icon.startswith(
-            "/") else interface.icon) if interface.icon else self.app.path + "/icon.ico"
-        self._size = interface.size
-        self._pos = interface.pos
+        self._first = 0
+        self.selection = None
+        self.set_items(items, count)
 
-        load = []
-        for b in interface.events:
-            if type(b) == str:
-                b = b.split(" ")
-            if b[0] == "load":
-                load = b[1:]
-                continue
-            try:
-                self._window.bind("<" + b[0] + ">", lambda e: self.run(b[1]))
-            except tk._tkinter.TclError:
-                raise InvalidEventError(f"Invalid event '{b[0]}'")
+    def bind(self, sequence=None, func=None, add=None):
+        for row in self._rows:
+            row.bind(sequence, func, "+")
+        return tk.Frame.bind(self, sequence, func, add)
 
-        self._window.title(self._title)
-        try:
-            self._window.iconbitmap(self._iconPath)
-        except tk._tkinter.TclError:
-            self._iconPath = os.path.join(sys.path[0], "./defaultIcon.ico")
-            self._window.iconbitmap(self._iconPath)
-        if self._pos != "center":
-            self._window.geometry(
-                f"{self._size[0]}x{self._size[1]}" + (f"+{self._pos[0]}+{self._pos[1]}" if self._pos else ""))
-        else:
-            self._window.geometry(
-                f"{self._size[0]}x{self._size[1]}+{int(self._window.winfo_screenwidth() / 2 - self._size[0] / 2)}+{int((self._window.winfo_screenheight() - 20) / 2 - (self._size[1] + 10) / 2)}")
+    def configure(self, cnf=None, **kw):
+        if isinstance(cnf, str):
+            return self._target(cnf).configure(cnf)
+        options = dict(cnf or {}, **kw)
+        if not options:
+            return tk.Frame.configure(self)
+        options.pop("text", None)
+        colors = list(self._colors[1])
+        for i, k in enumerate(["selectbackground", "selectforeground"]):
+            if k in options:
+                colors[i] = options.pop(k)
+        frameArgs = {k: options.pop(k) for k in self._frameOptions if k in options}
+        frameArgs.update((k, options[k]) for k in ["background", "bg"] if k in options)
+        if frameArgs:
+            tk.Frame.configure(self, **frameArgs)
+        for row in self._rows:
+            row.configure(**options)
+        if self._rows:
+            bg, fg = self._colors[0]
+            bg = options.get("background", options.get("bg", bg))
+            fg = options.get("foreground", options.get("fg", fg))
+            self._colors = ((bg, fg), tuple(colors))
+            # the selected row gets its colours back
+            self._shown = [None] * len(self._rows)
+            self._render()
 
-        self.widgets = []
-        for mw in interface.widgets:
-            self.widgets.append(_Widget(self, mw))
+    config = configure
 
-        self._widgets = []
-        for w in self.widgets:
-            try:
-                if w.type == "text":
-                    self._widgets.append(_TextWidget(self._window, **w.args))
-                else:
-                    self._widgets.append(tk.Widget(self._window, w.type, kw=w.args))
-            except tk._tkinter.TclError as e:
-                if e.args[0].startswith("invalid command name"):
-                    raise InvalidWidgetError(f"Invalid widget with id {w.id}, type '{w.type}' not found")
-                else:
-                    raise InvalidWidgetError(
-                        f"Invalid widget with id {w.id}, " + e.args[0].replace('"', "'").replace("'-", "'"))
-            _w = self._widgets[-1]
-            for b in w.binds:
-                if type(b) == str:
-                    b = b.split(" ")
-                try:
-                    self._widgets[-1].bind("<" + b[0] + ">", lambda _, w=w: self.cmd(b[1], w))
-                except tk._tkinter.TclError:
-                    raise InvalidEventError(f"Invalid event '{b[0]}'")
-        for w, _w in zip(self.widgets, self._widgets):
-            if w.pos[0] == "pack":
-                _w.pack(side=w.pos[1])
-            elif w.pos[0] == "place":
-                _w.place(x=w.pos[1], y=w.pos[2])
-            elif w.pos[0] == "grid":
-                _w.grid(row=w.pos[1], column=w.pos[2])
+    def cget(self, key):
+        if key in ("selectbackground", "selectforeground") and self._rows:
+            return self._colors[1][key == "selectforeground"]
+        return self._target(key).cget(key)
 
-        app.windows.append(self)
+    def _target(self, key: str):
+        if key in self._frameOptions or key in ("background", "bg") or not self._rows:
+            return super()
+        return self._rows[0]
 
-        self.run()
+    def set_items(self, items, count: int = None):
+        if callable(items) and count is None:
+            raise ValueError("A row provider needs a row count")
+        self._items = items
+        self._count = len(items) if count is None else int(count)
+        self._first = max(0, min(self._first, self._count - len(self._rows)))
+        if self.selection is not None and self.selection >= self._count:
+            self.selection = None
+        self._shown = [None] * len(self._rows)
+        self._render()
 
-        for s in load:
-            self.run(s)
+    def _item(self, index):
+        return self._items(index) if callable(self._items) else self._items[index]
 
-    @property
-    def title(self):
-        return self._title
+    def get_value(self):
+        if self.selection is not None:
+            return self._item(self.selection)
 
-    @title.setter
-    def title(self, title):
-        self._title = self.lang.get(title)
-        self._window.title(self._title)
+    def select(self, index):
+        if index >= self._count:
+            return
+        self.selection = index
+        self._render()
+        self.event_generate("<<Select>>")
 
-    @property
-    def size(self):
-        return self._size
+    def see(self, index):
+        if index < self._first:
+            self._first = index
+        elif index >= self._first + len(self._rows):
+            self._first = index - len(self._rows) + 1
+        self._render()
 
-    @size.setter
-    def size(self, size):
-        self._size = size
-        self._window.geometry(f"{self._size[0]}x{self._size[1]}")
+    def yview(self, *args):
+        last = max(0, self._count - len(self._rows))
+        if args[0] == "moveto":
+            self._first = int(float(args[1]) * self._count)
+        elif args[0] == "scroll":
+            self._first += int(args[1]) * (len(self._rows) if args[2] == "pages" else 1)
+        self._first = max(0, min(self._first, last))
+        self._render()
 
-    @property
-    def pos(self):
-        return self._pos
+    def _render(self):
+        for i, row in enumerate(self._rows):
+            index = self._first + i
+            shown = (str(self._item(index)) if index < self._count else "", index == self.selection)
+            if self._shown[i] != shown:
+                self._shown[i] = shown
+                bg, fg = self._colors[shown[1]]
+                row.config(text=shown[0], bg=bg, fg=fg)
+        if self._count:
+            self._scrollbar.set(self._first / self._count, min(1, (self._first + len(self._rows)) / self._count))
+        else:
+            self._scrollbar.set(0, 1)
 
-    @pos.setter
-    def pos(self, pos):
-        if pos == "auto":
-            pos = None
-        self._pos = pos
-        if self.pos:
-            if self._pos != "center":
-                self._window.geometry(
-                    f"{self._size[0]}x{self._size[1]}" + (f"+{self._pos[0]}+{self._pos[1]}" if self._pos else ""))
-            else:
-                self._window.geometry(
-                    f"{self._size[0]}x{self._size[1]}+{int(self._window.winfo_screenwidth() / 2 - self._size[0] / 2)}+{int((self._window.winfo_screenheight() - 20) / 2 - (self._size[1] + 10) / 2)}")
 
-    @property
-    def icon(self):
-        return self._iconPath
+_columnTypes = {"int": "q", "float": "d"}
+_columnDefaults = {"int": 0, "float": 0.0}
+_filterOps = {"==": operator.eq, "!=": operator.ne, "<": operator.lt, "<=": operator.le, ">": operator.gt,
+              ">=": operator.ge, "in": lambda v, values: v in values, "contains": lambda v, part: part in v}
 
-    @icon.setter
-    def icon(self, iconPath):
-        if iconPath:
-            iconPath = self.lang.get(iconPath)
-        self._iconPath = (
-            (self.app.path + "/" + iconPath) if not iconPath.startswith("c:/") and not iconPath.startswith(
-                "/") else iconPath) if iconPath else self.app.path + "/icon.ico"
-        try:
-            self._window.iconbitmap(self._iconPath)
-        except tk._tkinter.TclError:
-            self._iconPath = os.path.join(sys.path[0], "./defaultIcon.ico")
-            self._window.iconbitmap(self._iconPath)
 
-    def set_lang(self, lang: _Lang = None, callback=None):
-        self.interface = interface = _Interface(self.app, self.interface.path, lang)
+def _convert(kind: str, value):
+    if kind == "int":
+        return int(value)
+    if kind == "float":
+        return float(value)
+    return "" if value is None else str(value)
 
-        self.lang = interface.lang
-        self._title = interface.title
-        self._iconPath = ((self.app.path + "/" + interface.icon) if not interface.icon.startswith(
-            "c:/") and not interface.icon.startswith(
-            "/") else interface.icon) if interface.icon else self.app.path + "/icon.ico"
 
-        self._window.title(self._title)
-        try:
-            self._window.iconbitmap(self._iconPath)
-        except tk._tkinter.TclError:
-            self._iconPath = os.path.join(sys.path[0], "./defaultIcon.ico")
-            self._window.iconbitmap(self._iconPath)
+class _ColumnStore:
+    # one array per column, a row keeps its id for good: deleting a row only flags it
+    def __init__(self, columns):
+        self.columns = columns
+        self.clear()
 
-        self.widgets = []
-        for mw in interface.widgets:
-            self.widgets.append(_Widget(self, mw))
+    def clear(self):
+        self.data = {name: array.array(_columnTypes[kind]) if kind in _columnTypes else [] for name, kind in self.columns}
+        self.alive = bytearray()
+        self.count = 0
+        # column -> ids sorted by (value, id), built on the first sort and then kept up to date
+        self._indexes = {}
 
-        for _w in self._widgets:
-            _w.destroy()
+    def __len__(self):
+        return len(self.alive)
 
-        self._widgets = []
-        for w in self.widgets:
-            try:
-                if w.type == "text":
-                    self._widgets.append(_TextWidget(self._window, **w.args))
-                else:
-                    self._widgets.append(tk.Widget(self._window, w.type, kw=w.args))
-            except tk._tkinter.TclError as e:
-                if e.args[0].startswith("invalid command name"):
-                    raise InvalidWidgetError(f"Invalid widget with id {w.id}, type '{w.type}' not found")
-                else:
-                    raise InvalidWidgetError(f"Invalid widget with id {w.id}, " + e.args[0].replace('"', "'"))
-            _w = self._widgets[-1]
-            for b in w.binds:
-                if type(b) == str:
-                    b = b.split(" ")
-                try:
-                    self._widgets[-1].bind("<" + b[0] + ">", lambda e, w=w: self.cmd(b[1], w))
-                except tk._tkinter.TclError:
-                    raise InvalidEventError(f"Invalid event '{b[0]}'")
-        for w, _w in zip(self.widgets, self._widgets):
-            if w.pos[0] == "pack":
-                _w.pack(side=w.pos[1])
-            elif w.pos[0] == "place":
-                _w.place(x=w.pos[1], y=w.pos[2])
-            elif w.pos[0] == "grid":
-                _w.grid(row=w.pos[1], column=w.pos[2])
-        if callback: callback()
+    def _array(self, numpy, name: str):
+        col = self.data[name]
+        return numpy.frombuffer(col, numpy.int64 if col.typecode == "q" else numpy.float64) if len(col) else \
+            numpy.zeros(0)
 
-    def run(self, script: str = ...):
-        if script == Ellipsis:
-            self.app.get_script()(self)
-        else:
-            self.app.get_script(script)(self)
+    def set_columns(self, columns: dict):
+        # whole columns at once, NumPy arrays are copied without a python loop
+        self.clear()
+        numpy = _numpy()
+        size = None
+        for name, kind in self.columns:
+            values = columns.get(name, ())
+            col = self.data[name]
+            if kind in _columnTypes and numpy is not None and isinstance(values, numpy.ndarray):
+                col.frombytes(values.astype(numpy.int64 if kind == "int" else numpy.float64).tobytes())
+            else:
+                col.extend(_convert(kind, v) for v in values)
+            size = len(col) if size is None else min(size, len(col))
+        size = size or 0
+        for name, _ in self.columns:
+            del self.data[name][size:]
+        self.alive = bytearray(b"\x01") * size
+        self.count = size
 
-    def cmd(self, command: str, widget: _Widget):
-        self.app.get_command(command)(self, widget)
+    def append(self, rows):
+        start = len(self.alive)
+        for row in rows:
+            if isinstance(row, dict):
+                row = [row.get(name, _columnDefaults.get(kind, "")) for name, kind in self.columns]
+            for (name, kind), value in zip(self.columns, row):
+                self.data[name].append(_convert(kind, value))
+            self.alive.append(1)
+        ids = range(start, len(self.alive))
+        self.count += len(ids)
+        for name, index in list(self._indexes.items()):
+            if len(ids) > len(index) // 8:
+                # sorting again on the next use is cheaper than that many insertions
+                del self._indexes[name]
+            else:
+                for i in ids:
+                    index.insert(self._position(name, index, self.data[name][i], i), i)
+        return list(ids)
+
+    def update(self, id: int, values: dict):
+        kinds = dict(self.columns)
+        for name, value in values.items():
+            value = _convert(kinds[name], value)
+            col = self.data[name]
+            index = self._indexes.get(name)
+            if index is not None:
+                del index[self._position(name, index, col[id], id)]
+            col[id] = value
+            if index is not None:
+                index.insert(self._position(name, index, value, id), id)
+
+    def delete(self, ids):
+        for i in ids:
+            if self.alive[i]:
+                self.alive[i] = 0
+                self.count -= 1
+
+    def row(self, id: int):
+        return {name: self.data[name][id] for name, _ in self.columns}
+
+    def _position(self, name: str, index, value, id: int):
+        col = self.data[name]
+        lo, hi = 0, len(index)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            other = index[mid]
+            if (col[other], other) < (value, id):
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def index(self, name: str):
+        index = self._indexes.get(name)
+        if index is None:
+            col = self.data[name]
+            numpy = _numpy()
+            if numpy is not None and type(col) == array.array:
+                index = array.array("q", numpy.argsort(self._array(numpy, name), kind="stable").astype(numpy.int64).tobytes())
+            else:
+                index = array.array("q", sorted(range(len(col)), key=col.__getitem__))
+            self._indexes[name] = index
+        return index
+
+    def mask(self, conditions):
+        # (column, operator, value) or (column, function) conditions, whole columns at a time
+        numpy = _numpy()
+        keep = numpy.frombuffer(self.alive, numpy.uint8).astype(bool) if numpy is not None and self.alive else \
+            bytearray(self.alive)
+        for condition in conditions:
+            name = condition[0]
+            test = condition[1] if callable(condition[1]) else _filterOps[condition[1]]
+            value = condition[2] if len(condition) > 2 else None
+            col = self.data[name]
+            if type(keep) == bytearray:
+                if len(condition) > 2:
+                    keep = bytearray(k and test(v, value) for k, v in zip(keep, col))
+                else:
+                    keep = bytearray(k and bool(test(v)) for k, v in zip(keep, col))
+            elif type(col) == array.array and not callable(condition[1]) and condition[1] not in ["in", "contains"]:
+                keep &= test(self._array(numpy, name), value)
+            elif type(col) == array.array and condition[1] == "in":
+                keep &= numpy.isin(self._array(numpy, name), list(value))
+            elif len(condition) > 2:
+                keep &= numpy.fromiter((test(v, value) for v in col), bool, len(col))
+            else:
+                keep &= numpy.fromiter((bool(test(v)) for v in col), bool, len(col))
+        return keep
+
+    def view(self, column: str = None, reverse: bool = False, conditions=()):
+        # ids of the rows to show, in order
+        if not conditions and self.count == len(self.alive):
+            # nothing to filter out: the sort index is the view
+            ids = array.array("q", range(len(self.alive))) if column is None else array.array("q", self.index(column))
+            return ids[::-1] if reverse else ids
+        keep = self.mask(conditions)
+        if type(keep) == bytearray:
+            if column is None:
+                ids = array.array("q", compress(range(len(keep)), keep))
+            else:
+                index = self.index(column)
+                ids = array.array("q", compress(index, map(keep.__getitem__, index)))
+        else:
+            numpy = _numpy()
+            if column is None:
+                ids = numpy.flatnonzero(keep)
+            else:
+                index = self.index(column)
+                order = numpy.frombuffer(index, numpy.int64) if len(index) else numpy.zeros(0, numpy.int64)
+                ids = order[keep[order]]
+                del order
+        return ids[::-1] if reverse else ids
+
+
+class _Table(tk.Frame):
+    def __init__(self, parent, columns=(), rows=10, font="TkFixedFont", **kwargs):
+        frameArgs = {k: kwargs.pop(k) for k in ["width", "height", "relief", "borderwidth", "bd"] if k in kwargs}
+        kwargs.pop("text", None)
+        tk.Frame.__init__(self, parent, **frameArgs)
+
+        # columns are "name" or {name, type (str, int, float), width, title}
+        self._columns = []
+        for c in columns:
+            if type(c) != dict:
+                c = {"name": c}
+            self._columns.append((str(c["name"]), c.get("type", "str"), int(c.get("width", 12)),
+                                  str(c.get("title", c["name"]))))
+        header = tk.Frame(self)
+        header.pack(side="top", fill="x")
+        for name, _, width, title in self._columns:
+            label = tk.Label(header, text=title, width=width + 1, anchor="w", font=font, padx=0, relief="raised")
+            label.pack(side="left")
+            label.bind("<Button-1>", lambda _, name=name: self.sort(name, self._sort == (name, False)))
+        self._body = _VirtualList(self, rows=rows, font=font, **kwargs)
+        self._body.pack(side="top", fill="both", expand=True)
+
+        self.store = _ColumnStore([(name, kind) for name, kind, _, _ in self._columns])
+        self._sort = (None, False)
+        self._conditions = ()
+        self._view = ()
+        self.refresh()
+
+    def bind(self, sequence=None, func=None, add=None):
+        return self._body.bind(sequence, func, add)
+
+    def _format(self, position: int):
+        id = self._view[position]
+        return " ".join(str(self.store.data[name][id])[:width].ljust(width) for name, _, width, _ in self._columns)
+
+    def refresh(self):
+        # only the visible rows are formatted and sent to Tk, by the virtual list
+        selected = self.selection
+        self._view = self.store.view(self._sort[0], self._sort[1], self._conditions)
+        self._body.selection = None
+        if selected is not None:
+            numpy = _numpy()
+            if numpy is not None and isinstance(self._view, numpy.ndarray):
+                found = numpy.flatnonzero(self._view == selected)
+                self._body.selection = int(found[0]) if len(found) else None
+            elif selected in self._view:
+                self._body.selection = self._view.index(selected)
+        self._body.set_items(self._format, len(self._view))
+
+    @property
+    def selection(self):
+        if self._body.selection is not None and self._body.selection < len(self._view):
+            return int(self._view[self._body.selection])
+
+    def get_value(self):
+        if self.selection is not None:
+            return self.store.row(self.selection)
+
+    def set_rows(self, rows):
+        if isinstance(rows, dict):
+            self.store.set_columns(rows)
+        else:
+            self.store.clear()
+            self.store.append(rows)
+        self.refresh()
+
+    def append_rows(self, rows):
+        ids = self.store.append(rows)
+        self.refresh()
+        return ids
+
+    def update_row(self, id: int, **values):
+        self.store.update(id, values)
+        self.refresh()
+
+    def delete_rows(self, *ids):
+        self.store.delete(ids)
+        self.refresh()
+
+    def sort(self, column: str = None, reverse: bool = False):
+        self._sort = (column, bool(reverse))
+        self.refresh()
+
+    def filter(self, *conditions):
+        self._conditions = conditions
+        self.refresh()
+
+    def clear(self):
+        self.store.clear()
+        self.refresh()
+
+    def reset(self):
+        # an empty table again, unsorted, unfiltered and without selection
+        self.store.clear()
+        self._sort = (None, False)
+        self._conditions = ()
+        self._body.selection = None
+        self.refresh()
+
+
+_canvasProcs = '''
+    proc pyWin_canvas_draw {canvas kind ids coordsList createOptions configOptions} {
+        # moves the given items, creates the missing ones and deletes the extra ones
+        set result {}
+        set i 0
+        set count [llength $ids]
+        foreach coords $coordsList {
+            if {$i < $count} {
+                set id [lindex $ids $i]
+                $canvas coords $id {*}$coords
+                if {[llength $configOptions]} {$canvas itemconfigure $id {*}$configOptions}
+            } else {
+                set id [$canvas create $kind {*}$coords {*}$createOptions]
+            }
+            lappend result $id
+            incr i
+        }
+        if {$i < $count} {$canvas delete {*}[lrange $ids $i end]}
+        return $result
+    }
+'''
+_canvasStrides = {"text": 2, "image": 2, "window": 2, "bitmap": 2}
+
+
+def _is_number(value):
+    return isinstance(value, (int, float)) or hasattr(value, "dtype")
+
+
+def _coords_list(items, stride: int):
+    # list of tuples, array.array or NumPy array -> one coordinate tuple per item
+    if hasattr(items, "tolist"):
+        items = items.tolist()
+    items = list(items)
+    if items and _is_number(items[0]):
+        return tuple(tuple(items[i:i + stride]) for i in range(0, len(items), stride))
+    return tuple(tuple(c) for c in items)
+
+
+def _decimate(xs, ys, width: int):
+    # keeps the lowest and the highest point of every pixel column, spikes stay visible
+    numpy = sys.modules.get("numpy")
+    if numpy is not None and isinstance(xs, numpy.ndarray):
+        span = float(xs[-1] - xs[0]) or 1.0
+        columns = ((xs - xs[0]) * (width / span)).astype(numpy.int64)
+        starts = numpy.flatnonzero(numpy.r_[True, columns[1:] != columns[:-1]])
+        ends = numpy.r_[starts[1:], len(xs)]
+        order = numpy.lexsort((ys, columns))
+        keep = numpy.unique(numpy.concatenate((order[starts], order[ends - 1])))
+        return xs[keep], ys[keep]
+    span = (xs[-1] - xs[0]) or 1
+    scale = width / span
+    outX, outY = [], []
+    column = None
+    low = high = None
+    for i in range(len(xs)):
+        c = int((xs[i] - xs[0]) * scale)
+        if c != column:
+            if column is not None:
+                for j in sorted({low, high}):
+                    outX.append(xs[j])
+                    outY.append(ys[j])
+            column, low, high = c, i, i
+        elif ys[i] < ys[low]:
+            low = i
+        elif ys[i] > ys[high]:
+            high = i
+    if column is not None:
+        for j in sorted({low, high}):
+            outX.append(xs[j])
+            outY.append(ys[j])
+    return outX, outY
+
+
+class _Canvas(tk.Canvas):
+    def __init__(self, parent, **kwargs):
+        tk.Canvas.__init__(self, parent, **kwargs)
+        if not self.tk.call("info", "procs", "pyWin_canvas_draw"):
+            self.tk.eval(_canvasProcs)
+        # group name -> (kind, item ids, options)
+        self._groups = {}
+
+    def draw(self, kind: str, items, group: str = None, **options):
+        # a single Tcl call for the whole set of items, a group reuses the items it drew last time
+        coords = _coords_list(items, _canvasStrides.get(kind, 4))
+        createOptions = self._options(options)
+        old = self._groups.get(group) if group is not None else None
+        if old is not None and old[0] != kind:
+            self.delete(*old[1])
+            old = None
+        ids = old[1] if old else ()
+        configOptions = createOptions if old and old[2] != createOptions else ()
+        result = self.tk.splitlist(self.tk.call("pyWin_canvas_draw", self._w, kind, ids, coords,
+                                                createOptions, configOptions))
+        if group is not None:
+            self._groups[group] = (kind, result, createOptions)
+        return list(result)
+
+    def plot(self, group: str, ys, xs=None, decimate: bool = True, **options):
+        # one line item per series, decimated to the canvas width
+        numpy = sys.modules.get("numpy")
+        if numpy is not None and isinstance(ys, numpy.ndarray):
+            if xs is None and ys.ndim == 2:
+                xs, ys = ys[:, 0], ys[:, 1]
+            xs = numpy.arange(len(ys)) if xs is None else numpy.asarray(xs)
+        else:
+            ys = ys.tolist() if hasattr(ys, "tolist") else list(ys)
+            if xs is None and ys and not _is_number(ys[0]):
+                xs, ys = [p[0] for p in ys], [p[1] for p in ys]
+            xs = range(len(ys)) if xs is None else (xs.tolist() if hasattr(xs, "tolist") else list(xs))
+        width = self.winfo_width() if self.winfo_width() > 1 else self.winfo_pixels(self.cget("width"))
+        if decimate and len(ys) > 2 * width:
+            xs, ys = _decimate(xs, ys, width)
+        if len(ys) < 2:
+            self.clear(group)
+            return None
+        if numpy is not None and isinstance(ys, numpy.ndarray):
+            flat = numpy.column_stack((xs, ys)).ravel().tolist()
+        else:
+            flat = [v for point in zip(xs, ys) for v in point]
+        return self.draw("line", [flat], group, **options)[0]
+
+    def clear(self, group: str = None):
+        if group is None:
+            self.delete("all")
+            self._groups.clear()
+        elif group in self._groups:
+            self.delete(*self._groups.pop(group)[1])
+
+
+def _parse_period(value: str):
+    # returns a period in milliseconds from "150ms", "0.5s", "30hz" or "150"
+    value = value.strip().lower()
+    try:
+        if value.endswith("ms"):
+            return float(value[:-2])
+        if value.endswith("hz"):
+            return 1000 / float(value[:-2])
+        if value.endswith("s"):
+            return float(value[:-1]) * 1000
+        return float(value)
+    except (ValueError, ZeroDivisionError):
+        raise InvalidEventError(f"Invalid period '{value}'")
+
+
+class _RateLimiter:
+    # one pending timer per binding at most, whatever the number of events
+    def __init__(self, widget, handler, modifier: str):
+        mode, _, period = modifier.partition("=")
+        if mode not in ["debounce", "throttle", "coalesce", "idle"]:
+            raise InvalidEventError(f"Invalid event modifier '{modifier}'")
+        if mode in ["debounce", "throttle"] and not period:
+            raise InvalidEventError(f"Invalid event modifier '{modifier}', missing period")
+        self.widget = widget
+        self.handler = handler
+        self.mode = mode
+        self.period = _parse_period(period) / 1000 if period else 0
+        self._event = None
+        self._timer = None
+        self._deadline = 0
+        self._last = 0
+
+    def __call__(self, event):
+        self._event = event
+        now = time.perf_counter()
+        if self.mode == "debounce":
+            self._deadline = now + self.period
+            if self._timer is None:
+                self._timer = self.widget.after(int(self.period * 1000), self._fire)
+        elif self.mode == "throttle":
+            if self._timer is None:
+                if now - self._last >= self.period:
+                    self._last = now
+                    self._call()
+                else:
+                    self._timer = self.widget.after(int((self._last + self.period - now) * 1000), self._fire)
+        elif self._timer is None:
+            self._timer = self.widget.after(0, self._fire) if self.mode == "coalesce" else \
+                self.widget.after_idle(self._fire)
+
+    def _fire(self):
+        self._timer = None
+        now = time.perf_counter()
+        if self.mode == "debounce" and now < self._deadline:
+            self._timer = self.widget.after(max(1, int((self._deadline - now) * 1000)), self._fire)
+            return
+        self._last = now
+        self._call()
+
+    def _call(self):
+        event, self._event = self._event, None
+        try:
+            if not self.widget.winfo_exists():
+                return
+        except tk._tkinter.TclError:
+            return
+        self.handler(event)
+
+
+class _LazyWidget:
+    _recorded = ["set", "set_value", "set_items", "insert", "append", "extend", "back", "clear", "disable", "enable",
+                 "focus"]
+
+    def __init__(self, window, tag: str):
+        self.window = window
+        self.tag = tag
+        self._calls = []
+
+    @property
+    def built(self):
+        return self.tag in self.window._tags
+
+    def __getattr__(self, name):
+        if self.tag in self.window._tags:
+            return getattr(self.window._tags[self.tag], name)
+        if name in _LazyWidget._recorded:
+            return lambda *args, **kwargs: self._calls.append((name, args, kwargs))
+        return getattr(self.window._materialize(self.tag), name)
+
+    def _replay(self, widget):
+        calls, self._calls = self._calls, []
+        for name, args, kwargs in calls:
+            getattr(widget, name)(*args, **kwargs)
+
+
+class _Repeat:
+    # rows of a "repeat:" container, a row is only touched again when its rendered options change
+    def __init__(self, window, container):
+        self.window = window
+        self.container = container
+        self.key = container.meta.repeat["key"]
+        self.chunk = container.meta.repeat["chunk"]
+        self.rows = {}
+        self.timer = None
+        self._items = None
+        self._seen = None
+        self._callback = None
+        self.compile()
+
+    def compile(self):
+        # translated options and "{field}" templates, per template widget, rendered for each item
+        window = self.window
+        self.templates = []
+        for meta in self.container.meta.repeat["widgets"]:
+            dynamic = {}
+            for k, v in meta.raw.items():
+                if k in _structuralKeys and k != "pos":
+                    continue
+                value = _compile_text(window.lang.get(v, **window.langVars))
+                if type(value) == _Template or k in meta.translated:
+                    dynamic[k] = value
+            self.templates.append((meta, dynamic))
+
+    def _render_row(self, values: dict):
+        return [{k: v.render(values) if type(v) == _Template else v for k, v in dynamic.items()}
+                for _, dynamic in self.templates]
+
+    def render(self, items, chunk: int = None, callback=None):
+        self.cancel()
+        if self._seen:
+            # the rows of an interrupted render are kept or deleted by this one like the others
+            self.rows.update(self._seen)
+        self._items = enumerate(iter(items))
+        self._seen = {}
+        self._callback = callback
+        if chunk:
+            self.chunk = int(chunk)
+        self.step()
+
+    def refresh(self):
+        # the language or its variables changed: render every row again with its last values
+        self.compile()
+        for rows in [self.rows, self._seen or {}]:
+            for key, row in rows.items():
+                rows[key] = self._update(*row)
+
+    def cancel(self):
+        if self.timer is not None:
+            self.window._window.after_cancel(self.timer)
+            self.timer = None
+
+    def clear(self):
+        self.cancel()
+        window = self.window
+        for rows in [self.rows, self._seen or {}]:
+            for _, _, widgets in rows.values():
+                for w in widgets:
+                    if w.id in window._ids:
+                        window._delete_widget(w)
+        self.rows = {}
+        self._items = self._seen = self._callback = None
+
+    def step(self):
+        self.timer = None
+        window = self.window
+        done = True
+        with window.batch():
+            for index, item in self._items:
+                values = {"index": index, "item": item}
+                if isinstance(item, dict):
+                    values.update(item)
+                if self.key is None:
+                    key = index
+                elif isinstance(item, dict):
+                    key = item.get(self.key)
+                else:
+                    key = getattr(item, self.key, None)
+                if key in self._seen:
+                    key = (key, index)
+                row = self.rows.get(key)
+                self._seen[key] = self._update(values, *row[1:]) if row else self._create(values)
+                if len(self._seen) % self.chunk == 0:
+                    done = False
+                    break
+        if not done:
+            # the rest of the source is rendered on the next ticks, the UI stays responsive meanwhile
+            self.timer = window._window.after(0, self.step)
+            return
+        self._finish()
+
+    def _create(self, values: dict):
+        window = self.window
+        rendered = self._render_row(values)
+        widgets = []
+        for (meta, _), options in zip(self.templates, rendered):
+            w = window._add_widget(_Widget(window, meta, self.container))
+            config = {}
+            text = None
+            for k, value in options.items():
+                if k == "pos":
+                    w.pos = _parse_pos(value, w.id)
+                elif k == "text" and w.type in _stringVarTypes:
+                    text = value
+                elif k == "image":
+                    w._image = value or None
+                elif k == "disabled":
+                    config["state"] = "disabled" if value else "normal"
+                elif k == "from" and w.type == "scale":
+                    config["from_"] = value
+                else:
+                    config[k] = value
+            if config:
+                w._own_args().update(config)
+            window._build_widget(w, text)
+            window._pendingPlace.append(w)
+            widgets.append(w)
+        return values, rendered, widgets
+
+    def _update(self, values: dict, rendered: list, widgets: list):
+        window = self.window
+        if any(w.id not in window._ids for w in widgets):
+            for w in widgets:
+                if w.id in window._ids:
+                    window._delete_widget(w)
+            return self._create(values)
+        new = self._render_row(values)
+        if new == rendered:
+            return values, rendered, widgets
+        for w, old, options in zip(widgets, rendered, new):
+            config = {}
+            for k, value in options.items():
+                if old.get(k) == value:
+                    continue
+                if k == "pos":
+                    w.pos = _parse_pos(value, w.id)
+                    if w._widget.winfo_manager():
+                        getattr(w._widget, w._widget.winfo_manager() + "_forget")()
+                    window._pendingPlace.append(w)
+                elif k == "text" and w.type in _textTypes:
+                    w.set_value(value)
+                elif k == "image":
+                    w._set_image(value)
+                elif k == "disabled":
+                    config["state"] = "disabled" if value else "normal"
+                elif k == "from" and w.type == "scale":
+                    config["from_"] = value
+                else:
+                    config[k] = value
+            if config:
+                w._own_args().update(config)
+                window._configure(w, config)
+        return values, new, widgets
+
+    def _finish(self):
+        window = self.window
+        old, self.rows, self._seen = self.rows, self._seen, None
+        self._items = None
+        with window.batch():
+            for key, (_, _, widgets) in old.items():
+                if key not in self.rows:
+                    for w in widgets:
+                        if w.id in window._ids:
+                            window._delete_widget(w)
+        # kept rows stay where they were packed, new ones were packed after them
+        placed = [key for key in old if key in self.rows] + [key for key in self.rows if key not in old]
+        if placed != list(self.rows):
+            # rows moved: packed widgets are packed again in the new order
+            packed = [w for _, _, widgets in self.rows.values() for w in widgets if w.pos[0] == "pack"]
+            for w in packed:
+                w._widget.pack_forget()
+            for w in packed:
+                window._place_widget(w)
+        callback, self._callback = self._callback, None
+        if callback:
+            callback()
+
+
+def _notebook(parent, **kwargs):
+    from tkinter import ttk
+    return ttk.Notebook(parent, **kwargs)
+
+
+_customWidgets = {"text": _TextWidget, "virtuallist": _VirtualList, "notebook": _notebook, "canvas": _Canvas, "table": _Table}
+
+
+class _Template:
+    __slots__ = ["text", "fields"]
+
+    def __init__(self, text: str, fields: frozenset):
+        self.text = text
+        self.fields = fields
+
+    def render(self, values: dict, rule=None):
+        if self.fields.issubset(values):
+            return self.text.format_map(values)
+        # a missing variable stays as written, with its attribute, index, conversion or format spec:
+        # "{user.name}", "{count:d}"
+        out = []
+        for literal, field, formatSpec, conversion in string.Formatter().parse(self.text):
+            out.append(literal)
+            if field is None:
+                continue
+            raw = "{" + field + ("!" + conversion if conversion else "") + (":" + formatSpec if formatSpec else "")
+            raw += "}"
+            out.append(raw.format_map(values) if field.split(".")[0].split("[")[0] in values else raw)
+        return "".join(out)
+
+
+class _Plural:
+    __slots__ = ["forms", "fields"]
+
+    def __init__(self, forms: dict):
+        self.forms = {k: _compile_text(v) for k, v in forms.items()}
+        self.fields = frozenset({"count"}).union(*(f.fields for f in self.forms.values() if type(f) == _Template))
+
+    def render(self, values: dict, rule):
+        n = values.get("count", 0)
+        form = self.forms["zero"] if n == 0 and "zero" in self.forms else self.forms.get(rule(n), self.forms["other"])
+        return form.render(values) if type(form) == _Template else form
+
+
+_pluralCategories = {"zero", "one", "two", "few", "many", "other"}
+_pluralRules = {
+    "fr": lambda n: "one" if 0 <= n < 2 else "other",
+    "pt": lambda n: "one" if 0 <= n < 2 else "other",
+    "ja": lambda n: "other",
+    "ko": lambda n: "other",
+    "zh": lambda n: "other",
+}
+_missing = object()
+
+
+def _compile_text(value):
+    if type(value) != str or ("{" not in value and "}" not in value):
+        return value
+    try:
+        fields = frozenset(f.split(".")[0].split("[")[0] for _, f, _, _ in string.Formatter().parse(value) if f)
+    except ValueError:
+        return value
+    # "{}", "{0}" and "{{" alone are not templates, the text is shown as written
+    return _Template(value, fields) if any(not f.isdigit() for f in fields) else value
+
+
+def _is_plural(value):
+    return type(value) == dict and "other" in value and set(value) <= _pluralCategories
+
+
+def _flatten(data: dict, prefix: str, table: dict):
+    for k, v in data.items():
+        key = prefix + str(k)
+        table[key] = v
+        if type(v) == dict and not _is_plural(v):
+            _flatten(v, key + ".", table)
+
+
+class _Lang:
+    def __init__(self, path: (str, None), cache: _YamlCache = None, fallback=None):
+        self._name = os.path.basename(path)[:-5] if path else None
+        self._path = path
+        self._requested = self._name
+        self._fallback = fallback
+        self._table = {}
+        if path:
+            _flatten((cache or _yamlCache).load(path), "", self._table)
+        self._entries = {k: _Plural(v) if _is_plural(v) else _compile_text(v) for k, v in self._table.items()}
+        self._memo = {}
+        self._rule = _pluralRules.get((self._name or "").split("-")[0].lower(), lambda n: "one" if n == 1 else "other")
+
+    def _entry(self, key: str):
+        # resolved through the fallback chain once, then memoized
+        try:
+            return self._memo[key]
+        except KeyError:
+            pass
+        entry = _missing
+        lang = self
+        while lang is not None:
+            if key in lang._entries:
+                entry = lang._entries[key]
+                break
+            lang = lang._fallback
+        self._memo[key] = entry
+        return entry
+
+    def get(self, name, **values):
+        if not _is_lang_key(name):
+            return name
+        entry = self._entry(name[1:-1])
+        if entry is _missing:
+            return name
+        if type(entry) in [_Template, _Plural]:
+            return entry.render(values, self._rule)
+        return entry
+
+    def _paths(self):
+        lang = self
+        while lang is not None:
+            if lang._path:
+                yield lang._path
+            lang = lang._fallback
+
+    def format(self, key: str, **values):
+        return self.get("$" + key + "$", **values)
+
+    def fields(self, name):
+        if _is_lang_key(name):
+            entry = self._entry(name[1:-1])
+            if type(entry) in [_Template, _Plural]:
+                return entry.fields
+        return frozenset()
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return self[name]
+
+    def __getitem__(self, name):
+        lang = self
+        while lang is not None:
+            if name in lang._table:
+                return lang._table[name]
+            lang = lang._fallback
+        return None
+
+
+class _Interface:
+    def __init__(self, app, path: str, lang: _Lang = None):
+        data = app.cache.load(path)
+        self.path = path
+        self.lang = lang or _Lang(None)
+        self.rawTitle = data.get("title", "PyWinApp")
+        self.title = self.lang.get(self.rawTitle)
+        self.icon = self.lang.get(data.get("icon", None))
+        self.events = data.get("events", [])
+        self.timers = data.get("timers", [])
+        size = data.get("size", "200, 200").split(",")
+        self.size = (int(size[0].strip()), int(size[1].strip()))
+        pos = data.get("pos")
+        if pos:
+            if pos == "center":
+                self.pos = "center"
+            elif pos == "auto":
+                self.pos = None
+            else:
+                pos = pos.split(",")
+                self.pos = (pos[0].strip(), pos[1].strip())
+        else:
+            self.pos = None
+        self.widgets = [_parse_widget(app, w, self.lang, i) for i, w in enumerate(data.get("widgets", []))]
+        # images are read while the rest of the app starts, the first window using them doesn't wait
+        images = [self.icon] if type(self.icon) == str and self.icon.lower().endswith(_imageExtensions) else []
+        _collect_images(self.widgets, images)
+        if images:
+            app.resources.prefetch(images)
+
+
+class _Window:
+    def __init__(self, app, interface: _Interface, hidden: bool = False):
+        self.app = app
+        self._isRoot = not app.windows
+        if len(app.windows) >= 1:
+            self._window = tk.Toplevel(app.windows[0]._window)
+        else:
+            self._window = app.backend.root()
+        self.interface = interface
+        self.lang = interface.lang
+        self.langVars = {}
+        self._rawTitle = interface.rawTitle
+        self._title = interface.title
+        self._iconPath = self._resolve_icon(interface.icon)
+        self._size = interface.size
+        self._pos = interface.pos
+
+        if hidden:
+            self._window.withdraw()
+
+        self._load = []
+        for b in interface.events:
+            if type(b) == str:
+                b = b.split(" ")
+            if b[0] == "load":
+                self._load = b[1:]
+                continue
+            self._bind(self._window, b, lambda script, e: self._dispatch("run", script, None, e))
+        self._timers = self._start_timers(interface)
+        if hidden:
+            app.scheduler.pause_window(self)
+
+        self._window.title(self._title)
+        self._set_icon()
+        self._set_geometry()
+
+        self._batchDepth = 0
+        self._pending = {}
+        self._pendingValues = {}
+        self._deadVars = []
+        self._pendingPlace = []
+
+        self._nextId = 0
+        self._ids = {}
+        self._tags = {}
+        self._types = {}
+        self._lazyTags = {}
+        self._proxies = {}
+        self._repeats = {}
+        widgets = [self._add_widget(_Widget(self, mw)) for mw in interface.widgets]
+        for w in widgets:
+            w.fromInterface = True
+            self._build_widget(w)
+        for w in widgets:
+            self._place_widget(w)
+
+        if hidden:
+            return
+
+        app.windows.append(self)
+        app.scheduler._arm()
+        if app._calls or app._updates:
+            app._start_pump()
+        if len(app.windows) == 1:
+            app._start_stats_timers()
+
+        if _startupProfile and not _startupProfile.done:
+            self._window.after_idle(_startupProfile.report)
+        if _sessionReplay and app._replay is None and len(app.windows) == 1:
+            self._window.after_idle(app.replay, *_sessionReplay, lambda report: _replay_done(app, report))
+
+        self.run()
+
+        for s in self._load:
+            self.run(s)
+
+    def _set_geometry(self):
+        if self._pos != "center":
+            self._window.geometry(
+                f"{self._size[0]}x{self._size[1]}" + (f"+{self._pos[0]}+{self._pos[1]}" if self._pos else ""))
+        else:
+            self._window.geometry(
+                f"{self._size[0]}x{self._size[1]}+{int(self._window.winfo_screenwidth() / 2 - self._size[0] / 2)}+{int((self._window.winfo_screenheight() - 20) / 2 - (self._size[1] + 10) / 2)}")
+
+    @property
+    def title(self):
+        return self._title
+
+    @title.setter
+    def title(self, title):
+        self._rawTitle = title
+        self._title = self.lang.get(title, **self.langVars)
+        self._window.title(self._title)
+
+    @property
+    def size(self):
+        return self._size
+
+    @size.setter
+    def size(self, size):
+        self._size = size
+        self._window.geometry(f"{self._size[0]}x{self._size[1]}")
+
+    @property
+    def pos(self):
+        return self._pos
+
+    @pos.setter
+    def pos(self, pos):
+        if pos == "auto":
+            pos = None
+        self._pos = pos
+        if self.pos:
+            if self._pos != "center":
+                self._window.geometry(
+                    f"{self._size[0]}x{self._size[1]}" + (f"+{self._pos[0]}+{self._pos[1]}" if self._pos else ""))
+            else:
+                self._window.geometry(
+                    f"{self._size[0]}x{self._size[1]}+{int(self._window.winfo_screenwidth() / 2 - self._size[0] / 2)}+{int((self._window.winfo_screenheight() - 20) / 2 - (self._size[1] + 10) / 2)}")
+
+    @property
+    def icon(self):
+        return self._iconPath
+
+    @icon.setter
+    def icon(self, iconPath):
+        if iconPath:
+            iconPath = self.lang.get(iconPath)
+        self._iconPath = self._resolve_icon(iconPath)
+        self._set_icon()
+
+    def _resolve_icon(self, iconPath):
+        return self.app.resources.resolve(iconPath or "icon.ico")
+
+    def _set_icon(self):
+        self._iconPath = self.app.resources.set_icon(self._window, self._iconPath)
+
+    def set_lang(self, lang: _Lang = None, callback=None):
+        old = self.lang
+        self.interface = interface = self.app._get_interface(self.interface.path, lang)
+        self.lang = interface.lang
+
+        title = self.lang.get(self._rawTitle, **self.langVars)
+        if title != self._title:
+            self._title = title
+            self._window.title(self._title)
+        iconPath = self._resolve_icon(interface.icon)
+        if iconPath != self._iconPath:
+            self._iconPath = iconPath
+            self._set_icon()
+
+        with self.batch():
+            for w in self._ids.values():
+                if w.meta.translated and not w._is_row():
+                    options = w._translate(old, self.langVars)
+                    if options:
+                        self._configure(w, options)
+            for repeat in self._repeats.values():
+                repeat.refresh()
+        if callback: callback()
+
+    def _start_timers(self, interface):
+        timers = []
+        for t in interface.timers:
+            # "every 250ms refresh": the script runs on the app scheduler while the window is shown
+            if type(t) == str:
+                t = t.split(" ")
+            if len(t) != 3 or t[0] != "every":
+                raise InvalidEventError(f"Invalid timer '{' '.join(map(str, t))}'")
+            timers.append(self.app.scheduler.every(t[1], str(t[2]), self,
+                                                   os.path.basename(interface.path)[:-5] + ":" + str(t[2])))
+        return timers
+
+    def _reload_interface(self):
+        # applies the edited interface file to the live window, only touching what changed
+        old = self.interface
+        self.interface = interface = self.app._get_interface(old.path, self.lang)
+        if interface.timers != old.timers:
+            # the timers added by the app itself with scheduler.every are kept
+            for timer in self._timers:
+                timer.cancel()
+            self._timers = self._start_timers(interface)
+            if not self.app.scheduler._running(self):
+                for timer in self._timers:
+                    timer.pause()
+        if interface.rawTitle != self._rawTitle and old.rawTitle == self._rawTitle:
+            self.title = interface.rawTitle
+        if interface.icon != old.icon:
+            self.icon = interface.icon
+        if interface.size != old.size:
+            self.size = interface.size
+        if interface.pos != old.pos:
+            self.pos = interface.pos
+
+        live = [w for w in self._ids.values() if w.fromInterface and w.parent is None]
+        liveTags = {w.tag: w for w in live if w.tag is not None}
+        liveUntagged = [w for w in live if w.tag is None]
+        matched = []
+        untagged = 0
+        for meta in interface.widgets:
+            tag = meta.raw.get("tag")
+            if tag is not None:
+                w = liveTags.pop(str(tag), None)
+            elif untagged < len(liveUntagged) and liveUntagged[untagged].type == meta.type:
+                w = liveUntagged[untagged]
+                untagged += 1
+            else:
+                w = None
+            matched.append((meta, w))
+        kept = {id(w) for _, w in matched if w is not None}
+
+        with self.batch():
+            for w in live:
+                if id(w) not in kept:
+                    self._delete_widget(w)
+            result = []
+            replace = []
+            for meta, w in matched:
+                if w is not None and meta.type == w.type:
+                    changed = {k for k in set(meta.raw) | set(w.meta.raw) if meta.raw.get(k, _missing) != w.meta.raw.get(k, _missing)}
+                    if not changed & {"children", "pages", "lazy", "repeat", "events", "action", "thread", "tag", "bind"} \
+                            and not any(k not in meta.raw for k in changed):
+                        if changed:
+                            if self._reconfigure(w, meta, changed):
+                                replace.append(w)
+                        w.meta = meta
+                        result.append(w)
+                        continue
+                    self._delete_widget(w)
+                w = self._add_widget(_Widget(self, meta))
+                w.fromInterface = True
+                self._build_widget(w)
+                replace.append(w)
+                result.append(w)
+
+        order = [w for w in live if id(w) in kept]
+        if [w for w in result if id(w) in kept] != order or any(w.pos[0] == "pack" for w in replace):
+            packed = [w for w in result if w.pos[0] == "pack"]
+            for w in packed:
+                w._widget.pack_forget()
+            for w in packed:
+                self._place_widget(w)
+        for w in replace:
+            if w.pos[0] != "pack":
+                self._place_widget(w)
+
+    def _reconfigure(self, w: _Widget, meta: _MetaWidget, changed: set):
+        # returns True if the widget has to be placed again
+        options = {}
+        moved = False
+        for k in changed:
+            value = self.lang.get(meta.raw[k], **self.langVars)
+            if k == "pos":
+                w.pos = _parse_pos(value, w.id)
+                if w._widget.winfo_manager():
+                    getattr(w._widget, w._widget.winfo_manager() + "_forget")()
+                moved = True
+            elif k == "title" and w.title is not None:
+                w.title = value
+                w.parent._widget.tab(w._widget, text=value)
+            elif k == "text" and w.type in _textTypes:
+                if w.get_value() == self.lang.get(w.meta.raw.get("text", ""), **self.langVars):
+                    w.set_value(value)
+            elif k == "image":
+                w._set_image(value)
+            elif k == "disabled":
+                options["state"] = "disabled" if value else "normal"
+            elif k == "from" and w.type == "scale":
+                options["from_"] = value
+            else:
+                options[k] = value
+        if options:
+            w._own_args().update(options)
+            self._configure(w, options)
+        return moved
+
+    def set_vars(self, **values):
+        # re-renders only the translated options whose template uses one of the changed values
+        oldValues = self.langVars.copy()
+        self.langVars.update(values)
+        names = frozenset(values)
+        if self.lang.fields(self._rawTitle) & names:
+            self._title = self.lang.get(self._rawTitle, **self.langVars)
+            self._window.title(self._title)
+        with self.batch():
+            for w in self._ids.values():
+                if w.meta.translated and not w._is_row():
+                    options = w._translate(self.lang, oldValues, names)
+                    if options:
+                        self._configure(w, options)
+            for repeat in self._repeats.values():
+                repeat.refresh()
+
+    def run(self, script: str = ...):
+        func = self.app.get_script() if script == Ellipsis else self.app.get_script(script)
+        stats = self.app._stats
+        if stats is None:
+            func(self)
+            return
+        start = time.perf_counter()
+        try:
+            func(self)
+        finally:
+            stats.record("scripts", "script" if script == Ellipsis else script, time.perf_counter() - start)
+
+    def cmd(self, command: str, widget: _Widget):
+        func = self.app.get_command(command)
+        stats = self.app._stats
+        start = time.perf_counter() if stats is not None else None
+        try:
+            if widget is not None and widget.thread and not getattr(func, "_background", False):
+                self.app.submit(func, self, widget)
+            else:
+                func(self, widget)
+        finally:
+            if stats is not None:
+                stats.record("commands", command, time.perf_counter() - start)
+
+    def fire(self, sequence: str, **fields):
+        self._window.event_generate(sequence if sequence.startswith("<") else "<" + sequence + ">", **fields)
+
+    def _dispatch(self, kind: str, name: str, widget: _Widget = None, event=None):
+        # every event, bind and action goes through here, so that App.record can log it
+        if self.app._recorder is not None:
+            self.app._recorder.record(self, kind, name, widget, event)
+        if kind == "run":
+            self.run(name)
+        else:
+            self.cmd(name, widget)
+
+    @property
+    def widgets(self):
+        return list(self._ids.values())
+
+    def _add_widget(self, w: _Widget):
+        self._ids[w.id] = w
+        self._types.setdefault(w.type, {})[w.id] = w
+        if w.tag is not None:
+            self._tags[w.tag] = w
+            self._lazyTags.pop(w.tag, None)
+        if w.parent:
+            w.parent.children.append(w)
+        if w.meta.children:
+            self._index_lazy(w, w.meta.children)
+        return w
+
+    def _index_lazy(self, container: _Widget, metas):
+        for mw in metas:
+            if mw.args.get("tag") is not None:
+                self._lazyTags[str(mw.args["tag"])] = container
+            if mw.children:
+                self._index_lazy(container, mw.children)
+
+    def _expand(self, container: _Widget):
+        # children of a container are only created the first time it is shown
+        if container._expanded or container.id not in self._ids:
+            return
+        container._expanded = True
+        widgets = [self._add_widget(_Widget(self, mw, container)) for mw in container.meta.children]
+        for w in widgets:
+            self._build_widget(w)
+        for w in widgets:
+            self._place_widget(w)
+        for w in widgets:
+            if w.tag in self._proxies:
+                self._proxies.pop(w.tag)._replay(w)
+
+    def _materialize(self, tag: str):
+        while tag not in self._tags and tag in self._lazyTags:
+            self._expand(self._lazyTags.pop(tag))
+        return self._tags[tag]
+
+    def _build_widget(self, w: _Widget, text=None):
+        parent = w.parent._widget if w.parent else self._window
+        spec = w._spec
+        extra = {}
+        if text is None:
+            text = spec.text
+        if w.type in _varTypes:
+            # a plain Tcl variable name, the python wrapper is only made when needed
+            extra["textvariable" if w.type in _stringVarTypes else "variable"] = w._var_name
+            if w._var is None and (text is not None or w.type == "checkbutton"):
+                parent.setvar(w._var_name, 0 if text is None else text)
+        if spec.action is not None and w.type in ["button", "scale"]:
+            extra["command"] = lambda *_: self._dispatch("cmd", spec.action, w)
+        if w._image:
+            extra["image"] = self.app.resources.acquire(w._image, self._window)
+        try:
+            if w.type in _customWidgets:
+                w._widget = _customWidgets[w.type](parent, **w.args, **extra)
+            else:
+                w._widget = tk.Widget(parent, w.type, cnf=extra, kw=w.args)
+        except tk._tkinter.TclError as e:
+            if w._image:
+                self.app.resources.release(w._image)
+            self._remove_widget(w)
+            if e.args[0].startswith("invalid command name"):
+                raise InvalidWidgetError(f"Invalid widget with id {w.id}, type '{w.type}' not found")
+            else:
+                raise InvalidWidgetError(
+                    f"Invalid widget with id {w.id}, " + e.args[0].replace('"', "'").replace("'-", "'"))
+        if self.app._recorder is not None:
+            self.app._recorder.watch(w)
+        for b in w.binds:
+            if type(b) == str:
+                b = b.split(" ")
+            self._bind(w._widget, b, lambda command, e, w=w: self._dispatch("cmd", command, w, e))
+        if w.bind is not None:
+            self.app.state.bind(w, w.bind)
+        if w.meta.children is not None:
+            if w.type == "notebook" or not w.meta.args.get("lazy", True):
+                self._expand(w)
+            else:
+                w._widget.bind("<Map>", lambda _, w=w: self._expand(w), "+")
+
+    @staticmethod
+    def _bind(target, b, callback):
+        # b is [event, handler name, modifiers...], e.g. "Motion on_move throttle=30hz"
+        if len(b) < 2:
+            raise InvalidEventError(f"Invalid event '{' '.join(map(str, b))}', no handler")
+        handler = lambda e, name=b[1]: callback(name, e)
+        for modifier in b[2:]:
+            handler = _RateLimiter(target, handler, str(modifier))
+        try:
+            target.bind("<" + b[0] + ">", handler)
+        except tk._tkinter.TclError:
+            raise InvalidEventError(f"Invalid event '{b[0]}'")
+
+    @staticmethod
+    def _place_widget(w: _Widget):
+        if w.parent and w.parent.type == "notebook":
+            w.parent._widget.add(w._widget, text=w.title)
+        elif w.pos[0] == "pack":
+            w._widget.pack(side=w.pos[1])
+        elif w.pos[0] == "place":
+            w._widget.place(x=w.pos[1], y=w.pos[2])
+        elif w.pos[0] == "grid":
+            w._widget.grid(row=w.pos[1], column=w.pos[2])
+
+    def _remove_widget(self, w: _Widget):
+        for child in w.children:
+            self._remove_widget(child)
+        if w._binding is not None:
+            self.app.state.unbind(w)
+        if w.type in _varTypes:
+            self._deadVars.append(w._var_name)
+        if w._image and w._widget is not None:
+            self.app.resources.release(w._image)
+        if w.meta.repeat is not None and w.id in self._repeats:
+            self._repeats.pop(w.id).cancel()
+        if w.meta.children and not w._expanded:
+            for tag in [tag for tag, container in self._lazyTags.items() if container is w]:
+                del self._lazyTags[tag]
+        del self._ids[w.id]
+        del self._types[w.type][w.id]
+        if w.tag is not None and self._tags.get(w.tag) is w:
+            del self._tags[w.tag]
+
+    def render(self, tag: str, items, chunk: int = None, callback=None):
+        container = self._materialize(tag)
+        if container.meta.repeat is None:
+            raise InvalidWidgetError(f"Invalid widget with id {container.id}, no 'repeat' block")
+        if container.id not in self._repeats:
+            self._repeats[container.id] = _Repeat(self, container)
+        self._repeats[container.id].render(items, chunk, callback)
+
+    def create_widget(self, type: str, **kwargs):
+        w = self._add_widget(_Widget(self, _MetaWidget(self.app, type, **kwargs)))
+        self._build_widget(w)
+        if self._batchDepth:
+            self._pendingPlace.append(w)
+        else:
+            self._place_widget(w)
+        return w
+
+    def _delete_widget(self, widget: _Widget):
+        self._remove_widget(widget)
+        if widget.parent and widget.parent.id in self._ids:
+            widget.parent.children.remove(widget)
+        widget._widget.destroy()
+        if self._deadVars:
+            # unset after the destroy, a living entry would create its variable again
+            names, self._deadVars = self._deadVars, []
+            self._window.tk.call("unset", "-nocomplain", *names)
+
+    def _configure(self, w: _Widget, options: dict):
+        if self._batchDepth:
+            self._pending.setdefault(w, {}).update(options)
+        else:
+            if self.app._stats is not None:
+                self.app._stats.count("configure")
+            w._widget.config(**options)
+
+    @contextmanager
+    def batch(self):
+        self._batchDepth += 1
+        try:
+            yield self
+        finally:
+            self._batchDepth -= 1
+            if not self._batchDepth:
+                self._flush()
+
+    def _flush(self):
+        pending, self._pending = self._pending, {}
+        values, self._pendingValues = self._pendingValues, {}
+        place, self._pendingPlace = self._pendingPlace, []
+
+        # one Tcl evaluation for every option change and one for every variable write
+        configs = []
+        for w, options in pending.items():
+            if w.id in self._ids:
+                if w.type == "virtuallist":
+                    # its options are split between the frame and the rows
+                    w._widget.configure(**options)
+                else:
+                    configs += [str(w._widget), w._widget._options(options)]
+        stats = self.app._stats
+        if configs:
+            if stats is not None:
+                stats.count("batch_configure")
+            self._window.tk.call("foreach", ("widget", "options"), tuple(configs), "$widget configure {*}$options")
+        sets = []
+        for w, value in values.items():
+            if w.id in self._ids:
+                sets += [w._var_name, value]
+        if sets:
+            if stats is not None:
+                stats.count("batch_set_value")
+            self._window.tk.call("foreach", ("name", "value"), tuple(sets), "set $name $value")
+        for w in place:
+            if w.id in self._ids:
+                self._place_widget(w)
+
+    def delete_many(self, *widgets):
+        for w in widgets:
+            if type(w) == int:
+                w = self.by_id(w)
+            elif type(w) != _Widget:
+                w = self[w]
+            if type(w) == _LazyWidget:
+                w = self._materialize(w.tag)
+            self._delete_widget(w)
+
+    def find(self, type: str = None, tag: str = None, **args):
+        if tag is not None:
+            found = [self._tags[tag]] if tag in self._tags else []
+        elif type is not None:
+            found = list(self._types.get(type.lower(), {}).values())
+        else:
+            found = self.widgets
+        if type is not None:
+            found = [w for w in found if w.type == type.lower()]
+        for k, v in args.items():
+            found = [w for w in found if w.args.get(k) == v]
+        return found
+
+    def open(self):
+        self._window.focus()
+        self._window.mainloop()
+
+    def open_async(self):
+        import asyncio
+        asyncio.set_event_loop(self.app.loop)
+        self.app._drive()
+        try:
+            self.open()
+        finally:
+            if not self.app.windows:
+                self.app._close_loop()
+
+    def close(self):
+        pool = self.app._pools.get(self.interface.path)
+        if pool is not None and not self._isRoot and len(pool.windows) < pool.size and self._recycle(pool):
+            return
+        self._destroy()
+
+    def _recycle(self, pool):
+        # back to what the interface describes, returns False when the window can't be reused
+        top = [w for w in self._ids.values() if w.parent is None]
+        if sum(w.fromInterface for w in top) != len(self.interface.widgets) \
+                or any(w._expanded and w.meta.repeat is None and len(w.children) != len(w.meta.children)
+                       for w in self._ids.values()):
+            return False
+        oldValues, self.langVars = self.langVars, {}
+        with self.batch():
+            for w in top:
+                if not w.fromInterface:
+                    self._delete_widget(w)
+            for repeat in self._repeats.values():
+                repeat.clear()
+            for w in list(self._ids.values()):
+                self._reset_widget(w)
+        if self.interface.rawTitle != self._rawTitle or oldValues:
+            self.title = self.interface.rawTitle
+        self._size, self._pos = self.interface.size, self.interface.pos
+        if callable(pool.reset):
+            pool.reset(self)
+        elif pool.reset is not None:
+            self.run(pool.reset)
+        self._window.withdraw()
+        del self.app.windows[self.app.windows.index(self)]
+        self.app.scheduler.pause_window(self)
+        if self.app._recorder is not None:
+            self.app._recorder.forget(self)
+        pool.windows.append(self)
+        return True
+
+    def _reset_widget(self, w: _Widget):
+        spec = _widget_spec(self, w.meta, w.id, w._spec.page)
+        current = w.args
+        options = {k: v for k, v in spec.args.items() if current.get(k, _missing) != v}
+        for k in current:
+            if k not in spec.args:
+                # an option the interface doesn't set goes back to the Tk default
+                info = w._widget.configure(k)
+                if len(info) == 2:
+                    info = w._widget.configure(info[1][1:])
+                options[k] = info[3]
+        w._spec, w._args = spec, None
+        if options:
+            self._configure(w, options)
+        if w.title != spec.title:
+            w.title = spec.title
+            w.parent._widget.tab(w._widget, text=w.title)
+        if w.pos != spec.pos:
+            w.pos = spec.pos
+            if w._widget.winfo_manager():
+                getattr(w._widget, w._widget.winfo_manager() + "_forget")()
+            self._pendingPlace.append(w)
+        if w._image != spec.image:
+            w._set_image(spec.image)
+        if w.type == "table":
+            w._widget.reset()
+        elif w.type == "canvas":
+            w._widget.clear()
+        if w._binding is not None:
+            # bound widgets show the state again instead of writing a default value into it
+            w._binding.last = _missing
+            self.app.state._push(w._binding)
+        elif w.type in _stringVarTypes:
+            w.set_value(spec.text or "")
+        elif w.type == "checkbutton":
+            w.set_value(0)
+        elif w.type == "scale":
+            w.set_value(spec.args.get("from_", 0))
+        elif w.type == "text":
+            w.set_value(spec.args.get("text", ""))
+        elif w.type == "virtuallist":
+            w.set_items([])
+
+    def _reuse(self, interface: _Interface):
+        if interface is not self.interface:
+            self._reload_interface()
+            if interface.lang is not self.lang:
+                self.set_lang(interface.lang)
+        self._set_geometry()
+        self._window.deiconify()
+        self.app.windows.append(self)
+        self.app.scheduler.resume_window(self)
+        self.run()
+        for s in self._load:
+            self.run(s)
+
+    def _destroy(self):
+        self.app.scheduler.cancel_window(self)
+        if self.app._recorder is not None:
+            self.app._recorder.forget(self, True)
+        for w in self._ids.values():
+            if w._binding is not None:
+                self.app.state.unbind(w)
+        names = [w._var_name for w in self._ids.values() if w.type in _varTypes] + self._deadVars
+        for w in self._ids.values():
+            if w._image and w._widget is not None:
+                self.app.resources.release(w._image)
+        if self in self.app.windows:
+            del self.app.windows[self.app.windows.index(self)]
+        self._window.destroy()
+        if names:
+            self._window.tk.call("unset", "-nocomplain", *names)
+
+    @property
+    def state(self):
+        return self.app.state
+
+    def __getitem__(self, item):
+        if type(item) == str:
+            if item in self._tags:
+                return self._tags[item]
+            if item in self._lazyTags:
+                return self._proxies.setdefault(item, _LazyWidget(self, item))
+            raise KeyError(item)
+        else:
+            return self.widgets[item]
+
+    def by_id(self, id: int):
+        return self._ids[id]
+
+
+class _TkBackend:
+    # the real Tk, windows need a display
+    name = "tk"
+
+    def __init__(self):
+        self.interp = None
+        self._wakeups = deque()
+        self._wakeCommand = None
+
+    def root(self):
+        root = tk.Tk()
+        self.interp = root.tk
+        self._wakeCommand = root.register(self._woken)
+        return root
+
+    def wake(self, func):
+        # calls func on the Tk thread, from any thread: tkinter hands the Tcl calls of other threads to the one
+        # running mainloop (RuntimeError if it doesn't run, or with a Tcl built without threads)
+        self._wakeups.append(func)
+        self.interp.call("after", "idle", self._wakeCommand)
+
+    def _woken(self, *args):
+        while self._wakeups:
+            self._wakeups.popleft()()
+
+    def dialog(self, kind: str, title: str, message: str):
+        import tkinter.messagebox as msgbox
+        return getattr(msgbox, kind)(title, message)
+
+    def update(self, seconds: float = 0.0):
+        # runs the pending events, idle callbacks and timers, and keeps doing it for seconds
+        if self.interp is None:
+            return
+        end = time.perf_counter() + seconds
+        while True:
+            while self.interp.dooneevent(tk._tkinter.DONT_WAIT):
+                pass
+            self._woken()
+            if time.perf_counter() >= end:
+                return
+            time.sleep(0.001)
+
+
+_nullProcs = '''
+    proc pyWin_null_call {args} {
+        # a python command can't raise a Tcl error (tkinter raises it again later), the code comes with the result
+        lassign [pyWin_null {*}$args] code result
+        return -code $code $result
+    }
+'''
+_nullAliases = {"bg": "background", "fg": "foreground", "bd": "borderwidth", "invcmd": "invalidcommand",
+                "vcmd": "validatecommand"}
+_nullDefaults = {"background": "#d9d9d9", "foreground": "#000000", "borderwidth": 1, "relief": "flat",
+                 "state": "normal", "anchor": "center", "justify": "center", "font": "TkDefaultFont", "width": 0,
+                 "height": 0, "padx": 1, "pady": 1, "highlightthickness": 1, "onvalue": 1, "offvalue": 0,
+                 "from": 0, "to": 100, "orient": "vertical", "selectbackground": "#c3c3c3",
+                 "selectforeground": "#000000"}
+_nullModifiers = {"Control", "Shift", "Lock", "Alt", "Meta", "Command", "Option", "Extended", "Any", "Double",
+                  "Triple", "Quadruple", *(f"{p}{i}" for p in ("Mod", "M", "Button", "B") for i in range(1, 6))}
+_nullEventTypes = {"KeyPress": 2, "KeyRelease": 3, "ButtonPress": 4, "ButtonRelease": 5, "Motion": 6, "Enter": 7,
+                   "Leave": 8, "FocusIn": 9, "FocusOut": 10, "Expose": 12, "Visibility": 15, "Destroy": 17,
+                   "Unmap": 18, "Map": 19, "Reparent": 21, "Configure": 22, "Gravity": 24, "Property": 28,
+                   "Activate": 36, "Deactivate": 37, "MouseWheel": 38}
+_nullEvents = {}
+
+
+def _null_event(sequence: str):
+    # "<Control-Key-a>" -> ({"Control"}, "KeyPress", "a"), a virtual event "<<Change>>" is its own type
+    event = _nullEvents.get(sequence)
+    if event is not None:
+        return event
+    if sequence.startswith("<<") and sequence.endswith(">>") and len(sequence) > 4:
+        event = (frozenset(), sequence, "")
+    elif sequence.startswith("<") and sequence.endswith(">") and len(sequence) > 2:
+        parts = sequence[1:-1].split("-")
+        mods = []
+        while len(parts) > 1 and parts[0] in _nullModifiers:
+            mods.append(parts.pop(0))
+        if parts[0] in ("Key", "Button"):
+            parts[0] += "Press"
+        if parts[0] in _nullEventTypes:
+            kind, detail = parts[0], "-".join(parts[1:])
+        elif len(parts) == 1 and parts[0] in ("1", "2", "3", "4", "5"):
+            kind, detail = "ButtonPress", parts[0]
+        else:
+            kind, detail = "KeyPress", "-".join(parts)
+        event = (frozenset(mods), kind, detail)
+    else:
+        raise tk.TclError(f'bad event type or keysym "{sequence}"')
+    _nullEvents[sequence] = event
+    return event
+
+
+def _null_percent(script: str, values: dict):
+    # the %x fields of a binding script, as Tk replaces them
+    out = []
+    start = 0
+    while True:
+        i = script.find("%", start)
+        if i < 0 or i + 1 >= len(script):
+            out.append(script[start:])
+            return "".join(out)
+        out.append(script[start:i])
+        out.append("%" if script[i + 1] == "%" else "{" + str(values.get(script[i + 1], "??")) + "}")
+        start = i + 2
+
+
+def _null_value(value):
+    # Tk gives numbers back as numbers
+    if type(value) == str and value.lstrip("-").isdigit():
+        return int(value)
+    return value
+
+
+# pixels per unit of a Tk screen distance, at 96 dpi
+_nullUnits = {"": 1.0, "c": 96 / 2.54, "i": 96.0, "m": 9.6 / 2.54, "p": 96 / 72}
+
+
+def _null_pixels(value) -> float:
+    # "10", "2.5c", "1i", "3m" or "12p"
+    value = str(value).strip()
+    unit = value[-1:] if value[-1:].isalpha() else ""
+    try:
+        return float(value[:len(value) - len(unit)]) * _nullUnits[unit]
+    except (ValueError, KeyError):
+        raise tk.TclError(f'bad screen distance "{value}"')
+
+
+def _null_pairs(args):
+    if len(args) % 2:
+        raise tk.TclError(f'value for "{args[-1]}" missing')
+    return {args[i][1:] if args[i].startswith("-") else args[i]: args[i + 1] for i in range(0, len(args), 2)}
+
+
+def _null_class(kind: str):
+    return "T" + kind[5:].capitalize() if kind.startswith("ttk::") else kind.capitalize()
+
+
+class _NullWidget:
+    # a Tk widget as plain data: options, geometry manager and its options, children and mapped state, the
+    # subcommands which only change what is drawn do nothing, any other unknown subcommand raises
+    __slots__ = ["backend", "kind", "path", "parent", "children", "options", "manager", "geometry", "mapped", "data"]
+    noops = ("xview", "yview", "see", "flash", "scan")
+
+    def __init__(self, backend, kind: str, path: str, parent):
+        self.backend = backend
+        self.kind = kind
+        self.path = path
+        self.parent = parent
+        self.children = []
+        self.options = {}
+        self.manager = ""
+        self.geometry = {}
+        self.mapped = False
+        self.data = {}
+
+    def create(self, args):
+        self.set_options(args)
+
+    def command(self, sub=None, *args):
+        if sub is None:
+            raise tk.TclError(f'wrong # args: should be "{self.path} option ?arg ...?"')
+        method = getattr(self, "sub_" + sub, None)
+        if method is not None:
+            return method(*args)
+        if sub in self.noops:
+            return ""
+        # a subcommand the emulation lacks fails like a wrong one, not only on a real display
+        raise tk.TclError(f'bad option "{sub}"')
+
+    def toplevel(self):
+        widget = self
+        while widget.kind != "toplevel":
+            widget = widget.parent
+        return widget
+
+    def size(self):
+        if self.kind == "toplevel":
+            size = str(self.data.get("geometry", "")).replace("-", "+").split("+")[0]
+            return tuple(map(int, size.split("x"))) if "x" in size else (1, 1)
+        size = []
+        for name in ("width", "height"):
+            try:
+                size.append(max(1, round(_null_pixels(self.options.get(name, "")))))
+            except tk.TclError:
+                size.append(1)
+        return tuple(size)
+
+    def get(self, name: str):
+        if name == "text" and self.options.get("textvariable"):
+            return self.value()
+        return _null_value(self.options.get(name, _nullDefaults.get(name, "")))
+
+    def value(self):
+        value = self.backend.getvar(self.options.get("textvariable") or self.options.get("variable"))
+        return "" if value is None else value
+
+    def set_options(self, args):
+        options = _null_pairs(args)
+        for name, value in options.items():
+            self.options[_nullAliases.get(name, name)] = value
+        for name in ("textvariable", "variable"):
+            if options.get(name) and self.backend.getvar(options[name]) is None:
+                # like Tk, a widget creates its variable with the value it shows
+                if name == "textvariable":
+                    self.backend.interp.globalsetvar(options[name], self.options.get("text", ""))
+                elif self.kind.endswith("checkbutton"):
+                    self.backend.interp.globalsetvar(options[name], self.get("offvalue"))
+                elif self.kind.endswith("scale"):
+                    self.backend.interp.globalsetvar(options[name], self.get("from"))
+
+    def option_info(self, name: str):
+        return "-" + name, name, name.capitalize(), _nullDefaults.get(name, ""), self.get(name)
+
+    def sub_configure(self, *args):
+        if not args:
+            return tuple(self.option_info(name) for name in sorted(self.options))
+        if len(args) == 1:
+            name = args[0][1:]
+            if name in _nullAliases:
+                return "-" + name, "-" + _nullAliases[name]
+            return self.option_info(name)
+        self.set_options(args)
+        return ""
+
+    sub_config = sub_configure
+
+    def sub_cget(self, option: str):
+        name = option[1:]
+        return self.get(_nullAliases.get(name, name))
+
+    def sub_invoke(self, *args):
+        if self.get("state") == "disabled":
+            return ""
+        var = self.options.get("variable")
+        if var and self.kind.endswith("checkbutton"):
+            on, off = self.get("onvalue"), self.get("offvalue")
+            self.backend.interp.globalsetvar(var, off if str(self.value()) == str(on) else on)
+        elif var and self.kind.endswith("radiobutton"):
+            self.backend.interp.globalsetvar(var, self.get("value"))
+        command = self.options.get("command")
+        return self.backend.interp.eval(command) if command else ""
+
+    def sub_select(self, *args):
+        var = self.options.get("variable")
+        if var:
+            self.backend.interp.globalsetvar(var, self.get("value" if self.kind.endswith("radiobutton") else "onvalue"))
+        return ""
+
+    def sub_deselect(self, *args):
+        var = self.options.get("variable")
+        if var:
+            self.backend.interp.globalsetvar(var, "" if self.kind.endswith("radiobutton") else self.get("offvalue"))
+        return ""
+
+    def sub_toggle(self, *args):
+        var = self.options.get("variable")
+        if var:
+            on, off = self.get("onvalue"), self.get("offvalue")
+            self.backend.interp.globalsetvar(var, off if str(self.value()) == str(on) else on)
+        return ""
+
+
+class _NullEntry(_NullWidget):
+    __slots__ = []
+
+    def value(self):
+        if self.options.get("textvariable"):
+            return str(_NullWidget.value(self))
+        return self.data.get("text", "")
+
+    def set_value(self, value: str):
+        if self.options.get("textvariable"):
+            self.backend.interp.globalsetvar(self.options["textvariable"], value)
+        else:
+            self.data["text"] = value
+
+    def index(self, index):
+        value = self.value()
+        if index == "end":
+            return len(value)
+        if index == "insert":
+            return min(self.data.get("insert", len(value)), len(value))
+        if str(index).startswith("@") or index in ("anchor", "sel.first", "sel.last"):
+            return 0
+        try:
+            return max(0, min(int(index), len(value)))
+        except ValueError:
+            raise tk.TclError(f'bad entry index "{index}"')
+
+    def sub_get(self, *args):
+        return self.value()
+
+    def sub_insert(self, index, text: str):
+        if self.get("state") == "normal":
+            value, i = self.value(), self.index(index)
+            self.set_value(value[:i] + text + value[i:])
+        return ""
+
+    def sub_delete(self, first, last=None):
+        if self.get("state") == "normal":
+            value, i = self.value(), self.index(first)
+            self.set_value(value[:i] + value[self.index(last) if last is not None else i + 1:])
+        return ""
+
+    def sub_set(self, value: str):
+        self.set_value(value)
+        return ""
+
+    def sub_index(self, index):
+        return self.index(index)
+
+    def sub_icursor(self, index):
+        self.data["insert"] = self.index(index)
+        return ""
+
+
+class _NullScale(_NullWidget):
+    __slots__ = []
+
+    def sub_get(self, *args):
+        if self.options.get("variable"):
+            return self.value()
+        return self.data.get("value", self.get("from"))
+
+    def sub_set(self, value):
+        if self.get("state") == "disabled":
+            return ""
+        if self.options.get("variable"):
+            self.backend.interp.globalsetvar(self.options["variable"], value)
+        self.data["value"] = value
+        command = self.options.get("command")
+        if command:
+            self.backend.interp.call("eval", command, value)
+        return ""
+
+
+class _NullScrollbar(_NullWidget):
+    __slots__ = []
+
+    def sub_set(self, first, last):
+        self.data["view"] = (float(first), float(last))
+        return ""
+
+    def sub_get(self):
+        return self.data.get("view", (0.0, 1.0))
+
+
+class _NullListbox(_NullWidget):
+    __slots__ = []
+
+    def create(self, args):
+        self.data.update(items=[], selection=set(), active=0)
+        _NullWidget.create(self, args)
+
+    def index(self, index, end: int = 0):
+        items = self.data["items"]
+        if index == "end":
+            return len(items) - end
+        if index in ("active", "anchor"):
+            return self.data[index] if index in self.data else 0
+        if str(index).startswith("@"):
+            return 0
+        try:
+            return int(index)
+        except ValueError:
+            raise tk.TclError(f'bad listbox index "{index}": must be active, anchor, end, @x,y, or a number')
+
+    def range(self, first, last):
+        first = max(0, self.index(first, 1))
+        return first, min(len(self.data["items"]), (self.index(last, 1) if last is not None else first) + 1)
+
+    def sub_insert(self, index, *items):
+        position = max(0, min(self.index(index), len(self.data["items"])))
+        self.data["items"][position:position] = items
+        self.data["selection"] = {i + len(items) if i >= position else i for i in self.data["selection"]}
+        return ""
+
+    def sub_delete(self, first, last=None):
+        first, last = self.range(first, last)
+        del self.data["items"][first:last]
+        self.data["selection"] = {i - (last - first) if i >= last else i for i in self.data["selection"]
+                                  if not first <= i < last}
+        return ""
+
+    def sub_get(self, first, last=None):
+        if last is None:
+            index = self.index(first)
+            return self.data["items"][index] if 0 <= index < len(self.data["items"]) else ""
+        first, last = self.range(first, last)
+        return tuple(self.data["items"][first:last])
+
+    def sub_size(self):
+        return len(self.data["items"])
+
+    def sub_index(self, index):
+        return self.index(index)
+
+    def sub_curselection(self):
+        return tuple(sorted(self.data["selection"]))
+
+    def sub_activate(self, index):
+        self.data["active"] = self.index(index)
+        return ""
+
+    def sub_selection(self, sub, first, last=None):
+        if sub == "includes":
+            return int(self.index(first) in self.data["selection"])
+        if sub == "anchor":
+            self.data["anchor"] = self.index(first)
+            return ""
+        first, last = self.range(first, last)
+        if sub == "set":
+            self.data["selection"].update(range(first, last))
+        elif sub == "clear":
+            self.data["selection"].difference_update(range(first, last))
+        return ""
+
+
+class _NullText(_NullWidget):
+    # the content always ends with a newline, as in Tk, marks and tag ranges are offsets which follow the text
+    # when it changes around them
+    __slots__ = []
+
+    def create(self, args):
+        self.data.update(text="\n", marks={"insert": 0, "current": 0}, tags={}, ranges={})
+        _NullWidget.create(self, args)
+
+    def line_start(self, line: int):
+        text = self.data["text"]
+        position = 0
+        for _ in range(line - 1):
+            position = text.find("\n", position) + 1
+            if not position:
+                return len(text)
+        return position
+
+    def position(self, offset: int):
+        text = self.data["text"]
+        return f"{text.count(chr(10), 0, offset) + 1}.{offset - text.rfind(chr(10), 0, offset) - 1}"
+
+    def offset(self, index):
+        # "1.0", "2.end", "end", "insert" or a mark, then "+3c", "-1 lines", "linestart", "lineend"...
+        text = self.data["text"]
+        index = str(index).strip()
+        i = 0
+        while i < len(index) and index[i] not in "+- ":
+            i += 1
+        base, rest = index[:i], index[i:]
+        if base == "end":
+            position = len(text)
+        elif base[:1].isdigit() and "." in base:
+            line, _, char = base.partition(".")
+            position = self.line_start(max(1, int(line)))
+            if position < len(text):
+                end = text.find("\n", position)
+                position = end if char == "end" else min(position + int(char), end)
+        elif base in self.data["marks"]:
+            position = self.data["marks"][base]
+        elif base.startswith("@"):
+            position = len(text) - 1
+        elif base.endswith(".first") or base.endswith(".last"):
+            tag, _, end = base.rpartition(".")
+            ranges = self.data["ranges"].get(tag)
+            if not ranges:
+                raise tk.TclError(f'text doesn\'t contain any characters tagged with "{tag}"')
+            position = ranges[0][0] if end == "first" else ranges[-1][1]
+        else:
+            raise tk.TclError(f'bad text index "{index}"')
+        tokens = rest.replace("+", " + ").replace("-", " - ").split()
+        j = 0
+        while j < len(tokens):
+            token = tokens[j]
+            j += 1
+            if token in ("+", "-") and j < len(tokens):
+                number = tokens[j]
+                j += 1
+                digits = number.rstrip("abcdefghijklmnopqrstuvwxyz")
+                unit = number[len(digits):]
+                while not unit and j < len(tokens) and tokens[j][0].isalpha():
+                    unit = tokens[j] if tokens[j] not in ("display", "any") else ""
+                    j += 1
+                count = int(digits) * (1 if token == "+" else -1)
+                if unit[:1] in ("", "c", "i"):
+                    position += count
+                elif unit[:1] == "l":
+                    line, char = map(int, self.position(position).split("."))
+                    start = self.line_start(max(1, line + count))
+                    end = text.find("\n", start)
+                    position = start if end < 0 else min(start + char, end)
+                else:
+                    raise tk.TclError(f'bad text index "{index}"')
+            elif token == "linestart":
+                position = text.rfind("\n", 0, position) + 1
+            elif token == "lineend":
+                end = text.find("\n", position)
+                position = end if end >= 0 else len(text) - 1
+            elif token in ("wordstart", "wordend"):
+                step = -1 if token == "wordstart" else 1
+                while 0 < position < len(text) - 1 and (text[position + min(step, 0)].isalnum()
+                                                        or text[position + min(step, 0)] == "_"):
+                    position += step
+            else:
+                raise tk.TclError(f'bad text index "{index}"')
+            position = max(0, min(position, len(text)))
+        return position
+
+    def edit(self, first: int, last: int, chars: str):
+        text = self.data["text"]
+        self.data["text"] = text[:first] + chars + text[last:]
+        shift = len(chars) - (last - first)
+
+        def move(position):
+            return position + shift if position >= last else first if position > first else position
+
+        marks = self.data["marks"]
+        for name, position in marks.items():
+            marks[name] = move(position)
+        for name, ranges in self.data["ranges"].items():
+            ranges[:] = [(s, e) for s, e in ((move(s), move(e)) for s, e in ranges) if s < e]
+
+    def tag_ranges(self, tag: str, first: int, last: int, add: bool):
+        # adds or removes [first, last) and keeps the ranges sorted and merged, as Tk does
+        ranges = []
+        for start, end in self.data["ranges"].get(tag, ()):
+            ranges += [r for r in ((start, min(end, first)), (max(start, last), end)) if r[0] < r[1]]
+        if add:
+            ranges.append((first, last))
+        merged = []
+        for start, end in sorted(ranges):
+            if merged and start <= merged[-1][1]:
+                merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+            else:
+                merged.append((start, end))
+        self.data["ranges"][tag] = merged
+
+    def sub_insert(self, index, chars="", *rest):
+        if self.get("state") == "normal":
+            position = min(self.offset(index), len(self.data["text"]) - 1)
+            self.edit(position, position, chars + "".join(rest[1::2]))
+        return ""
+
+    def sub_delete(self, first, last=None):
+        if self.get("state") == "normal":
+            start = self.offset(first)
+            end = min(self.offset(last) if last is not None else start + 1, len(self.data["text"]) - 1)
+            if start < end:
+                self.edit(start, end, "")
+        return ""
+
+    def sub_replace(self, first, last, chars="", *rest):
+        if self.get("state") == "normal":
+            start, end = self.offset(first), min(self.offset(last), len(self.data["text"]) - 1)
+            self.edit(start, max(start, end), chars + "".join(rest[1::2]))
+        return ""
+
+    def sub_get(self, first, last=None):
+        start = self.offset(first)
+        end = self.offset(last) if last is not None else start + 1
+        return self.data["text"][start:end] if start < end else ""
+
+    def sub_index(self, index):
+        return self.position(self.offset(index))
+
+    def sub_compare(self, first, op, last):
+        return int(_filterOps[op](self.offset(first), self.offset(last)))
+
+    def sub_count(self, *args):
+        options = [a for a in args if a.startswith("-")]
+        first, last = (self.offset(a) for a in args[len(options):][:2])
+        text = self.data["text"]
+        return text.count("\n", min(first, last), max(first, last)) if "-lines" in options else last - first
+
+    def sub_search(self, *args):
+        options = []
+        while args and args[0].startswith("-"):
+            options.append(args[0])
+            args = args[1:]
+            if options[-1] == "--":
+                break
+        pattern, start = args[0], self.offset(args[1])
+        text = self.data["text"]
+        if "-nocase" in options:
+            text, pattern = text.lower(), pattern.lower()
+        found = text.rfind(pattern, 0, start) if "-backwards" in options else text.find(pattern, start)
+        return "" if found < 0 else self.position(found)
+
+    def sub_mark(self, sub, *args):
+        marks = self.data["marks"]
+        if sub == "set":
+            marks[args[0]] = self.offset(args[1])
+        elif sub == "unset":
+            for name in args:
+                if name not in ("insert", "current"):
+                    marks.pop(name, None)
+        elif sub == "names":
+            return tuple(marks)
+        elif sub == "gravity":
+            return "right"
+        return ""
+
+    def sub_tag(self, sub, *args):
+        tags = self.data["tags"]
+        if sub in ("configure", "config") and args:
+            options = tags.setdefault(args[0], {})
+            if len(args) == 2:
+                return "-" + args[1][1:], "", "", "", options.get(args[1][1:], "")
+            options.update(_null_pairs(args[1:]))
+        elif sub == "cget":
+            return tags.get(args[0], {}).get(args[1][1:], "")
+        elif sub in ("add", "remove"):
+            tags.setdefault(args[0], {})
+            end = len(self.data["text"]) - 1
+            for i in range(1, len(args), 2):
+                first = min(self.offset(args[i]), end)
+                last = min(self.offset(args[i + 1]), end) if i + 1 < len(args) else first + 1
+                if first < last:
+                    self.tag_ranges(args[0], first, last, sub == "add")
+        elif sub == "delete":
+            for name in args:
+                tags.pop(name, None)
+                self.data["ranges"].pop(name, None)
+        elif sub == "names":
+            if not args:
+                return tuple(tags)
+            position = self.offset(args[0])
+            return tuple(name for name in tags if any(s <= position < e for s, e in self.data["ranges"].get(name, ())))
+        elif sub == "ranges":
+            return tuple(self.position(p) for r in self.data["ranges"].get(args[0], ()) for p in r)
+        elif sub in ("nextrange", "prevrange"):
+            ranges = self.data["ranges"].get(args[0], ())
+            first = self.offset(args[1])
+            if sub == "nextrange":
+                last = self.offset(args[2]) if len(args) > 2 else len(self.data["text"])
+                found = [r for r in ranges if first <= r[0] < last][:1]
+            else:
+                last = self.offset(args[2]) if len(args) > 2 else 0
+                found = [r for r in ranges if last <= r[0] < first][-1:]
+            return tuple(self.position(p) for r in found for p in r)
+        else:
+            raise tk.TclError(f'bad tag option "{sub}"')
+        return ""
+
+
+class _NullCanvas(_NullWidget):
+    # items are [type, coords, options, tags] by id
+    __slots__ = []
+
+    def create(self, args):
+        self.data.update(items={}, next=1)
+        _NullWidget.create(self, args)
+
+    def find(self, tagOrId):
+        items = self.data["items"]
+        if tagOrId == "all":
+            return list(items)
+        if str(tagOrId).isdigit():
+            return [int(tagOrId)] if int(tagOrId) in items else []
+        return [id for id, item in items.items() if tagOrId in item[3]]
+
+    def coords(self, args):
+        coords = []
+        for arg in args:
+            coords.extend(float(v) for v in self.backend.interp.splitlist(arg))
+        return coords
+
+    def item_options(self, item, args):
+        options = _null_pairs(args)
+        item[2].update(options)
+        if "tags" in options:
+            item[3] = tuple(self.backend.interp.splitlist(options["tags"]))
+
+    def sub_create(self, kind, *args):
+        i = 0
+        while i < len(args) and not (args[i].startswith("-") and args[i][1:2].isalpha()):
+            i += 1
+        id = self.data["next"]
+        self.data["next"] += 1
+        item = self.data["items"][id] = [kind, self.coords(args[:i]), {}, ()]
+        self.item_options(item, args[i:])
+        return id
+
+    def sub_coords(self, tagOrId, *args):
+        ids = self.find(tagOrId)
+        if not ids:
+            return ()
+        if args:
+            self.data["items"][ids[0]][1] = self.coords(args)
+            return ""
+        return tuple(self.data["items"][ids[0]][1])
+
+    def sub_delete(self, *tags):
+        for tagOrId in tags:
+            for id in self.find(tagOrId):
+                del self.data["items"][id]
+        return ""
+
+    def sub_itemconfigure(self, tagOrId, *args):
+        ids = self.find(tagOrId)
+        if len(args) <= 1:
+            options = self.data["items"][ids[0]][2] if ids else {}
+            if args:
+                return args[0], "", "", "", options.get(args[0][1:], "")
+            return tuple(("-" + k, "", "", "", v) for k, v in options.items())
+        for id in ids:
+            self.item_options(self.data["items"][id], args)
+        return ""
+
+    sub_itemconfig = sub_itemconfigure
+
+    def sub_itemcget(self, tagOrId, option):
+        ids = self.find(tagOrId)
+        return _null_value(self.data["items"][ids[0]][2].get(option[1:], "")) if ids else ""
+
+    def sub_find(self, sub, *args):
+        if sub == "all":
+            return tuple(self.data["items"])
+        if sub == "withtag":
+            return tuple(self.find(args[0]))
+        return ()
+
+    def sub_type(self, tagOrId):
+        ids = self.find(tagOrId)
+        return self.data["items"][ids[0]][0] if ids else ""
+
+    def sub_gettags(self, tagOrId):
+        ids = self.find(tagOrId)
+        return self.data["items"][ids[0]][3] if ids else ()
+
+    def sub_addtag(self, tag, sub, *args):
+        for id in (self.find(args[0]) if sub == "withtag" else self.data["items"] if sub == "all" else ()):
+            item = self.data["items"][id]
+            if tag not in item[3]:
+                item[3] += (tag,)
+        return ""
+
+    def sub_dtag(self, tagOrId, tag=None):
+        for id in self.find(tagOrId):
+            item = self.data["items"][id]
+            item[3] = tuple(t for t in item[3] if t != (tag or tagOrId))
+        return ""
+
+    def sub_move(self, tagOrId, dx, dy):
+        for id in self.find(tagOrId):
+            coords = self.data["items"][id][1]
+            for i in range(len(coords)):
+                coords[i] += float(dy if i % 2 else dx)
+        return ""
+
+    def sub_bbox(self, *tags):
+        coords = [self.data["items"][id][1] for tagOrId in tags for id in self.find(tagOrId)]
+        xs = [v for c in coords for v in c[0::2]]
+        ys = [v for c in coords for v in c[1::2]]
+        if not xs:
+            return ""
+        return int(min(xs)), int(min(ys)), int(max(xs)) + 1, int(max(ys)) + 1
+
+    def sub_canvasx(self, x, *args):
+        return float(x)
+
+    sub_canvasy = sub_canvasx
+
+
+class _NullNotebook(_NullWidget):
+    # only the selected tab is mapped
+    __slots__ = []
+
+    def create(self, args):
+        self.data.update(tabs=[], tabOptions={}, current="")
+        _NullWidget.create(self, args)
+
+    def tab(self, tabId):
+        tabs = self.data["tabs"]
+        if tabId == "current":
+            tabId = self.data["current"]
+        elif str(tabId).isdigit() and int(tabId) < len(tabs):
+            return tabs[int(tabId)]
+        if tabId not in tabs:
+            raise tk.TclError(f'Slave index {tabId} out of bounds' if str(tabId).isdigit() else
+                              f'{tabId} is not managed by {self.path}')
+        return tabId
+
+    def select(self, path: str):
+        if self.data["current"] != path:
+            self.data["current"] = path
+            self.backend.schedule_map()
+            self.backend.interp.call("after", "idle", ("event", "generate", self.path, "<<NotebookTabChanged>>"))
+
+    def sub_add(self, child, *args):
+        self.backend.widget(child)
+        if child not in self.data["tabs"]:
+            self.data["tabs"].append(child)
+        return self.sub_insert(self.data["tabs"].index(child), child, *args)
+
+    def sub_insert(self, position, child, *args):
+        widget = self.backend.widget(child)
+        tabs = self.data["tabs"]
+        if child in tabs:
+            tabs.remove(child)
+        tabs.insert(len(tabs) if position == "end" else int(position), child)
+        widget.manager, widget.geometry = "notebook", {"in": self.path}
+        self.data["tabOptions"].setdefault(child, {}).update(_null_pairs(args))
+        if not self.data["current"]:
+            self.select(child)
+        self.backend.schedule_map()
+        return ""
+
+    def sub_tab(self, tabId, *args):
+        options = self.data["tabOptions"][self.tab(tabId)]
+        if not args:
+            return tuple(v for k, value in options.items() for v in ("-" + k, value))
+        if len(args) == 1:
+            return _null_value(options.get(args[0][1:], ""))
+        options.update(_null_pairs(args))
+        return ""
+
+    def sub_tabs(self):
+        return tuple(self.data["tabs"])
+
+    def sub_select(self, tabId=None):
+        if tabId is None:
+            return self.data["current"]
+        self.select(self.tab(tabId))
+        return ""
+
+    def sub_index(self, tabId):
+        if tabId == "end":
+            return len(self.data["tabs"])
+        return self.data["tabs"].index(self.tab(tabId)) if self.data["tabs"] else -1
+
+    def sub_forget(self, tabId):
+        path = self.tab(tabId)
+        self.data["tabs"].remove(path)
+        self.data["tabOptions"].pop(path, None)
+        widget = self.backend.widgets.get(path)
+        if widget is not None:
+            widget.manager, widget.geometry = "", {}
+        if self.data["current"] == path:
+            self.data["current"] = ""
+            if self.data["tabs"]:
+                self.select(self.data["tabs"][0])
+        self.backend.schedule_map()
+        return ""
+
+    def sub_hide(self, tabId):
+        self.data["tabOptions"][self.tab(tabId)]["state"] = "hidden"
+        return ""
+
+    def sub_state(self, *args):
+        return ()
+
+    def sub_instate(self, *args):
+        return 0
+
+
+_nullClasses = {"entry": _NullEntry, "spinbox": _NullEntry, "ttk::entry": _NullEntry, "ttk::combobox": _NullEntry,
+                "ttk::spinbox": _NullEntry, "scale": _NullScale, "ttk::scale": _NullScale,
+                "scrollbar": _NullScrollbar, "ttk::scrollbar": _NullScrollbar, "listbox": _NullListbox,
+                "text": _NullText, "canvas": _NullCanvas, "ttk::notebook": _NullNotebook}
+_nullKinds = ("toplevel", "frame", "labelframe", "label", "button", "checkbutton", "radiobutton", "message", "menu",
+              "menubutton", "panedwindow", "ttk::frame", "ttk::labelframe", "ttk::label", "ttk::button",
+              "ttk::checkbutton", "ttk::radiobutton", "ttk::menubutton", "ttk::progressbar", "ttk::separator",
+              "ttk::sizegrip", "ttk::panedwindow", *_nullClasses)
+
+
+def _image_size(data, file):
+    # width and height from a PNG, GIF or PPM/PGM header
+    header = b""
+    if data:
+        try:
+            import base64
+            header = base64.b64decode(data[:64])
+        except ValueError:
+            header = data[:64].encode("latin-1", "replace") if type(data) == str else bytes(data[:64])
+    elif file:
+        try:
+            with open(file, "rb") as f:
+                header = f.read(64)
+        except OSError:
+            raise tk.TclError(f'couldn\'t open "{file}": no such file or directory')
+    if header[:8] == b"\x89PNG\r\n\x1a\n":
+        return int.from_bytes(header[16:20], "big"), int.from_bytes(header[20:24], "big")
+    if header[:3] == b"GIF":
+        return int.from_bytes(header[6:8], "little"), int.from_bytes(header[8:10], "little")
+    if header[:1] == b"P" and len(header.split()) >= 3:
+        try:
+            return int(header.split()[1]), int(header.split()[2])
+        except ValueError:
+            pass
+    return 0, 0
+
+
+class _NullImage:
+    __slots__ = ["kind", "name", "options", "size"]
+
+    def __init__(self, kind: str, name: str, options: dict):
+        self.kind = kind
+        self.name = name
+        self.options = options
+        self.size = None
+
+    def dimension(self, i: int):
+        if self.size is None:
+            self.size = _image_size(self.options.get("data"), self.options.get("file"))
+        given = self.options.get(("width", "height")[i])
+        return int(given) if given else self.size[i]
+
+    def command(self, sub=None, *args):
+        if sub in ("width", "height"):
+            return self.dimension(sub == "height")
+        if sub == "cget":
+            return self.options.get(args[0][1:], "")
+        if sub in ("configure", "config") and len(args) > 1:
+            self.options.update(_null_pairs(args))
+            self.size = None
+        return ""
+
+
+class _NullBackend(_TkBackend):
+    # no display: tkinter talks to a Tcl interpreter without Tk, whose widget commands keep everything in plain
+    # python objects (backend.widgets by path). Events are fired with event generate (see _Widget.fire), the event
+    # loop only runs in update() or mainloop(), and window.open() returns at once
+    name = "null"
+
+    def __init__(self, screen=(1920, 1080)):
+        _TkBackend.__init__(self)
+        self.screen = screen
+        self.widgets = {}
+        self.images = {}
+        self.binds = {}
+        self.dialogs = []
+        self.answers = []
+        self.focused = ""
+        self.clipboard = ""
+        self._commands = {}
+        self._serial = 0
+        self._mapping = False
+        self._quit = False
+        self._wakePipe = None
+
+    def root(self):
+        root = tk.Tcl()
+        self.interp = root.tk
+        if self._wakePipe is None and hasattr(self.interp, "createfilehandler"):
+            self._wakePipe = os.pipe()
+        if self._wakePipe is not None:
+            self.interp.createfilehandler(self._wakePipe[0], tk.READABLE, self._drain_wakeups)
+        self.widgets, self.images, self.binds, self._commands = {}, {}, {}, {}
+        self.interp.createcommand("pyWin_null", self._call)
+        self.interp.eval(_nullProcs)
+        for name in ("wm", "winfo", "pack", "grid", "place", "bind", "bindtags", "event", "destroy", "focus",
+                     "image", "grab", "tk", "raise", "lower", "option", "bell", "clipboard", "ttk::style"):
+            self._register(name, getattr(self, "_" + name.replace("ttk::", "ttk_")))
+        self._register("pyWin_null_map", self._map)
+        for kind in _nullKinds:
+            self._register(kind, lambda *args, kind=kind: self._create(kind, *args))
+        widget = self.widgets["."] = _NullWidget(self, "toplevel", ".", None)
+        widget.data["state"] = "normal"
+        self._register(".", widget.command)
+        self.schedule_map()
+        root.quit = self.quit
+        return root
+
+    def dialog(self, kind: str, title: str, message: str):
+        # answers are given in advance in backend.answers, else it's the default button
+        self.dialogs.append((kind, title, message))
+        if self.answers:
+            return self.answers.pop(0)
+        return "ok" if kind.startswith("show") else True
+
+    def wake(self, func):
+        # a byte written to a pipe watched by the interpreter wakes update() and mainloop() up, where Tcl can't
+        # watch it (Windows) func waits for the next update()
+        self._wakeups.append(func)
+        if self._wakePipe is not None:
+            os.write(self._wakePipe[1], b"\0")
+
+    def _drain_wakeups(self, fd, mask):
+        os.read(fd, 4096)
+        self._woken()
+
+    def mainloop(self):
+        # blocks like Tk's mainloop, until quit() or the root window is destroyed
+        self._quit = False
+        while not self._quit and "." in self.widgets:
+            self.interp.dooneevent(0)
+
+    def quit(self):
+        self._quit = True
+
+    def close(self, window):
+        # what the window manager does when the close button of a window is clicked
+        path = window._window._w
+        command = self.widget(path).data.get("protocol", {}).get("WM_DELETE_WINDOW")
+        if command:
+            self.interp.eval(command)
+        else:
+            window._window.destroy()
+
+    def widget(self, path: str):
+        widget = self.widgets.get(path)
+        if widget is None:
+            raise tk.TclError(f'bad window path name "{path}"')
+        return widget
+
+    def getvar(self, name: str):
+        try:
+            return self.interp.globalgetvar(name)
+        except tk.TclError:
+            return None
+
+    def _register(self, name: str, func):
+        self._commands[name] = func
+        self.interp.call("interp", "alias", "", name, "", "pyWin_null_call", name)
+
+    def _unregister(self, name: str):
+        self._commands.pop(name, None)
+        try:
+            self.interp.deletecommand(name)
+        except tk.TclError:
+            pass
+
+    def _call(self, name, *args):
+        func = self._commands.get(name)
+        if func is None:
+            return 1, f'invalid command name "{name}"'
+        try:
+            result = func(*args)
+        except Exception as e:
+            return 1, str(e) if isinstance(e, tk.TclError) else f"{type(e).__name__}: {e}"
+        return 0, "" if result is None else result
+
+    def _create(self, kind: str, path: str = None, *args):
+        if path is None or not path.startswith("."):
+            raise tk.TclError(f'wrong # args: should be "{kind} pathName ?-option value ...?"')
+        if path in self.widgets:
+            raise tk.TclError(f'window name "{path.rsplit(".", 1)[1]}" already exists in parent')
+        parent = self.widget(path.rsplit(".", 1)[0] or ".")
+        widget = _nullClasses.get(kind, _NullWidget)(self, kind, path, parent)
+        widget.create(args)
+        parent.children.append(widget)
+        self.widgets[path] = widget
+        self._register(path, widget.command)
+        if kind == "toplevel":
+            widget.data["state"] = "normal"
+            self.schedule_map()
+        return path
+
+    def _destroy(self, *paths):
+        for path in paths:
+            widget = self.widgets.get(path)
+            if widget is None:
+                continue
+            self._forget(widget)
+            if widget.parent is not None:
+                widget.parent.children.remove(widget)
+        return ""
+
+    def _forget(self, widget):
+        for child in widget.children:
+            self._forget(child)
+        widget.children = []
+        widget.mapped = False
+        del self.widgets[widget.path]
+        self.binds.pop(widget.path, None)
+        self._unregister(widget.path)
+        if self.focused == widget.path:
+            self.focused = ""
+
+    def _manage(self, manager: str, args):
+        if not args:
+            raise tk.TclError(f'wrong # args: should be "{manager} option arg ?arg ...?"')
+        sub = "configure" if args[0].startswith(".") else args[0]
+        args = args[1:] if sub == args[0] else args
+        if sub == "configure":
+            paths = [a for a in args if a.startswith(".")]
+            options = _null_pairs(args[len(paths):])
+            for path in paths:
+                widget = self.widget(path)
+                if widget.manager != manager:
+                    widget.manager, widget.geometry = manager, {}
+                widget.geometry.update(options)
+            self.schedule_map()
+        elif sub in ("forget", "remove"):
+            for path in args:
+                widget = self.widget(path)
+                if widget.manager == manager:
+                    widget.manager = ""
+                    if sub == "forget":
+                        widget.geometry = {}
+            self.schedule_map()
+        elif sub == "info":
+            widget = self.widget(args[0])
+            if widget.manager != manager:
+                raise tk.TclError(f'window "{args[0]}" isn\'t packed' if manager == "pack" else
+                                  f'window "{args[0]}" isn\'t managed by {manager}')
+            return tuple(v for k, value in widget.geometry.items() for v in ("-" + k, value))
+        elif sub in ("slaves", "content"):
+            return tuple(c.path for c in self.widget(args[0]).children if c.manager == manager)
+        elif sub == "propagate":
+            return 1 if len(args) < 2 else ""
+        elif sub in ("size", "bbox"):
+            return (0, 0) if sub == "size" else (0, 0, 0, 0)
+        return ""
+
+    def _pack(self, *args):
+        return self._manage("pack", args)
+
+    def _grid(self, *args):
+        return self._manage("grid", args)
+
+    def _place(self, *args):
+        return self._manage("place", args)
+
+    def _wm(self, sub, window, *args):
+        widget = self.widget(window)
+        data = widget.data
+        if sub in ("withdraw", "deiconify", "iconify") or sub == "state" and args:
+            data["state"] = args[0] if sub == "state" else \
+                {"withdraw": "withdrawn", "deiconify": "normal", "iconify": "iconic"}[sub]
+            self.schedule_map()
+            return ""
+        if sub == "state":
+            return data.get("state", "normal")
+        if sub in ("protocol", "attributes"):
+            values = data.setdefault(sub, {})
+            if not args:
+                return tuple(values) if sub == "protocol" else tuple(v for k, value in values.items()
+                                                                     for v in ("-" + k, value))
+            if len(args) == 1:
+                return values.get(args[0].lstrip("-"), "")
+            values.update(_null_pairs(args) if sub == "attributes" else {args[0]: args[1]})
+            return ""
+        if args:
+            data[sub] = args[0] if len(args) == 1 else args
+            return ""
+        return data.get(sub, "1x1+0+0" if sub == "geometry" else "")
+
+    def _winfo(self, sub, *args):
+        if sub in ("screenwidth", "vrootwidth"):
+            return self.screen[0]
+        if sub in ("screenheight", "vrootheight"):
+            return self.screen[1]
+        if sub == "exists":
+            return int(args[0] in self.widgets)
+        if sub in ("pixels", "fpixels"):
+            pixels = _null_pixels(args[1])
+            return round(pixels) if sub == "pixels" else pixels
+        widget = self.widget(args[0])
+        if sub == "manager":
+            return widget.manager
+        if sub == "children":
+            return tuple(c.path for c in widget.children)
+        if sub in ("ismapped", "viewable"):
+            return int(widget.mapped)
+        if sub == "toplevel":
+            return widget.toplevel().path
+        if sub == "parent":
+            return widget.parent.path if widget.parent else ""
+        if sub == "class":
+            return "Tk" if widget.path == "." else _null_class(widget.kind)
+        if sub == "name":
+            return widget.path.rsplit(".", 1)[1] or "tk"
+        if sub in ("width", "reqwidth", "height", "reqheight"):
+            return widget.size()[sub.endswith("height")]
+        if sub == "geometry":
+            return "{}x{}+0+0".format(*widget.size())
+        if sub == "id":
+            return id(widget) & 0xffffff
+        if sub in ("pointerx", "pointery"):
+            return -1
+        if sub == "pointerxy":
+            return -1, -1
+        if sub in ("x", "y", "rootx", "rooty"):
+            return 0
+        return ""
+
+    def _bind(self, tag, sequence=None, script=None):
+        if tag.startswith("."):
+            self.widget(tag)
+        binds = self.binds.get(tag, {})
+        if sequence is None:
+            return tuple(s for s, _ in binds.values())
+        event = _null_event(sequence)
+        if script is None:
+            return binds.get(event, ("", ""))[1]
+        if script.startswith("+"):
+            script = (binds[event][1] + "\n" if event in binds else "") + script[1:]
+        if script:
+            self.binds.setdefault(tag, {})[event] = (sequence, script)
+        else:
+            binds.pop(event, None)
+        return ""
+
+    def _bindtags(self, path, tags=None):
+        widget = self.widget(path)
+        top = widget.toplevel().path
+        return (path, "Tk" if path == "." else _null_class(widget.kind)) + ((top,) if top != path else ()) + ("all",)
+
+    def _event(self, sub, *args):
+        if sub != "generate":
+            return ()
+        widget = self.widget(args[0])
+        fields = _null_pairs(args[2:])
+        if fields.pop("when", "now") != "now":
+            # queued, it runs with the next events
+            self.interp.call("after", "idle", ("event", "generate") + args[:2] +
+                             tuple(v for k, value in fields.items() for v in ("-" + k, value)))
+            return ""
+        self.fire(widget, args[1], fields)
+        return ""
+
+    def fire(self, widget, sequence: str, fields: dict = None):
+        # the best matching binding of each bindtag (widget, class, toplevel, all), until one breaks
+        mods, kind, detail = _null_event(sequence)
+        fields = fields or {}
+        if kind.startswith("Key"):
+            detail = fields.get("keysym", detail)
+        elif kind.startswith("Button"):
+            detail = fields.get("button", detail)
+        event = (mods, kind, detail)
+        self._serial += 1
+        x, y = fields.get("x", "??"), fields.get("y", "??")
+        values = {"#": self._serial, "b": detail if kind.startswith("Button") else "??", "f": 0,
+                  "h": fields.get("height", "??"), "k": fields.get("keycode", "??"), "s": fields.get("state", 0),
+                  "t": int(time.monotonic() * 1000) & 0xffffffff, "w": fields.get("width", "??"), "x": x, "y": y,
+                  "A": (detail if len(detail) == 1 else {"space": " ", "Return": "\r", "Tab": "\t"}.get(detail, ""))
+                  if kind.startswith("Key") else "??", "E": 1, "K": detail if kind.startswith("Key") else "??",
+                  "N": "??", "W": widget.path, "T": _nullEventTypes.get(kind, 35), "X": fields.get("rootx", x),
+                  "Y": fields.get("rooty", y), "D": fields.get("delta", "??"), "d": fields.get("data", "??")}
+        for tag in self._bindtags(widget.path):
+            binds = self.binds.get(tag)
+            if not binds:
+                continue
+            found = binds.get(event)
+            if found is None:
+                best = None
+                for (bindMods, bindKind, bindDetail), bind in binds.items():
+                    if bindKind == kind and bindDetail in ("", detail) and bindMods <= mods:
+                        score = (bindDetail != "", len(bindMods))
+                        if best is None or score > best[0]:
+                            best = (score, bind)
+                if best is None:
+                    continue
+                found = best[1]
+            code = int(self.interp.call("catch", _null_percent(found[1], values), "::pyWin_null_result"))
+            if code == 1:
+                sys.stderr.write(str(self.interp.globalgetvar("errorInfo")) + "\n")
+            elif code == 3:
+                break
+
+    def schedule_map(self):
+        if not self._mapping:
+            self._mapping = True
+            self.interp.call("after", "idle", "pyWin_null_map")
+
+    def _map(self):
+        # like Tk, windows are mapped at idle time: a shown toplevel, or a managed widget in a mapped parent
+        self._mapping = False
+        changed = []
+        for widget in list(self.widgets.values()):
+            if widget.kind == "toplevel":
+                mapped = widget.data.get("state", "normal") == "normal"
+            elif widget.manager == "notebook":
+                notebook = self.widgets.get(widget.geometry["in"])
+                mapped = notebook is not None and notebook.mapped and notebook.data["current"] == widget.path
+            else:
+                mapped = bool(widget.manager) and widget.parent.mapped
+            if mapped != widget.mapped:
+                widget.mapped = mapped
+                changed.append(widget)
+        for widget in changed:
+            if widget.path in self.widgets:
+                self.fire(widget, "<Map>" if widget.mapped else "<Unmap>")
+        return ""
+
+    def _focus(self, *args):
+        args = [a for a in args if a != "-force"]
+        if not args or args[0] in ("-lastfor", "-displayof"):
+            return self.focused
+        self.widget(args[0])
+        self.focused = args[0]
+        return ""
+
+    def _image(self, sub, *args):
+        if sub == "create":
+            kind, args = args[0], args[1:]
+            if args and not args[0].startswith("-"):
+                name, args = args[0], args[1:]
+            else:
+                n = len(self.images) + 1
+                while f"image{n}" in self.images:
+                    n += 1
+                name = f"image{n}"
+            self.images[name] = _NullImage(kind, name, _null_pairs(args))
+            self._register(name, self.images[name].command)
+            return name
+        if sub == "delete":
+            for name in args:
+                if self.images.pop(name, None) is not None:
+                    self._unregister(name)
+            return ""
+        if sub == "names":
+            return tuple(self.images)
+        if sub == "types":
+            return "photo", "bitmap"
+        if sub == "inuse":
+            return 0
+        if args[0] not in self.images:
+            raise tk.TclError(f'image "{args[0]}" doesn\'t exist')
+        image = self.images[args[0]]
+        if sub == "type":
+            return image.kind
+        return image.command(sub)
+
+    def _clipboard(self, sub, *args):
+        if sub == "clear":
+            self.clipboard = ""
+        elif sub == "append":
+            self.clipboard += args[-1]
+        elif sub == "get":
+            return self.clipboard
+        return ""
+
+    def _tk(self, sub, *args):
+        return {"windowingsystem": "x11", "scaling": 1.0, "appname": "pyWin"}.get(sub, "")
+
+    def _grab(self, *args):
+        return ""
+
+    _raise = _lower = _option = _bell = _ttk_style = _grab
+
+
+_backends = {"tk": _TkBackend, "null": _NullBackend}
+
+
+class App:
+    def __init__(self, path: str, cacheDir: (str, None) = ..., bundle: dict = None, backend="tk"):
+        self.path = path
+        if type(backend) == str:
+            if backend not in _backends:
+                raise ValueError(f"Unknown backend '{backend}'")
+            backend = _backends[backend]()
+        self.backend = backend
+        self.windows = []
+        self.cache = _YamlCache(os.path.join(path, "__pycache__") if cacheDir == Ellipsis else cacheDir)
+        if bundle:
+            self.cache.add_bundle(path, bundle)
+        self._langs = {}
+        self._interfaces = {}
+        self.fallbackLang = None
+        self._loop = None
+        self._tasks = {}
+        self._asyncStep = None
+        self._selectorWatch = None
+        self.asyncTick = 10
+        self._mainThread = threading.get_ident()
+        self._executor = None
+        self._processExecutor = None
+        self.workers = None
+        self._jobs = 0
+        self._updates = {}
+        self._calls = []
+        self._updatesLock = threading.Lock()
+        self._pump = None
+        self._pumpWaking = False
+        self.pumpInterval = 16
+        self._stats = None
+        self._statsTimers = {}
+        self._statsOptions = None
+        self._statsServer = None
+        self._watcher = None
+        self.state = _State(self)
+        self.resources = _Resources(self)
+        self._pools = {}
+        self.scheduler = _Scheduler(self)
+        self._recorder = None
+        self._replay = None
+        if _sessionRecord:
+            self.record(_sessionRecord)
+        self.run()
+
+    @property
+    def root(self):
+        return self.windows[0] if len(self.windows) >= 1 else None
+
+    def get_lang(self, name: str):
+        # fr-CA -> fr -> App.fallbackLang
+        names = [name]
+        while "-" in names[-1]:
+            names.append(names[-1].rsplit("-", 1)[0])
+        if self.fallbackLang and self.fallbackLang not in names:
+            names.append(self.fallbackLang)
+        paths = [self.path + "/lang/" + n + ".yaml" for n in names]
+        paths = [p for p in paths if p in self.cache._bundled or os.path.isfile(p)] or paths[:1]
+        data = [self.cache.load(p) for p in paths]
+        memo = self._langs.get(name)
+        if not memo or len(memo[0]) != len(data) or any(a is not b for a, b in zip(memo[0], data)):
+            lang = None
+            for p in reversed(paths):
+                lang = _Lang(p, self.cache, lang)
+            lang._requested = name
+            memo = self._langs[name] = (data, lang)
+        return memo[1]
+
+    def get_interface(self, name: str, lang: _Lang = None):
+        return self._get_interface(self.path + "/interface/" + name + ".yaml", lang)
+
+    def _get_interface(self, path: str, lang: _Lang = None):
+        data = self.cache.load(path)
+        memo = self._interfaces.get((path, lang))
+        if not memo or memo[0] is not data:
+            memo = self._interfaces[(path, lang)] = (data, _Interface(self, path, lang))
+        return memo[1]
+
+    def create_window(self, interface: _Interface):
+        pool = self._pools.get(interface.path)
+        if pool is None:
+            return _Window(self, interface)
+        if pool.windows:
+            window = pool.windows.pop()
+            window._reuse(interface)
+        else:
+            window = _Window(self, interface)
+            window._window.protocol("WM_DELETE_WINDOW", window.close)
+        self._prewarm()
+        return window
+
+    def pool(self, interface: _Interface, size: int = 4, prewarm: int = 0, reset=None):
+        # closed windows of this interface are hidden and reset instead of destroyed, up to size of them
+        pool = self._pools.get(interface.path)
+        if pool is None:
+            pool = self._pools[interface.path] = _Pool(interface)
+        pool.size = size
+        pool.reset = reset
+        pool.prewarm = min(prewarm, size)
+        while len(pool.windows) > size:
+            pool.windows.pop()._destroy()
+        self._prewarm()
+        return pool
+
+    def _prewarm(self):
+        # one window per idle callback, the windows already open stay responsive
+        for pool in self._pools.values():
+            if pool.prewarm > len(pool.windows) and self.root and not pool.warming:
+                pool.warming = True
+                self.root._window.after_idle(self._warm, pool)
+
+    def _warm(self, pool):
+        pool.warming = False
+        if pool.prewarm <= len(pool.windows) or not self.root:
+            return
+        window = _Window(self, self._get_interface(pool.interface.path, self.root.lang), hidden=True)
+        window._window.protocol("WM_DELETE_WINDOW", window.close)
+        pool.windows.append(window)
+        self._prewarm()
+
+    @contextmanager
+    def batch(self):
+        with ExitStack() as stack:
+            for window in self.windows:
+                stack.enter_context(window.batch())
+            yield self
+
+    def get_command(self, command: str):
+        try:
+            func = getattr(self, "command_" + command)
+        except AttributeError:
+            raise CommandNotFoundError(f"Command '{command}' not found")
+        if _is_coroutine_function(func):
+            return self._async_handler(command, func)
+        if getattr(func, "_background", False):
+            return self._background_handler(func)
+        return func
+
+    def get_script(self, script: str = ...):
+        if script == Ellipsis: return getattr(self, "script")
+        try:
+            func = getattr(self, "script_" + script)
+        except AttributeError:
+            raise ScriptNotFoundError(f"Script '{script}' not found")
+        if _is_coroutine_function(func):
+            return self._async_handler(script, func)
+        if getattr(func, "_background", False):
+            return self._background_handler(func)
+        return func
+
+    @property
+    def executor(self):
+        if self._executor is None:
+            from concurrent.futures import ThreadPoolExecutor
+            self._executor = ThreadPoolExecutor(self.workers, thread_name_prefix="pyWin")
+        return self._executor
+
+    @property
+    def processExecutor(self):
+        if self._processExecutor is None:
+            from concurrent.futures import ProcessPoolExecutor
+            self._processExecutor = ProcessPoolExecutor(self.workers)
+        return self._processExecutor
+
+    def _background_handler(self, func):
+        def handler(*args):
+            return self.submit(func, *args)
+        handler._background = True
+        return handler
+
+    def submit(self, func, *args, callback=None, process: bool = False):
+        future = (self.processExecutor if process else self.executor).submit(func, *args)
+        self._jobs += 1
+        future.add_done_callback(lambda f: self.post(self._job_done, f, callback))
+        self._start_pump()
+        return future
+
+    def _job_done(self, future, callback=None):
+        self._jobs -= 1
+        if future.cancelled():
+            return
+        e = future.exception()
+        if e is not None:
+            if self.root:
+                self.root._window.report_callback_exception(type(e), e, e.__traceback__)
+        elif callback:
+            callback(future.result())
+
+    def post(self, func, *args, **kwargs):
+        with self._updatesLock:
+            self._calls.append((func, args, kwargs))
+        self._wake_pump()
+
+    def _post_update(self, widget: _Widget, key, value):
+        # only the latest value of each widget option survives until the next pump
+        with self._updatesLock:
+            self._updates[(widget, key)] = value
+        self._wake_pump()
+
+    def _wake_pump(self):
+        # from another thread, the backend starts the pump on the Tk thread, once until it runs
+        if threading.get_ident() == self._mainThread:
+            self._start_pump()
+            return
+        with self._updatesLock:
+            if self._pumpWaking or self._pump is not None:
+                return
+            self._pumpWaking = True
+        try:
+            self.backend.wake(self._start_pump)
+        except (RuntimeError, tk.TclError):
+            # no event loop yet, the first window starts the pump
+            self._pumpWaking = False
+
+    def _start_pump(self):
+        self._pumpWaking = False
+        if self._pump is None and self.root:
+            self._pump = self.root._window.after(self.pumpInterval, self._run_pump)
+
+    def _run_pump(self):
+        self._pump = None
+        with self._updatesLock:
+            updates, self._updates = self._updates, {}
+            calls, self._calls = self._calls, []
+        with self.batch():
+            for (w, key), value in updates.items():
+                if w.window not in self.windows or w.id not in w.window._ids:
+                    continue
+                if key is None:
+                    w.set_value(value)
+                else:
+                    w.set(key, value)
+        for func, args, kwargs in calls:
+            func(*args, **kwargs)
+        if self._jobs or self._updates or self._calls:
+            self._start_pump()
+
+    def profile(self, enabled: bool = True, lagInterval: int = 100, dump: str = None, dumpInterval: float = 5.0,
+                address=None):
+        for name, (window, timer) in list(self._statsTimers.items()):
+            try:
+                window.after_cancel(timer)
+            except tk._tkinter.TclError:
+                pass
+        self._statsTimers = {}
+        if self._statsServer:
+            self._statsServer.shutdown()
+            self._statsServer.server_close()
+            self._statsServer = None
+        if not enabled:
+            self._stats = None
+            return
+        if self._stats is None:
+            self._stats = _Stats()
+        self._statsOptions = (lagInterval, dump, dumpInterval)
+        self._start_stats_timers()
+        if address:
+            self._statsServer = _serve_stats(self, address)
+
+    def _start_stats_timers(self):
+        # profile() may be called before the first window, or the root window replaced: the timers go with the root
+        if self._stats is None or not self.root:
+            return
+        lagInterval, dump, dumpInterval = self._statsOptions
+        window = self.root._window
+        if lagInterval and self._statsTimers.get("lag", (None,))[0] is not window:
+            self._heartbeat(lagInterval, time.perf_counter())
+        if dump and self._statsTimers.get("dump", (None,))[0] is not window:
+            self._dump_stats(dump, dumpInterval)
+
+    def _heartbeat(self, interval: int, expected: float):
+        # how late the Tk event loop runs a timer is how long events wait before their handler starts
+        if self._stats is None or not self.root:
+            return
+        now = time.perf_counter()
+        self._stats.add_lag(max(0.0, now - expected))
+        window = self.root._window
+        self._statsTimers["lag"] = (window, window.after(interval, self._heartbeat, interval, now + interval / 1000))
+
+    def _dump_stats(self, path: str, interval: float):
+        if self._stats is None or not self.root:
+            return
+        import json
+        with open(path + ".tmp", "w") as f:
+            json.dump(self.stats(), f, indent=2)
+        os.replace(path + ".tmp", path)
+        window = self.root._window
+        self._statsTimers["dump"] = (window, window.after(int(interval * 1000), self._dump_stats, path, interval))
+
+    def record(self, path: str = None):
+        # every event, bind and action dispatched is logged to path (gzipped for .gz), None stops recording
+        if self._recorder is not None:
+            self._recorder.close()
+            self._recorder = None
+        if path:
+            self._recorder = _Recorder(self, path)
+
+    def replay(self, path: str, speed: float = 1.0, callback=None):
+        # speed 2 plays twice as fast, 0 as fast as possible; callback gets the report at the end
+        if self._replay is not None:
+            self._replay.cancel()
+        self._replay = _Replay(self, path, speed, callback)
+        self._replay.start()
+        return self._replay
+
+    def watch(self, enabled: bool = True, interval: int = 500):
+        if self._watcher:
+            self._watcher.stop()
+            self._watcher = None
+        if enabled and self.root:
+            self._watcher = _Watcher(self, interval)
+
+    def _reload(self, paths: set):
+        for path in paths:
+            if not os.path.isfile(path):
+                continue
+            try:
+                self.cache.load(path)
+            except Exception as e:
+                self.root._window.report_callback_exception(type(e), e, e.__traceback__)
+                return
+        for window in list(self.windows):
+            if window.interface.path in paths:
+                window._reload_interface()
+            if any(p in paths for p in window.lang._paths()):
+                window.set_lang(self.get_lang(window.lang._requested))
+
+    def stats(self):
+        if self._stats is None:
+            return None
+        stats = self._stats.snapshot()
+        stats["timers"] = self.scheduler.stats()
+        return stats
+
+    def every(self, period, func, window=None, name: str = None):
+        return self.scheduler.every(period, func, window, name)
 
-    def create_widget(self, type: str, **kwargs):
-        self.widgets.append(_Widget(self, _MetaWidget(self.app, type, **kwargs)))
-        w = self.widgets[-1]
-        self._widgets.append(tk.Widget(self._window, w.type, kw=w.args))
-        if w.pos[0] == "pack":
-            print(self.widgets[-1])
-            self._widgets[-1].pack(side=w.pos[1])
-        elif w.pos[0] == "place":
-            self._widgets[-1].place(x=w.pos[1], y=w.pos[2])
-        elif w.pos[0] == "grid":
-            self._widgets[-1].grid(row=w.pos[1], column=w.pos[2])
-        return w
+    @property
+    def loop(self):
+        if self._loop is None or self._loop.is_closed():
+            import asyncio
+            self._loop = asyncio.new_event_loop()
+        return self._loop
 
-    def _delete_widget(self, widget: _Widget):
-        i = self.widgets.index(widget)
-        del self.widgets[i]
-        self._widgets[i].destroy()
-        del self._widgets[i]
+    def _async_handler(self, name: str, func):
+        def handler(*args):
+            if getattr(func, "_dropIfRunning", False) and self._tasks.get(name):
+                return None
+            return self.create_task(func(*args), name)
+        return handler
 
-    def open(self):
-        self._window.focus()
-        self._window.mainloop()
+    def create_task(self, coro, name: str = None):
+        task = self.loop.create_task(coro)
+        if name:
+            self._tasks.setdefault(name, set()).add(task)
+        task.add_done_callback(lambda t: self._task_done(t, name))
+        self._drive()
+        return task
 
-    def close(self):
-        del self.app.windows[self.app.windows.index(self)]
-        self._window.destroy()
+    def _task_done(self, task, name: str = None):
+        if name:
+            self._tasks[name].discard(task)
+        if not task.cancelled() and task.exception() and self.root:
+            e = task.exception()
+            self.root._window.report_callback_exception(type(e), e, e.__traceback__)
 
-    def __getitem__(self, item):
-        if type(item) == str:
-            return self._tags[item]
+    def cancel(self, name: str = None):
+        import asyncio
+        if name is None:
+            tasks = asyncio.all_tasks(self.loop)
         else:
-            return self.widgets[item]
-
+            tasks = self._tasks.get(name, ())
+        for task in tasks:
+            task.cancel()
+        self._drive()
 
-class App:
-    def __init__(self, path: str):
-        self.path = path
-        self.windows = []
-        self.run()
+    def running(self, name: str):
+        return bool(self._tasks.get(name))
 
-    @property
-    def root(self):
-        return self.windows[0] if len(self.windows) >= 1 else None
+    def _drive(self):
+        if self._asyncStep is None and self.root:
+            self._asyncStep = self.root._window.after_idle(self._step)
 
-    def get_lang(self, name: str):
-        return _Lang(self.path + "/lang/" + name + ".yaml")
+    def _wake(self, *args):
+        # the selector has events: step now, even if a later asyncio timer is armed. Not in after_idle, Tcl
+        # would keep handling the file event, which stays ready until the loop reads it, and never get idle
+        if self._asyncStep is not None and self.root:
+            try:
+                self.root._window.after_cancel(self._asyncStep)
+            except tk._tkinter.TclError:
+                pass
+        self._step()
 
-    def get_interface(self, name: str, lang: _Lang = None):
-        return _Interface(self, self.path + "/interface/" + name + ".yaml", lang)
+    def _watch_selector(self):
+        # Tk wakes asyncio up when its selector has events (sockets, call_soon_threadsafe) instead of polling
+        # it every asyncTick ms, where Tcl can't watch the selector (Windows) it falls back to polling
+        loop, interp = self.loop, self.root._window.tk
+        if self._selectorWatch is None or self._selectorWatch[:2] != (loop, interp):
+            self._unwatch_selector()
+            try:
+                if not _loop_internals(loop):
+                    raise NotImplementedError
+                fd = loop._selector.fileno()
+                interp.createfilehandler(fd, tk.READABLE, self._wake)
+            except (AttributeError, NotImplementedError, tk._tkinter.TclError):
+                fd = None
+            self._selectorWatch = (loop, interp, fd)
+        return self._selectorWatch[2] is not None
 
-    def create_window(self, interface: _Interface):
-        return _Window(self, interface)
+    def _unwatch_selector(self):
+        if self._selectorWatch is not None and self._selectorWatch[2] is not None:
+            try:
+                self._selectorWatch[1].deletefilehandler(self._selectorWatch[2])
+            except tk._tkinter.TclError:
+                pass
+        self._selectorWatch = None
 
-    def get_command(self, command: str):
-        try:
-            return getattr(self, "command_" + command)
-        except AttributeError:
-            raise CommandNotFoundError(f"Command '{command}' not found")
+    def _step(self):
+        # runs one iteration of the asyncio loop from the Tk event loop, again at once while callbacks are
+        # ready (a finished task still has its done callbacks to run), then sleeps until the next asyncio
+        # timer or selector event, or stops if nothing is left
+        import asyncio
+        self._asyncStep = None
+        loop = self.loop
+        if not loop.is_running():
+            loop.call_soon(loop.stop)
+            loop.run_forever()
+        if not self.root:
+            return
+        if not _loop_internals(loop):
+            # nothing tells when another loop has work: it is stepped every asyncTick ms while it has tasks
+            if asyncio.all_tasks(loop):
+                self._asyncStep = self.root._window.after(self.asyncTick, self._step)
+            return
+        ready = loop._ready
+        if not ready and not asyncio.all_tasks(loop):
+            return
+        if ready:
+            delay = 0
+        else:
+            delay = None if self._watch_selector() else self.asyncTick
+            if loop._scheduled:
+                due = max(0, int((loop._scheduled[0].when() - loop.time()) * 1000))
+                delay = due if delay is None else min(delay, due)
+            if delay is None:
+                return
+        self._asyncStep = self.root._window.after(delay, self._step)
 
-    def get_script(self, script: str = ...):
-        if script == Ellipsis: return getattr(self, "script")
-        try:
-            return getattr(self, "script_" + script)
-        except AttributeError:
-            raise ScriptNotFoundError(f"Script '{script}' not found")
+    def _close_loop(self):
+        if self._loop is None or self._loop.is_closed():
+            return
+        self._unwatch_selector()
+        import asyncio
+        tasks = asyncio.all_tasks(self._loop)
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            self._loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+        self._loop.close()
 
     def script(self, win: _Window):
         pass
@@ -545,49 +4127,1196 @@ class App:
     def error(self, message: str, title: str = ...):
         if title == Ellipsis:
             title = self.path.split("/")[-1]
-        return msgbox.showerror(title, message)
+        return self.backend.dialog("showerror", title, message)
 
     def info(self, message: str, title: str = ...):
         if title == Ellipsis:
             title = self.path.split("/")[-1]
-        return msgbox.showinfo(title, message)
+        return self.backend.dialog("showinfo", title, message)
 
     def warning(self, message: str, title: str = ...):
         if title == Ellipsis:
             title = self.path.split("/")[-1]
-        return msgbox.showwarning(title, message)
+        return self.backend.dialog("showwarning", title, message)
 
     def yesno(self, question: str, title: str = ...):
         if title == Ellipsis:
             title = self.path.split("/")[-1]
-        return msgbox.askyesno(title, question)
+        return self.backend.dialog("askyesno", title, question)
 
     def okcancel(self, message: str, title: str = ...):
         if title == Ellipsis:
             title = self.path.split("/")[-1]
-        return msgbox.askokcancel(title, message)
+        return self.backend.dialog("askokcancel", title, message)
 
     def retrycancel(self, message: str, title: str = ...):
         if title == Ellipsis:
             title = self.path.split("/")[-1]
-        return msgbox.askretrycancel(title, message)
+        return self.backend.dialog("askretrycancel", title, message)
 
     def yesnocancel(self, question: str, title: str = ...):
         if title == Ellipsis:
             title = self.path.split("/")[-1]
-        return msgbox.askyesnocancel(title, question)
+        return self.backend.dialog("askyesnocancel", title, question)
 
 
-if __name__ == "__main__":
-    from importlib.machinery import SourceFileLoader
+def _loop_internals(loop):
+    # the ready queue, timer heap and selector of CPython's asyncio loops are not public: they are only read
+    # on those loops, any other (uvloop, PyPy...) is stepped with the public API and polled
+    import asyncio
+    return sys.implementation.name == "cpython" and type(loop).__module__.startswith("asyncio.") \
+        and isinstance(loop, asyncio.BaseEventLoop) and isinstance(getattr(loop, "_ready", None), deque) \
+        and isinstance(getattr(loop, "_scheduled", None), list)
+
+
+_imageExtensions = (".png", ".gif", ".ppm", ".pgm")
+
+
+def _collect_images(metas, images: list):
+    for mw in metas:
+        image = mw.args.get("image")
+        if type(image) == str and "{" not in image:
+            images.append(image)
+        if mw.children:
+            _collect_images(mw.children, images)
+        if mw.repeat:
+            _collect_images(mw.repeat["widgets"], images)
+
+
+def _read_image(path: str):
+    # runs in a worker thread: only the Tk part of the decoding is left to the main thread
+    import base64
+
+    with open(path, "rb") as f:
+        return base64.b64encode(f.read()).decode("ascii")
+
+
+class _Resources:
+    def __init__(self, app, maxBytes: int = 32 * 1024 * 1024):
+        self.app = app
+        self.maxBytes = maxBytes
+        self._paths = {}
+        self._icons = {}
+        self._data = {}
+        self._images = OrderedDict()
+        self._bytes = 0
+
+    def resolve(self, path: str):
+        try:
+            return self._paths[path]
+        except KeyError:
+            pass
+        if os.path.isabs(path):
+            resolved = path
+        else:
+            resolved = self.app.path + "/" + path
+        self._paths[path] = resolved
+        return resolved
+
+    def prefetch(self, paths):
+        for path in paths:
+            path = self.resolve(path)
+            if path not in self._images and path not in self._data and os.path.isfile(path):
+                self._data[path] = self.app.executor.submit(_read_image, path)
+
+    def _load(self, path: str, master):
+        path = self.resolve(path)
+        entry = self._images.get(path)
+        if entry is not None:
+            self._images.move_to_end(path)
+            return entry
+        future = self._data.pop(path, None)
+        try:
+            data = future.result() if future is not None else _read_image(path)
+            image = tk.PhotoImage(master=master, data=data)
+        except (OSError, tk._tkinter.TclError):
+            raise InvalidFileError(f"Invalid image '{path}'")
+        # [image, widgets using it, bytes]
+        entry = self._images[path] = [image, 0, image.width() * image.height() * 4]
+        self._bytes += entry[2]
+        self._trim()
+        return entry
+
+    def _trim(self):
+        # least recently used first, images shown by a widget are never dropped
+        for path in list(self._images):
+            if self._bytes <= self.maxBytes:
+                break
+            entry = self._images[path]
+            if not entry[1]:
+                del self._images[path]
+                self._bytes -= entry[2]
+
+    def image(self, path: str, master=None):
+        return self._load(path, master or (self.app.root and self.app.root._window))[0]
+
+    def acquire(self, path: str, master=None):
+        entry = self._load(path, master or (self.app.root and self.app.root._window))
+        entry[1] += 1
+        return entry[0]
+
+    def release(self, path: str):
+        entry = self._images.get(self.resolve(path))
+        if entry is not None and entry[1]:
+            entry[1] -= 1
+            if not entry[1]:
+                self._trim()
+
+    def set_icon(self, window, path: str):
+        # returns the path really used, a broken icon falls back to defaultIcon.ico once and is remembered
+        path = self._icons.get(path, path)
+        try:
+            if path.lower().endswith(_imageExtensions):
+                window.iconphoto(False, self.image(path, window))
+            else:
+                window.iconbitmap(path)
+            return path
+        except (InvalidFileError, tk._tkinter.TclError):
+            fallback = self._icons[path] = os.path.join(sys.path[0], "./defaultIcon.ico")
+            window.iconbitmap(fallback)
+            return fallback
+
+    def clear(self):
+        for path in [path for path, entry in self._images.items() if not entry[1]]:
+            self._bytes -= self._images.pop(path)[2]
+        self._data.clear()
+
+
+class _Timer:
+    def __init__(self, scheduler, period: float, func, window, name: str):
+        self.scheduler = scheduler
+        self.period = period
+        self.func = func
+        self.window = window
+        self.name = name
+        self.due = None
+        self.paused = False
+        self.cancelled = False
+        self.runs = 0
+        self.skipped = 0
+        self.overruns = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.maxLate = 0.0
+
+    def pause(self):
+        self.paused = True
+
+    def resume(self):
+        if self.paused and not self.cancelled:
+            self.paused = False
+            self.scheduler._push(self, time.perf_counter() + self.period)
+
+    def cancel(self):
+        self.cancelled = True
+        if self in self.scheduler.timers:
+            self.scheduler.timers.remove(self)
+
+    def snapshot(self):
+        return {
+            "period_ms": self.period * 1000,
+            "runs": self.runs,
+            "skipped": self.skipped,
+            "overruns": self.overruns,
+            "mean_ms": self.total / self.runs * 1000 if self.runs else 0.0,
+            "max_ms": self.max * 1000,
+            "max_late_ms": self.maxLate * 1000,
+            "paused": self.paused,
+        }
+
+
+class _Scheduler:
+    # every timer of the app on one after() tick, due times stay on their grid so they don't drift
+    slack = 0.002
+
+    def __init__(self, app):
+        self.app = app
+        self.timers = []
+        self._heap = []
+        self._seq = 0
+        self._after = None
+        self._mapped = set()
+
+    def every(self, period, func, window=None, name: str = None):
+        ms = _parse_period(period) if type(period) == str else float(period)
+        if ms <= 0:
+            raise InvalidEventError(f"Invalid period '{period}'")
+        timer = _Timer(self, ms / 1000, func, window, name or getattr(func, "__name__", str(func)))
+        self.timers.append(timer)
+        if window is not None and id(window) not in self._mapped:
+            # a window shown again (deiconify) resumes its timers
+            self._mapped.add(id(window))
+            window._window.bind("<Map>", lambda e, window=window: self._on_map(e, window), "+")
+        self._push(timer, time.perf_counter() + timer.period)
+        return timer
+
+    def _push(self, timer: _Timer, due: float, arm: bool = True):
+        timer.due = due
+        self._seq += 1
+        heapq.heappush(self._heap, (due, self._seq, timer))
+        if arm:
+            self._arm()
+
+    def _arm(self):
+        # a single pending after(), for the earliest due timer
+        heap = self._heap
+        while heap and (heap[0][2].cancelled or heap[0][2].paused or heap[0][0] != heap[0][2].due):
+            heapq.heappop(heap)
+        if not heap or self.app.root is None:
+            return
+        due = heap[0][0]
+        if self._after is not None:
+            if self._after[2] <= due:
+                return
+            try:
+                self._after[0].after_cancel(self._after[1])
+            except tk._tkinter.TclError:
+                pass
+        root = self.app.root._window
+        delay = max(0, int((due - time.perf_counter()) * 1000 + 0.999))
+        self._after = (root, root.after(delay, self._tick), due)
+
+    def _running(self, window):
+        return window in self.app.windows and window._window.state() != "withdrawn"
+
+    def _tick(self):
+        self._after = None
+        now = time.perf_counter()
+        try:
+            while self._heap and self._heap[0][0] <= now + self.slack:
+                due, _, timer = heapq.heappop(self._heap)
+                if timer.cancelled or timer.paused or due != timer.due:
+                    continue
+                if timer.window is not None and not self._running(timer.window):
+                    timer.paused = True
+                    continue
+                # runs that were missed are skipped, never replayed
+                missed = int(max(0.0, now - due) / timer.period)
+                timer.skipped += missed
+                timer.maxLate = max(timer.maxLate, now - due)
+                self._push(timer, due + (missed + 1) * timer.period, False)
+                start = time.perf_counter()
+                try:
+                    self._run(timer)
+                finally:
+                    duration = time.perf_counter() - start
+                    timer.runs += 1
+                    timer.total += duration
+                    timer.max = max(timer.max, duration)
+                    if duration > timer.period:
+                        timer.overruns += 1
+        finally:
+            self._arm()
+
+    def _run(self, timer: _Timer):
+        if type(timer.func) == str:
+            (timer.window or self.app.root).run(timer.func)
+        elif timer.window is not None:
+            timer.func(timer.window)
+        else:
+            timer.func()
+
+    def _on_map(self, event, window):
+        if event.widget is window._window:
+            self.resume_window(window)
+
+    def pause_window(self, window):
+        for timer in self.timers:
+            if timer.window is window:
+                timer.pause()
+
+    def resume_window(self, window):
+        for timer in self.timers:
+            if timer.window is window:
+                timer.resume()
+
+    def cancel_window(self, window):
+        for timer in [t for t in self.timers if t.window is window]:
+            timer.cancel()
+        self._mapped.discard(id(window))
+
+    def stats(self):
+        stats = {}
+        # also called from the stats server thread
+        for timer in list(self.timers):
+            name = timer.name
+            n = 1
+            while name in stats:
+                n += 1
+                name = f"{timer.name} #{n}"
+            stats[name] = timer.snapshot()
+        return stats
+
+
+class _Pool:
+    def __init__(self, interface):
+        self.interface = interface
+        self.windows = []
+        self.size = 0
+        self.prewarm = 0
+        self.warming = False
+        self.reset = None
+
+
+class _Binding:
+    __slots__ = ["widget", "deps", "render", "path", "last", "trace"]
+
+    def __init__(self, widget, deps, render, path=None):
+        self.widget = widget
+        self.deps = deps
+        self.render = render
+        self.path = path
+        self.last = _missing
+        self.trace = None
+
+
+def _coerce(value, like):
+    # a widget gives back a str (entry) or an int (checkbutton, scale), the state keeps the type it had
+    if like is None or type(value) == type(like):
+        return value
+    try:
+        if type(like) == bool:
+            return value not in (0, "", "0", "false", "False")
+        if type(like) in (int, float, str):
+            return type(like)(value)
+    except ValueError:
+        # not a number (yet), e.g. "" or "-" while typing
+        return _missing
+    return value
+
+
+def _compile_binding(state, spec: str):
+    # "user.name" is a path, "{user.first} {user.last}" a template over paths
+    if "{" not in spec:
+        return (spec,), lambda: state.get(spec), spec
+    parts = []
+    for literal, field, formatSpec, conversion in string.Formatter().parse(spec):
+        parts.append((literal, field, formatSpec, conversion))
+    deps = tuple(field for _, field, _, _ in parts if field)
+
+    def render():
+        out = []
+        for literal, field, formatSpec, conversion in parts:
+            out.append(literal)
+            if field:
+                value = state.get(field, "")
+                if conversion == "r":
+                    value = repr(value)
+                elif conversion == "s":
+                    value = str(value)
+                out.append(format(value, formatSpec or ""))
+        return "".join(out)
+    return deps, render, None
+
+
+class _State:
+    def __init__(self, app):
+        self.app = app
+        self.frame = 16
+        self._data = {}
+        self._deps = {}
+        self._children = {}
+        self._dirty = set()
+        self._timer = None
+        self._pushing = None
+
+    def get(self, path: str, default=None):
+        value = self._data
+        for key in path.split("."):
+            if type(value) != dict or key not in value:
+                return default
+            value = value[key]
+        return value
+
+    def __getitem__(self, path: str):
+        return self.get(path)
+
+    def __setitem__(self, path: str, value):
+        self.set(path, value)
+
+    def set(self, path: str, value):
+        keys = path.split(".")
+        data = self._data
+        for key in keys[:-1]:
+            if type(data.get(key)) != dict:
+                data[key] = {}
+            data = data[key]
+        if keys[-1] in data and data[keys[-1]] == value and type(value) != dict:
+            return
+        data[keys[-1]] = value
+        self._touch(path)
+
+    def update(self, values: dict = None, **kwargs):
+        for path, value in dict(values or {}, **kwargs).items():
+            self.set(path, value)
+
+    def _touch(self, path: str):
+        # bindings on the path, on one of its parents, or on one of its children
+        parts = path.split(".")
+        for i in range(1, len(parts) + 1):
+            self._dirty.update(self._deps.get(".".join(parts[:i]), ()))
+        for child in self._children.get(path, ()):
+            self._dirty.update(self._deps.get(child, ()))
+        if self._dirty and self._timer is None and self.app.root:
+            self._timer = self.app.root._window.after(self.frame, self.flush)
+
+    def bind(self, widget, spec, deps=None):
+        self.unbind(widget)
+        if callable(spec):
+            binding = _Binding(widget, tuple(deps or ()), lambda: spec(self))
+        else:
+            binding = _Binding(widget, *_compile_binding(self, str(spec)))
+        widget._binding = binding
+        for dep in binding.deps:
+            self._deps.setdefault(dep, set()).add(binding)
+            parts = dep.split(".")
+            for i in range(1, len(parts)):
+                self._children.setdefault(".".join(parts[:i]), set()).add(dep)
+        if binding.path and widget.type in _inputTypes:
+            # two way binding: what the user types goes back into the state
+            var = widget.var or widget.intVar
+            binding.trace = var.trace_add("write", lambda *_: self._from_widget(binding, var))
+        self._push(binding)
+        return binding
+
+    def unbind(self, widget):
+        binding = widget._binding
+        if binding is None:
+            return
+        widget._binding = None
+        self._dirty.discard(binding)
+        if binding.trace is not None:
+            try:
+                widget._var.trace_remove("write", binding.trace)
+            except tk._tkinter.TclError:
+                pass
+            binding.trace = None
+        for dep in binding.deps:
+            bindings = self._deps.get(dep)
+            if bindings:
+                bindings.discard(binding)
+                if not bindings:
+                    del self._deps[dep]
+            if dep not in self._deps:
+                # no binding left on the path: its parents stop pointing to it
+                parts = dep.split(".")
+                for i in range(1, len(parts)):
+                    parent = ".".join(parts[:i])
+                    children = self._children.get(parent)
+                    if children:
+                        children.discard(dep)
+                        if not children:
+                            del self._children[parent]
+
+    def _from_widget(self, binding, var):
+        if binding.widget._binding is not binding or self._pushing is binding:
+            return
+        try:
+            value = _coerce(var.get(), self.get(binding.path))
+        except tk._tkinter.TclError:
+            return
+        if value is _missing or (binding.last is None and value in ("", 0)):
+            return
+        binding.last = value
+        self.set(binding.path, value)
+
+    def _push(self, binding):
+        value = binding.render()
+        if value == binding.last:
+            return
+        binding.last = value
+        w = binding.widget
+        self._pushing = binding
+        try:
+            if w.type in _varTypes or w.type in ["text", "virtuallist"]:
+                w.set_value((0 if w.type in _intVarTypes else "") if value is None else value)
+            else:
+                w.set("text", "" if value is None else value)
+        finally:
+            self._pushing = None
+
+    def flush(self):
+        # at most once per frame: every dirty binding is rendered once, only changed values reach Tk
+        self._timer = None
+        dirty, self._dirty = self._dirty, set()
+        if not dirty:
+            return
+        with self.app.batch():
+            for binding in dirty:
+                self._push(binding)
+
+
+class _Watcher:
+    # inotify on Linux (through the Tk event loop, no polling), polling with after() elsewhere
+    def __init__(self, app, interval: int):
+        self.app = app
+        self.interval = interval
+        self.window = app.root._window
+        self.dirs = [d for d in [app.path + "/interface", app.path + "/lang"] if os.path.isdir(d)]
+        self.fd = None
+        self.wds = {}
+        self.pending = set()
+        self._timer = None
+        self._flushTimer = None
+        if sys.platform.startswith("linux") and hasattr(self.window.tk, "createfilehandler"):
+            self._start_inotify()
+        if self.fd is None:
+            self.mtimes = self._scan()
+            self._timer = self.window.after(self.interval, self._poll)
+
+    def _start_inotify(self):
+        import ctypes
+        import ctypes.util
+
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+            fd = libc.inotify_init1(os.O_NONBLOCK)
+        except (OSError, AttributeError):
+            return
+        if fd < 0:
+            return
+        # IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE | IN_DELETE
+        for d in self.dirs:
+            wd = libc.inotify_add_watch(fd, os.fsencode(d), 0x8 | 0x80 | 0x100 | 0x200)
+            if wd >= 0:
+                self.wds[wd] = d
+        self.fd = fd
+        self.window.tk.createfilehandler(fd, tk.READABLE, self._on_inotify)
+
+    def _on_inotify(self, fd, mask):
+        import struct
+
+        try:
+            data = os.read(self.fd, 65536)
+        except BlockingIOError:
+            return
+        i = 0
+        while i + 16 <= len(data):
+            wd, _, _, length = struct.unpack_from("iIII", data, i)
+            name = data[i + 16:i + 16 + length].rstrip(b"\0").decode(errors="replace")
+            i += 16 + length
+            if wd in self.wds and name.endswith(".yaml"):
+                self.pending.add(self.wds[wd] + "/" + name)
+        self._schedule()
+
+    def _scan(self):
+        mtimes = {}
+        for d in self.dirs:
+            for name in os.listdir(d):
+                if name.endswith(".yaml"):
+                    try:
+                        mtimes[d + "/" + name] = os.stat(d + "/" + name).st_mtime_ns
+                    except FileNotFoundError:
+                        pass
+        return mtimes
+
+    def _poll(self):
+        mtimes = self._scan()
+        self.pending.update(p for p in set(mtimes) | set(self.mtimes) if mtimes.get(p) != self.mtimes.get(p))
+        self.mtimes = mtimes
+        self._schedule()
+        self._timer = self.window.after(self.interval, self._poll)
+
+    def _schedule(self):
+        # editors write files in several steps, wait for them to settle
+        if self.pending and self._flushTimer is None:
+            self._flushTimer = self.window.after(50, self._flush)
+
+    def _flush(self):
+        self._flushTimer = None
+        paths, self.pending = self.pending, set()
+        self.app._reload(paths)
+
+    def stop(self):
+        for timer in [self._timer, self._flushTimer]:
+            if timer:
+                try:
+                    self.window.after_cancel(timer)
+                except tk._tkinter.TclError:
+                    pass
+        if self.fd is not None:
+            try:
+                self.window.tk.deletefilehandler(self.fd)
+            except tk._tkinter.TclError:
+                pass
+            os.close(self.fd)
+            self.fd = None
+
+
+class _Histogram:
+    # power of two buckets of microseconds
+    __slots__ = ["count", "total", "max", "buckets"]
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.buckets = {}
+
+    def add(self, seconds: float):
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+        bucket = int(seconds * 1e6).bit_length()
+        self.buckets[bucket] = self.buckets.get(bucket, 0) + 1
+
+    def percentile(self, p: float):
+        target = self.count * p
+        seen = 0
+        for bucket in sorted(self.buckets):
+            seen += self.buckets[bucket]
+            if seen >= target:
+                return min((1 << bucket) / 1000, self.max * 1000)
+        return self.max * 1000
+
+    def snapshot(self):
+        return {
+            "count": self.count,
+            "mean_ms": self.total / self.count * 1000 if self.count else 0.0,
+            "max_ms": self.max * 1000,
+            "p50_ms": self.percentile(0.5),
+            "p90_ms": self.percentile(0.9),
+            "p99_ms": self.percentile(0.99),
+            "buckets_us": {str(1 << b): n for b, n in sorted(self.buckets.items())},
+        }
+
+
+class _Stats:
+    def __init__(self):
+        self.started = time.time()
+        self.commands = {}
+        self.scripts = {}
+        self.tcl = {}
+        self.lag = _Histogram()
+        self._lock = threading.Lock()
+
+    def record(self, kind: str, name: str, seconds: float):
+        with self._lock:
+            histograms = getattr(self, kind)
+            if name not in histograms:
+                histograms[name] = _Histogram()
+            histograms[name].add(seconds)
+
+    def count(self, name: str, n: int = 1):
+        with self._lock:
+            self.tcl[name] = self.tcl.get(name, 0) + n
+
+    def add_lag(self, seconds: float):
+        with self._lock:
+            self.lag.add(seconds)
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                "uptime_s": time.time() - self.started,
+                "commands": {k: v.snapshot() for k, v in self.commands.items()},
+                "scripts": {k: v.snapshot() for k, v in self.scripts.items()},
+                "tcl_calls": dict(self.tcl),
+                "event_loop_lag": self.lag.snapshot(),
+            }
 
-    if len(sys.argv) > 1:
-        if sys.argv[1][-1] == "/":
-            sys.argv[1] = sys.argv[1][0:-1]
+
+def _serve_stats(app, address):
+    import http.server
+    import json
+    import socketserver
+
+    class Handler(http.server.BaseHTTPRequestHandler):
+        def do_GET(self):
+            body = json.dumps(app.stats()).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    if type(address) == str:
+        import stat
+        # only a socket left by a previous run is replaced, anything else makes bind fail
         try:
-            app = SourceFileLoader("main.App", sys.argv[1] + "/main.py").load_module()
+            if stat.S_ISSOCK(os.stat(address).st_mode):
+                os.remove(address)
         except FileNotFoundError:
-            raise FileNotFoundError(f"No such file or directory: '{sys.argv[1] + '/main.py'}'")
-        app.App(sys.argv[1])
+            pass
+
+        class Server(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+            daemon_threads = True
+
+        server = Server(address, Handler)
+    else:
+        server = http.server.ThreadingHTTPServer(tuple(address), Handler)
+        server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="pyWin-stats", daemon=True).start()
+    return server
+
+
+def _window_key(window):
+    # interface name and rank among the open windows of that interface, e.g. ["editor", 1]
+    name = os.path.basename(window.interface.path)[:-5]
+    if window not in window.app.windows:
+        return name, 0
+    return name, [w for w in window.app.windows if w.interface.path == window.interface.path].index(window)
+
+
+def _open_session(path: str, mode: str):
+    if path.endswith(".gz"):
+        import gzip
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+class _Recorder:
+    # one json line per dispatched event: [seconds, interface, window rank, widget tag or id, "run" or "cmd",
+    # handler name, [event type, keysym], {tag: value} of the inputs written since the previous line of the window,
+    # by the user or by a handler]
+    def __init__(self, app, path: str):
+        import atexit
+        import json
+        self._dumps = json.JSONEncoder(separators=(",", ":"), default=str).encode
+        self.path = path
+        self.file = _open_session(path, "w")
+        self.file.write(self._dumps({"pyWin": 1, "app": os.path.basename(app.path), "time": time.time()}) + "\n")
+        self.started = time.perf_counter()
+        self.count = 0
+        self._changed = {}
+        self._watched = {}
+        self._interp = None
+        self._command = f"pyWinRecord{id(self)}"
+        # the values set before recording started go with the first line of each window
+        for window in app.windows + [w for pool in app._pools.values() for w in pool.windows]:
+            for w in window._ids.values():
+                if w._widget is not None and w.tag is not None and w.type in _inputTypes:
+                    self.watch(w)
+                    self._changed.setdefault(window, set()).add(w)
+        atexit.register(self.close)
+
+    def watch(self, w):
+        # a Tcl trace on the variable of each tagged input, by name so that the inputs python never read are
+        # recorded too, marks it changed, values are only read by record()
+        if w.tag is None or w.type not in _inputTypes:
+            return
+        if self._interp is None:
+            self._interp = w.window._window.tk
+            self._interp.createcommand(self._command, self._traced)
+        name = w._var_name
+        # the variable of a deleted widget was unset with its traces, a new one may have the same name
+        self._interp.call("trace", "remove", "variable", name, "write", self._command)
+        self._interp.call("trace", "add", "variable", name, "write", self._command)
+        self._watched[name] = w
+
+    def _traced(self, name, index, op):
+        w = self._watched.get(name.lstrip(":"))
+        if w is not None and self.file is not None and w.window._ids.get(w.id) is w:
+            self._changed.setdefault(w.window, set()).add(w)
+
+    def record(self, window, kind: str, name: str, widget, event):
+        if self.file is None:
+            return
+        values = {}
+        for w in self._changed.pop(window, ()):
+            if window._ids.get(w.id) is w:
+                values[w.tag] = w.get_value()
+        if event is not None:
+            event = [str(getattr(event, "type", "")), getattr(event, "keysym", "??")]
+        key = None if widget is None else widget.tag if widget.tag is not None else widget.id
+        self.file.write(self._dumps([round(time.perf_counter() - self.started, 4), *_window_key(window), key, kind,
+                                     name, event, values]) + "\n")
+        self.count += 1
+
+    def forget(self, window, destroyed: bool = False):
+        # a recycled window was reset to its interface's values, which a replayed window starts with too
+        self._changed.pop(window, None)
+        if destroyed:
+            # its variables are unset with their traces
+            for w in window._ids.values():
+                if self._watched.get(w._var_name) is w:
+                    del self._watched[w._var_name]
+
+    def close(self):
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+        if self._interp is not None:
+            try:
+                for name in self._watched:
+                    self._interp.call("trace", "remove", "variable", name, "write", self._command)
+                self._interp.deletecommand(self._command)
+            except tk.TclError:
+                # the application was destroyed first
+                pass
+            self._interp = None
+            self._watched = {}
+
+
+def _read_session(path: str):
+    import json
+    with _open_session(path, "r") as f:
+        lines = [line for line in f if line.strip()]
+    try:
+        header = json.loads(lines[0]) if lines else None
+        if type(header) != dict or header.get("pyWin") != 1:
+            raise ValueError("no header")
+        return [json.loads(line) for line in lines[1:]]
+    except ValueError:
+        raise InvalidFileError(f"Invalid file '{path}', not a pyWin session")
+
+
+class _Replay:
+    # feeds a recorded session back into _Window.run/_Window.cmd from the Tk event loop
+    def __init__(self, app, path: str, speed: float, callback):
+        self.app = app
+        self.entries = _read_session(path)
+        self.speed = speed
+        self.callback = callback
+        self.position = 0
+        self.errors = 0
+        self.missing = 0
+        self.commands = {}
+        self.scripts = {}
+        self.lag = _Histogram()
+        self.started = time.perf_counter()
+        self.finished = None
+        self._timer = None
+
+    def start(self):
+        self.started = time.perf_counter()
+        self._step()
+
+    def cancel(self):
+        if self._timer and self.app.root:
+            try:
+                self.app.root._window.after_cancel(self._timer)
+            except tk._tkinter.TclError:
+                pass
+        self._timer = None
+        self._finish()
+
+    def _step(self):
+        self._timer = None
+        sliceStart = time.perf_counter()
+        while self.position < len(self.entries):
+            if not self.app.root:
+                break
+            now = time.perf_counter()
+            if self.speed:
+                due = self.started + self.entries[self.position][0] / self.speed
+                if due > now + 0.001:
+                    self._timer = self.app.root._window.after(int((due - now) * 1000), self._step)
+                    return
+                self.lag.add(max(0.0, now - due))
+            elif now - sliceStart > 0.05:
+                # as fast as possible, but Tk still redraws and runs its timers between two slices
+                self._timer = self.app.root._window.after(0, self._step)
+                return
+            self.position += 1
+            self._play(self.entries[self.position - 1])
+        self._finish()
+
+    def _play(self, entry):
+        try:
+            _, interface, rank, key, kind, name, _, values = entry
+        except ValueError:
+            self.errors += 1
+            return
+        windows = [w for w in self.app.windows if os.path.basename(w.interface.path)[:-5] == interface]
+        if rank >= len(windows):
+            self.missing += 1
+            return
+        window = windows[rank]
+        for tag, value in values.items():
+            if tag in window._tags or tag in window._lazyTags:
+                window._materialize(tag).set_value(value)
+        widget = None
+        if key is not None:
+            widget = window._materialize(key) if type(key) == str and (key in window._tags or key in window._lazyTags) \
+                else window._ids.get(key)
+            if widget is None:
+                self.missing += 1
+                return
+        start = time.perf_counter()
+        try:
+            if kind == "run":
+                window.run(name)
+            else:
+                window.cmd(name, widget)
+        except Exception as e:
+            self.errors += 1
+            if self.app.root:
+                self.app.root._window.report_callback_exception(type(e), e, e.__traceback__)
+        finally:
+            histograms = self.scripts if kind == "run" else self.commands
+            histograms.setdefault(name, _Histogram()).add(time.perf_counter() - start)
+
+    def _finish(self):
+        if self.finished is not None:
+            return
+        self.finished = time.perf_counter()
+        if self.app._replay is self:
+            self.app._replay = None
+        if self.callback:
+            self.callback(self.report())
+
+    def report(self):
+        duration = (self.finished or time.perf_counter()) - self.started
+        return {
+            "events": self.position,
+            "total": len(self.entries),
+            "errors": self.errors,
+            "missing": self.missing,
+            "duration_s": duration,
+            "throughput_per_s": self.position / duration if duration else 0.0,
+            "lag": self.lag.snapshot(),
+            "commands": {name: h.snapshot() for name, h in sorted(self.commands.items())},
+            "scripts": {name: h.snapshot() for name, h in sorted(self.scripts.items())},
+        }
+
+
+_bundleMagic = b"PYWIN-BUNDLE\x001\n"
+
+
+def _check_widgets(widgets, path: str, images: list = None):
+    if type(widgets) != list:
+        raise InvalidFileError(f"Invalid file '{path}', 'widgets' must be a list")
+    for i, w in enumerate(widgets):
+        if type(w) != dict or "type" not in w:
+            raise InvalidWidgetError(f"Invalid widget with id {i} in '{path}'")
+        image = w.get("image")
+        if images is not None and type(image) == str and "{" not in image and not _is_lang_key(image):
+            images.append(image)
+        if "children" in w:
+            _check_widgets(w["children"], path, images)
+        for page in w.get("pages", []):
+            _check_widgets(page.get("widgets", []), path, images)
+        repeat = w.get("repeat")
+        if images is not None and repeat:
+            _check_widgets(repeat.get("widgets", []) if type(repeat) == dict else repeat, path, images)
+
+
+def bundle(folder: str, output: str = None):
+    import importlib.util
+    import marshal
+
+    folder = folder.rstrip("/")
+    output = output or folder + ".pywb"
+    cache = _YamlCache()
+    files = {}
+    resources = {}
+    images = []
+    for sub in ["interface", "lang"]:
+        directory = os.path.join(folder, sub)
+        if not os.path.isdir(directory):
+            continue
+        for name in sorted(os.listdir(directory)):
+            if not name.endswith(".yaml"):
+                continue
+            data = cache.load(os.path.join(directory, name))
+            if sub == "interface":
+                _check_widgets(data.get("widgets", []), os.path.join(directory, name), images)
+                icon = data.get("icon")
+                if type(icon) == str and not _is_lang_key(icon) and os.path.isfile(os.path.join(folder, icon)):
+                    resources[icon] = None
+            files[sub + "/" + name] = data
+    for name in os.listdir(folder):
+        if name.endswith(".ico"):
+            resources[name] = None
+    for image in images:
+        # paths relative to the app folder, the bundle is unpacked in a folder of its own
+        name = os.path.normpath(image).replace(os.sep, "/")
+        if not os.path.isabs(name) and not name.startswith("../") and os.path.isfile(os.path.join(folder, name)):
+            resources[name] = None
+    for name in resources:
+        with open(os.path.join(folder, name), "rb") as f:
+            resources[name] = f.read()
+    try:
+        with open(folder + "/main.py", "r") as f:
+            source = f.read()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"No such file or directory: '{folder + '/main.py'}'")
+    content = {
+        "name": os.path.basename(os.path.abspath(folder)),
+        "source": source,
+        "magic": importlib.util.MAGIC_NUMBER,
+        "code": marshal.dumps(compile(source, folder + "/main.py", "exec")),
+        "files": files,
+        "resources": resources,
+    }
+    with open(output, "wb") as f:
+        f.write(_bundleMagic)
+        pickle.dump(content, f, pickle.HIGHEST_PROTOCOL)
+    return output
+
+
+def _open_bundle(path: str):
+    import mmap
+
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+        if m[:len(_bundleMagic)] != _bundleMagic:
+            raise InvalidFileError(f"Invalid bundle '{path}'")
+        view = memoryview(m)[len(_bundleMagic):]
+        try:
+            return pickle.loads(view)
+        finally:
+            view.release()
+
+
+class _StartupProfile:
+    def __init__(self):
+        self.start = _importStart
+        self.phases = [("import pyWin", _importStart, time.perf_counter())]
+        self.imports = []
+        self._depth = 0
+        self.done = False
+
+    @contextmanager
+    def phase(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases.append((name, start, time.perf_counter()))
+
+    def install(self):
+        import builtins
+
+        _import = builtins.__import__
+
+        def timed_import(name, *args, **kwargs):
+            level = args[3] if len(args) > 3 else kwargs.get("level", 0)
+            if level or name in sys.modules:
+                return _import(name, *args, **kwargs)
+            entry = [name, self._depth, time.perf_counter(), 0.0]
+            self.imports.append(entry)
+            self._depth += 1
+            try:
+                return _import(name, *args, **kwargs)
+            finally:
+                self._depth -= 1
+                entry[3] = time.perf_counter() - entry[2]
+
+        builtins.__import__ = timed_import
+
+    def report(self):
+        if self.done:
+            return
+        self.done = True
+        end = time.perf_counter()
+        out = sys.stderr
+        out.write("pyWin startup profile\n")
+        for name, start, stop in self.phases:
+            out.write(f"  {name:<24} {(stop - start) * 1000:9.2f} ms\n")
+        out.write(f"  {'first window shown':<24} {(end - self.start) * 1000:9.2f} ms (total)\n")
+        out.write("import time: self [us] | cumulative | imported package\n")
+        for i, (name, depth, start, cumulative) in enumerate(self.imports):
+            children = sum(c for _, d, _, c in self._children(i))
+            out.write(f"import time: {int((cumulative - children) * 1e6):>9} | {int(cumulative * 1e6):>10} | "
+                      f"{'  ' * depth}{name}\n")
+        out.flush()
+
+    def _children(self, i):
+        depth = self.imports[i][1]
+        for entry in self.imports[i + 1:]:
+            if entry[1] <= depth:
+                break
+            if entry[1] == depth + 1:
+                yield entry
+
+
+_startupProfile = None
+_sessionRecord = None
+_sessionReplay = None
+_sessionBackend = None
+
+
+def _replay_done(app, report: dict):
+    # --replay prints the report and quits, for load tests under Xvfb
+    import json
+    print(json.dumps(report, indent=2))
+    if app.root:
+        app.root._window.quit()
+
+
+def _launch(target: str):
+    import importlib.util
+    import marshal
+    import types
+
+    kwargs = {}
+    if os.path.isfile(target):
+        with _startupProfile.phase("read bundle") if _startupProfile else ExitStack():
+            content = _open_bundle(target)
+            import atexit
+            import shutil
+            import tempfile
+            root = tempfile.mkdtemp(prefix="pyWin-")
+            atexit.register(shutil.rmtree, root, True)
+            path = os.path.join(root, content["name"])
+            for name, data in content["resources"].items():
+                os.makedirs(os.path.dirname(os.path.join(path, name)), exist_ok=True)
+                with open(os.path.join(path, name), "wb") as f:
+                    f.write(data)
+            os.makedirs(path, exist_ok=True)
+            kwargs = {"cacheDir": None, "bundle": content["files"]}
+        with _startupProfile.phase("load main.py") if _startupProfile else ExitStack():
+            main = types.ModuleType("main")
+            main.__file__ = path + "/main.py"
+            if content["magic"] == importlib.util.MAGIC_NUMBER:
+                code = marshal.loads(content["code"])
+            else:
+                code = compile(content["source"], main.__file__, "exec")
+            sys.modules["main"] = main
+            exec(code, main.__dict__)
+    else:
+        path = target.rstrip("/")
+        with _startupProfile.phase("load main.py") if _startupProfile else ExitStack():
+            spec = importlib.util.spec_from_file_location("main", path + "/main.py")
+            if not os.path.isfile(path + "/main.py"):
+                raise FileNotFoundError(f"No such file or directory: '{path + '/main.py'}'")
+            main = importlib.util.module_from_spec(spec)
+            sys.modules["main"] = main
+            spec.loader.exec_module(main)
+    if _sessionBackend:
+        kwargs["backend"] = _sessionBackend
+    app = main.App(path, **kwargs)
+    if isinstance(app.backend, _NullBackend):
+        # window.open() doesn't block without a display
+        app.backend.mainloop()
+
+
+if __name__ == "__main__":
+    # main.py does "from pyWin import App": make it reuse this module instead of importing it a second time
+    sys.modules.setdefault("pyWin", sys.modules["__main__"])
+
+    args = sys.argv[1:]
+    if "--profile-startup" in args:
+        args.remove("--profile-startup")
+        _startupProfile = _StartupProfile()
+        _startupProfile.install()
+    if "--record" in args[:-1]:
+        i = args.index("--record")
+        _sessionRecord = args.pop(i + 1)
+        args.pop(i)
+    if "--backend" in args[:-1]:
+        i = args.index("--backend")
+        _sessionBackend = args.pop(i + 1)
+        args.pop(i)
+    if "--replay" in args[:-1]:
+        i = args.index("--replay")
+        _sessionReplay = (args.pop(i + 1), 1.0)
+        args.pop(i)
+        if "--speed" in args[:-1]:
+            i = args.index("--speed")
+            _sessionReplay = (_sessionReplay[0], float(args.pop(i + 1)))
+            args.pop(i)
+
+    if len(args) >= 2 and args[0] == "bundle":
+        print(bundle(args[1], args[2] if len(args) > 2 else None))
+    elif len(args) >= 1:
+        _launch(args[0])
     else:
-        print("Usage: python pyWin.py <folderPath>")
+        print("Usage: python pyWin.py [--profile-startup] [--backend tk|null] [--record file] "
+              "[--replay file [--speed N]] <folderPath|bundlePath>\n"
+              "       python pyWin.py bundle <folderPath> [output]")
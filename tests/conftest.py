@@ -0,0 +1,85 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import pyWin  # noqa: E402
+
+MAIN = """\
+title: main
+size: 300, 200
+widgets:
+  - type: entry
+    tag: name
+    events: ["Return enter"]
+  - type: label
+    tag: lab
+    text: lab
+  - type: checkbutton
+    tag: flag
+  - type: scale
+    tag: level
+  - type: button
+    tag: go
+    action: go
+  - type: text
+    tag: log
+  - type: table
+    tag: tab
+    columns: [name, {name: age, type: int}]
+  - type: canvas
+    tag: cv
+  - type: notebook
+    tag: nb
+    pages:
+      - title: one
+        widgets:
+          - type: label
+            tag: p1
+      - title: two
+        widgets:
+          - type: virtuallist
+            tag: p2
+"""
+
+
+class TestApp(pyWin.App):
+    __test__ = False
+
+    def run(self):
+        self.log = []
+        self.window = self.create_window(self.get_interface("main"))
+
+    def command_enter(self, window, widget):
+        self.log.append(("enter", widget.get_value()))
+
+    def command_go(self, window, widget):
+        self.log.append("go")
+
+
+def write_app(root, interfaces: dict, langs: dict = None):
+    for sub, files in [("interface", interfaces), ("lang", langs or {})]:
+        os.makedirs(os.path.join(root, sub), exist_ok=True)
+        for name, text in files.items():
+            with open(os.path.join(root, sub, name + ".yaml"), "w", encoding="utf-8") as f:
+                f.write(text)
+
+
+@pytest.fixture
+def make_app(tmp_path):
+    # an app on the null backend, no display needed
+    apps = []
+
+    def make(cls=TestApp, interfaces=None, langs=None, **kwargs):
+        write_app(str(tmp_path), interfaces or {"main": MAIN}, langs)
+        app = cls(str(tmp_path), cacheDir=None, backend="null", **kwargs)
+        apps.append(app)
+        return app
+
+    yield make
+    for app in apps:
+        app._close_loop()
+        if app.root:
+            app.root._window.destroy()
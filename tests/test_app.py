@@ -0,0 +1,67 @@
+import json
+import os
+import socket
+
+import pytest
+
+import pyWin
+from conftest import MAIN, TestApp, write_app
+
+
+class ProfiledApp(TestApp):
+    def run(self):
+        # before the first window
+        self.profile(lagInterval=10, dump=os.path.join(self.path, "stats.json"), dumpInterval=0.01)
+        TestApp.run(self)
+
+
+def test_bundle_packs_interfaces_icons_and_images(tmp_path):
+    folder = str(tmp_path / "app")
+    interface = MAIN + "  - type: button\n    tag: logo\n    image: assets/logo.gif\n" \
+                       "  - type: label\n    image: /elsewhere/absolute.gif\n"
+    write_app(folder, {"main": interface}, {"en": "title: Title\n"})
+    os.makedirs(os.path.join(folder, "assets"))
+    with open(os.path.join(folder, "assets", "logo.gif"), "wb") as f:
+        f.write(b"GIF89a")
+    with open(os.path.join(folder, "app.ico"), "wb") as f:
+        f.write(b"ico")
+    with open(os.path.join(folder, "main.py"), "w") as f:
+        f.write("from pyWin import App\n")
+
+    content = pyWin._open_bundle(pyWin.bundle(folder))
+    assert sorted(content["files"]) == ["interface/main.yaml", "lang/en.yaml"]
+    assert content["resources"] == {"app.ico": b"ico", "assets/logo.gif": b"GIF89a"}
+
+
+def test_profile_before_the_first_window(make_app):
+    app = make_app(ProfiledApp)
+    app.backend.update(0.1)
+    stats = app.stats()
+    assert stats["event_loop_lag"]["count"] >= 3
+    with open(os.path.join(app.path, "stats.json")) as f:
+        assert "commands" in json.load(f)
+    app.profile(False)
+    assert app.stats() is None
+
+
+@pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="unix sockets")
+def test_stats_socket_never_replaces_a_file(make_app, tmp_path):
+    app = make_app()
+    path = str(tmp_path / "stats.sock")
+    with open(path, "w") as f:
+        f.write("keep")
+    with pytest.raises(OSError):
+        app.profile(address=path)
+    with open(path) as f:
+        assert f.read() == "keep"
+
+    os.remove(path)
+    app.profile(address=path)
+    # a socket left by a previous server is replaced
+    app.profile(address=path)
+    client = socket.socket(socket.AF_UNIX)
+    client.connect(path)
+    client.sendall(b"GET / HTTP/1.0\r\n\r\n")
+    assert client.recv(100).startswith(b"HTTP/1.0 200")
+    client.close()
+    app.profile(False)
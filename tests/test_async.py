@@ -0,0 +1,71 @@
+import asyncio
+
+import pyWin
+from conftest import TestApp
+
+
+class AsyncApp(TestApp):
+    @pyWin.drop_if_running
+    async def command_go(self, window, widget):
+        self.log.append("start")
+        await asyncio.sleep(0.01)
+        self.log.append("done")
+
+
+def test_finished_task_is_no_longer_running(make_app):
+    app = make_app(AsyncApp)
+    app.window["go"].invoke()
+    app.window["go"].invoke()
+    app.backend.update(0.1)
+    assert app.log == ["start", "done"]
+    assert not app.running("go")
+    # not dropped: the done callback of the first task ran
+    app.window["go"].invoke()
+    app.backend.update(0.1)
+    assert app.log == ["start", "done", "start", "done"]
+
+
+def test_task_exceptions_are_reported(make_app):
+    app = make_app()
+    errors = []
+    app.root._window.report_callback_exception = lambda kind, value, tb: errors.append(value)
+
+    async def fail():
+        raise ValueError("boom")
+
+    app.create_task(fail(), "fail")
+    app.backend.update(0.05)
+    assert [str(e) for e in errors] == ["boom"]
+    assert not app.running("fail")
+
+
+def test_waiting_on_a_socket_does_not_poll(make_app):
+    app = make_app()
+    received = []
+
+    async def serve():
+        server = await asyncio.start_server(lambda r, w: w.close(), "127.0.0.1", 0)
+        reader, writer = await asyncio.open_connection(*server.sockets[0].getsockname()[:2])
+        received.append(await reader.read())
+        writer.close()
+        server.close()
+
+    app.create_task(serve())
+    app.backend.update(0.2)
+    assert received == [b""]
+    assert app._selectorWatch[2] is not None
+
+
+class OtherLoop(asyncio.SelectorEventLoop):
+    # stands for a loop whose internals pyWin doesn't know
+    pass
+
+
+def test_other_loops_are_polled(make_app):
+    app = make_app(AsyncApp)
+    app._loop = OtherLoop()
+    assert not pyWin._loop_internals(app.loop)
+    app.window["go"].invoke()
+    app.backend.update(0.1)
+    assert app.log == ["start", "done"]
+    assert app._selectorWatch is None
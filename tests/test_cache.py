@@ -0,0 +1,65 @@
+import os
+import pickle
+
+import pytest
+
+import pyWin
+
+
+def write(path, text):
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text)
+
+
+def test_load_is_memoized_until_the_file_changes(tmp_path):
+    path = str(tmp_path / "a.yaml")
+    write(path, "title: one\n")
+    cache = pyWin._YamlCache()
+    first = cache.load(path)
+    assert first == {"title": "one"}
+    assert cache.load(path) is first
+    write(path, "title: two, longer\n")
+    assert cache.load(path) == {"title": "two, longer"}
+
+
+def test_compiled_entry_is_reused_from_disk(tmp_path, monkeypatch):
+    path = str(tmp_path / "a.yaml")
+    write(path, "widgets: []\n")
+    pyWin._YamlCache(str(tmp_path / "cache")).load(path)
+    assert len(os.listdir(tmp_path / "cache")) == 1
+
+    monkeypatch.setattr(pyWin, "_parse_yaml", lambda content: pytest.fail("parsed again"))
+    assert pyWin._YamlCache(str(tmp_path / "cache")).load(path) == {"widgets": []}
+
+
+def test_touched_file_with_same_content_is_not_parsed_again(tmp_path, monkeypatch):
+    path = str(tmp_path / "a.yaml")
+    write(path, "title: one\n")
+    pyWin._YamlCache(str(tmp_path / "cache")).load(path)
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+
+    monkeypatch.setattr(pyWin, "_parse_yaml", lambda content: pytest.fail("parsed again"))
+    assert pyWin._YamlCache(str(tmp_path / "cache")).load(path) == {"title": "one"}
+
+
+def test_corrupt_cache_file_is_ignored(tmp_path):
+    path = str(tmp_path / "a.yaml")
+    write(path, "title: one\n")
+    cache = pyWin._YamlCache(str(tmp_path / "cache"))
+    cache.load(path)
+    with open(cache._cache_path(path), "wb") as f:
+        f.write(b"not a pickle")
+    assert pyWin._YamlCache(str(tmp_path / "cache")).load(path) == {"title": "one"}
+    with open(cache._cache_path(path), "rb") as f:
+        assert pickle.load(f)["data"] == {"title": "one"}
+
+
+def test_invalid_files(tmp_path):
+    cache = pyWin._YamlCache()
+    with pytest.raises(FileNotFoundError):
+        cache.load(str(tmp_path / "missing.yaml"))
+    path = str(tmp_path / "list.yaml")
+    write(path, "- a\n- b\n")
+    with pytest.raises(pyWin.InvalidFileError):
+        cache.load(path)
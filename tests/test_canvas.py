@@ -0,0 +1,27 @@
+CANVAS = """\
+title: main
+widgets:
+  - type: canvas
+    tag: cv
+    width: 2i
+    height: 3c
+"""
+
+
+def test_draw_reuses_the_items_of_a_group(make_app):
+    app = make_app(interfaces={"main": CANVAS})
+    canvas = app.window["cv"]
+    first = canvas.draw("rectangle", [(0, 0, 10, 10), (5, 5, 20, 20)], "boxes", fill="red")
+    assert canvas.draw("rectangle", [(1, 1, 2, 2), (3, 3, 4, 4)], "boxes", fill="red") == first
+    assert canvas._widget.coords(first[1]) == [3.0, 3.0, 4.0, 4.0]
+    canvas.clear()
+    assert not canvas._widget.find_all()
+
+
+def test_plot_is_decimated_to_the_width_in_pixels(make_app):
+    app = make_app(interfaces={"main": CANVAS})
+    canvas = app.window["cv"]._widget
+    assert canvas.winfo_pixels("2i") == 192
+    line = canvas.plot("series", [i % 7 for i in range(10000)])
+    # a low and a high point per column
+    assert 4 <= len(canvas.coords(line)) <= 4 * (192 + 1)
@@ -0,0 +1,70 @@
+import pytest
+
+import pyWin
+
+EN = """\
+title: Title
+menu:
+  file: File
+welcome: Welcome, {user}
+files:
+  zero: No file
+  one: "{count} file"
+  other: "{count:d} files in {folder.name}"
+"""
+
+FR = """\
+menu:
+  file: Fichier
+files:
+  one: "{count} fichier"
+  other: "{count} fichiers"
+"""
+
+
+@pytest.fixture
+def langs(tmp_path):
+    (tmp_path / "en.yaml").write_text(EN, encoding="utf-8")
+    (tmp_path / "fr.yaml").write_text(FR, encoding="utf-8")
+    cache = pyWin._YamlCache()
+    en = pyWin._Lang(str(tmp_path / "en.yaml"), cache)
+    return en, pyWin._Lang(str(tmp_path / "fr.yaml"), cache, en)
+
+
+class Folder:
+    name = "docs"
+
+
+def test_keys_and_fallbacks(langs):
+    en, fr = langs
+    assert fr.get("$menu.file$") == "Fichier"
+    assert fr.get("$welcome$", user="Ana") == "Welcome, Ana"
+    assert fr.get("$missing$") == "$missing$"
+    assert fr.get("plain text") == "plain text"
+    assert en.menu == {"file": "File"}
+
+
+def test_plural_forms(langs):
+    en, fr = langs
+    assert en.format("files", count=0) == "No file"
+    assert en.format("files", count=1) == "1 file"
+    assert en.format("files", count=3, folder=Folder) == "3 files in docs"
+    # french: 0 and 1 are singular, no zero form
+    assert fr.format("files", count=0) == "0 fichier"
+    assert fr.format("files", count=1) == "1 fichier"
+    assert fr.format("files", count=2) == "2 fichiers"
+    assert en.fields("$files$") == {"count", "folder"}
+
+
+def test_missing_variables_stay_as_written(langs):
+    en, _ = langs
+    assert en.get("$welcome$") == "Welcome, {user}"
+    assert en.format("files", count=3) == "3 files in {folder.name}"
+    template = pyWin._compile_text("{count:d} of {total!r:>4} {{literal}}")
+    assert template.render({}) == "{count:d} of {total!r:>4} {literal}"
+    assert template.render({"count": 2}) == "2 of {total!r:>4} {literal}"
+
+
+def test_text_without_named_fields_is_kept():
+    for text in ["{}", "{0} and {1}", "a {{x}} b"]:
+        assert pyWin._compile_text(text) == text
@@ -0,0 +1,36 @@
+import tkinter as tk
+
+import pytest
+
+
+def test_widgets_are_plain_data(make_app):
+    app = make_app()
+    app.window["name"].set_value("bob")
+    app.window["name"].fire("Key-Return")
+    app.window["go"].invoke()
+    app.backend.update()
+    assert app.log == [("enter", "bob"), "go"]
+
+
+def test_unknown_subcommand_raises(make_app):
+    app = make_app()
+    widget = app.window["log"]._widget
+    widget.see("end")
+    widget.xview_moveto(0)
+    with pytest.raises(tk.TclError, match='bad option "bogus"'):
+        widget.tk.call(widget._w, "bogus")
+
+
+def test_text_tag_ranges_follow_the_text(make_app):
+    app = make_app()
+    text = app.window["log"]._widget
+    text.insert("1.0", "hello world")
+    text.tag_add("b", "1.0", "1.5")
+    text.tag_add("b", "1.3", "1.8")
+    assert [str(i) for i in text.tag_ranges("b")] == ["1.0", "1.8"]
+    text.tag_remove("b", "1.2", "1.4")
+    assert [str(i) for i in text.tag_nextrange("b", "1.1")] == ["1.4", "1.8"]
+    text.insert("1.0", "XX")
+    assert [str(i) for i in text.tag_ranges("b")] == ["1.2", "1.4", "1.6", "1.10"]
+    assert text.get("b.first", "b.last") == "hello wo"
+    assert text.tag_names("1.3") == ("b",)
@@ -0,0 +1,22 @@
+import os
+
+TIMERS = """\
+title: main
+timers: ["every {period} {script}"]
+widgets:
+  - type: label
+    tag: lab
+"""
+
+
+def test_reload_registers_the_interface_timers_again(make_app, tmp_path):
+    app = make_app(interfaces={"main": TIMERS.format(period="100ms", script="tick")})
+    own = app.scheduler.every(100, lambda window: None, app.window, "own")
+    assert [(t.name, t.period) for t in app.scheduler.timers] == [("main:tick", 0.1), ("own", 0.1)]
+
+    path = os.path.join(str(tmp_path), "interface", "main.yaml")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(TIMERS.format(period="250ms", script="refresh"))
+    app._reload({app.window.interface.path})
+    assert [(t.name, t.period) for t in app.scheduler.timers] == [("own", 0.1), ("main:refresh", 0.25)]
+    assert not own.cancelled
@@ -0,0 +1,29 @@
+REPEAT = """\
+title: main
+widgets:
+  - type: frame
+    tag: rows
+    repeat:
+      key: name
+      chunk: 10
+      widgets:
+        - type: label
+          text: "{name}"
+"""
+
+
+def labels(window):
+    return sorted(w.get_value() for w in window._ids.values() if w.type == "label")
+
+
+def test_render_again_during_a_chunked_render(make_app):
+    app = make_app(interfaces={"main": REPEAT})
+    window = app.window
+    window.render("rows", [{"name": f"a{i}"} for i in range(25)])
+    assert len(labels(window)) == 10
+    window.render("rows", [{"name": f"a{i}"} for i in range(5, 8)])
+    app.backend.update(0.05)
+    assert labels(window) == ["a5", "a6", "a7"]
+    window.render("rows", [])
+    app.backend.update(0.05)
+    assert labels(window) == []
@@ -0,0 +1,96 @@
+import json
+
+import pytest
+
+import pyWin
+from conftest import TestApp
+
+
+class ClearingApp(TestApp):
+    def command_enter(self, window, widget):
+        self.log.append(("enter", widget.get_value()))
+        widget.set_value("")
+
+
+def lines(path):
+    with open(path) as f:
+        return [json.loads(line) for line in f][1:]
+
+
+def test_record_and_replay(make_app, tmp_path):
+    app = make_app(ClearingApp)
+    window = app.window
+    path = str(tmp_path / "session.jsonl.gz")
+    app.record(path)
+    window["name"].set_value("first")
+    window["name"].fire("Return")
+    window["go"].invoke()
+    app.record(None)
+    assert app.log == [("enter", "first"), "go"]
+
+    app.log.clear()
+    window["name"].set_value("other")
+    reports = []
+    app.replay(path, 0, reports.append)
+    app.backend.update(0.1)
+    assert app.log == [("enter", "first"), "go"]
+    assert reports[0]["events"] == 2
+    assert reports[0]["errors"] == 0 and reports[0]["missing"] == 0
+
+
+def test_values_changed_by_handlers_are_recorded(make_app, tmp_path):
+    # the handler clears the entry: typing the same text again is a change
+    app = make_app(ClearingApp)
+    path = str(tmp_path / "session.jsonl")
+    app.record(path)
+    for _ in range(3):
+        app.window["name"].set_value("a")
+        app.window["name"].fire("Return")
+    app.record(None)
+    # the first line also has the values the inputs had when recording started
+    assert [line[-1] for line in lines(path)] == [{"name": "a", "flag": 0, "level": 0}] + [{"name": "a"}] * 2
+
+    app.log.clear()
+    app.replay(path, 0)
+    app.backend.update(0.1)
+    assert app.log == [("enter", "a")] * 3
+
+
+def test_recording_does_not_build_lazy_widgets(make_app, tmp_path):
+    app = make_app()
+    path = str(tmp_path / "session.jsonl")
+    app.record(path)
+    app.window["go"].invoke()
+    app.record(None)
+    assert "p2" not in app.window._tags
+    assert lines(path)[0][3:6] == ["go", "cmd", "go"]
+
+
+def test_invalid_session(tmp_path):
+    path = tmp_path / "session.jsonl"
+    path.write_text("{}\n")
+    with pytest.raises(pyWin.InvalidFileError):
+        pyWin._read_session(str(path))
+
+
+def test_inputs_python_never_read_are_recorded(make_app, tmp_path):
+    app = make_app()
+    path = str(tmp_path / "session.jsonl")
+    app.record(path)
+    window = app.create_window(app.get_interface("main"))
+    # typed by the user: only Tk writes the variable
+    app.backend.interp.globalsetvar(window["name"]._var_name, "typed")
+    assert window["name"]._var is None
+    window["go"].invoke()
+    app.record(None)
+    assert lines(path)[0][-1] == {"name": "typed"}
+
+
+def test_recording_again_does_not_trace_twice(make_app, tmp_path):
+    app = make_app()
+    name = app.window["name"]._var_name
+    for _ in range(2):
+        app.record(str(tmp_path / "session.jsonl"))
+        assert len(app.backend.interp.splitlist(app.backend.interp.call("trace", "info", "variable", name))) == 1
+    app.record(None)
+    assert not app.backend.interp.call("trace", "info", "variable", name)
@@ -0,0 +1,66 @@
+def test_template_binding_renders_once_per_frame(make_app):
+    app = make_app()
+    state, label = app.state, app.window["lab"]
+    state.update({"user": {"first": "Ana", "last": "Li"}})
+    state.bind(label, "{user.first} {user.last}")
+    state["user.first"] = "Bo"
+    state["user.last"] = "Ng"
+    assert label.get_value() == "Ana Li"
+    state.flush()
+    assert label.get_value() == "Bo Ng"
+
+
+def test_labels_are_not_bound_back_into_the_state(make_app):
+    app = make_app()
+    state = app.state
+    state["count"] = 5
+    state.bind(app.window["lab"], "count")
+    state["count"] += 1
+    state.flush()
+    assert state["count"] == 6
+    assert app.window["lab"].get_value() == "6"
+
+
+def test_inputs_write_back_with_the_state_type(make_app):
+    app = make_app()
+    state, window = app.state, app.window
+    state.update(count=5, enabled=False, level=2)
+    state.bind(window["name"], "count")
+    state.bind(window["flag"], "enabled")
+    state.bind(window["level"], "level")
+    assert state["count"] == 5 and window["name"].get_value() == "5"
+
+    window["name"].set_value("42")
+    assert state["count"] == 42
+    # not a number yet: the state keeps its value
+    window["name"].set_value("4x")
+    assert state["count"] == 42
+    window["flag"].invoke()
+    assert state["enabled"] is True
+    window["level"].set_value(7)
+    assert state["level"] == 7
+
+
+def test_unbound_widget_stops_writing_back(make_app):
+    app = make_app()
+    state, entry = app.state, app.window["name"]
+    state["text"] = "a"
+    state.bind(entry, "text")
+    state.unbind(entry)
+    entry.set_value("b")
+    assert state["text"] == "a"
+
+
+def test_deleted_and_closed_widgets_leave_no_trace(make_app):
+    app = make_app()
+    state = app.state
+    window = app.create_window(app.get_interface("main"))
+    state.bind(window["name"], "user.name")
+    state.bind(window["lab"], "user.title")
+    assert state._children == {"user": {"user.name", "user.title"}}
+    name = window["name"]
+    window._delete_widget(name)
+    assert not name.var.trace_info()
+    assert state._children == {"user": {"user.title"}}
+    window.close()
+    assert state._deps == {} and state._children == {}
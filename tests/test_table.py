@@ -0,0 +1,63 @@
+import pytest
+
+import pyWin
+
+
+@pytest.fixture
+def store():
+    store = pyWin._ColumnStore([("name", "str"), ("age", "int"), ("score", "float")])
+    store.append([("bob", 30, 1.5), {"name": "al", "age": 25}, ("cy", 30, 0.5), ("di", 41, 2.0)])
+    return store
+
+
+def test_append_converts_and_fills_defaults(store):
+    assert len(store) == 4
+    assert store.row(1) == {"name": "al", "age": 25, "score": 0.0}
+    assert store.append([("ed", "7", "1")]) == [4]
+    assert store.row(4) == {"name": "ed", "age": 7, "score": 1.0}
+
+
+def test_sort_is_stable_and_reversible(store):
+    assert list(store.view("age")) == [1, 0, 2, 3]
+    assert list(store.view("age", reverse=True)) == [3, 2, 0, 1]
+    assert list(store.view("name")) == [1, 0, 2, 3]
+    assert list(store.view()) == [0, 1, 2, 3]
+
+
+def test_sort_index_follows_updates_and_appends(store):
+    store.view("age")
+    store.update(3, {"age": 1})
+    assert list(store.view("age")) == [3, 1, 0, 2]
+    store.append([("zo", 26, 0.0)])
+    assert list(store.view("age")) == [3, 1, 4, 0, 2]
+
+
+def test_filters(store):
+    assert list(store.view(conditions=[("age", "==", 30)])) == [0, 2]
+    assert list(store.view("score", conditions=[("age", ">=", 30)])) == [2, 0, 3]
+    assert list(store.view(conditions=[("name", lambda v: v.startswith("b"))])) == [0]
+    assert list(store.view(conditions=[("age", "==", 30), ("score", ">", 1)])) == [0]
+
+
+def test_deleted_rows_leave_every_view(store):
+    store.delete([0, 0])
+    assert store.count == 3
+    assert list(store.view("age")) == [1, 2, 3]
+    assert list(store.view(conditions=[("age", "==", 30)])) == [2]
+
+
+def test_set_columns_truncates_to_the_shortest(store):
+    store.set_columns({"name": ["a", "b", "c"], "age": [3, 2], "score": [1, 2, 3]})
+    assert len(store) == 2
+    assert list(store.view("age")) == [1, 0]
+
+
+def test_table_widget(make_app):
+    table = make_app().window["tab"]
+    table.append_rows([("bob", 3), ("al", 5), ("cy", 4)])
+    table.sort("age", True)
+    table._widget._body.select(0)
+    assert table.get_value() == {"name": "al", "age": 5}
+    table.filter(("age", "<", 5))
+    assert table.selection is None
+    assert table._widget._view.tolist() == [2, 0]
@@ -0,0 +1,53 @@
+import threading
+
+from conftest import TestApp
+
+THREAD = """\
+title: main
+widgets:
+  - type: label
+    tag: lab
+    background: red
+  - type: button
+    tag: go
+    action: go
+    thread: true
+"""
+
+
+class ThreadApp(TestApp):
+    def command_go(self, window, widget):
+        self.log.append(threading.current_thread() is threading.main_thread())
+
+
+def test_thread_key_runs_the_action_on_the_executor(make_app):
+    app = make_app(ThreadApp, {"main": THREAD})
+    window = app.window
+    assert window["lab"]._widget.cget("background") == "red"
+    window["go"].invoke()
+    app.executor.shutdown(wait=True)
+    assert app.log == [False]
+
+
+def test_posts_from_threads_wake_the_pump(make_app):
+    app = make_app()
+    window = app.window
+
+    def worker():
+        window["log"].extend(["a", "b"])
+        window["log"].back(1)
+        window["lab"].set("text", "from a thread")
+        window["tab"].append_rows([("bob", 3), ("al", 5)])
+        window["tab"].update_row(0, age=9)
+        window["tab"].sort("age")
+        app.post(app.log.append, "posted")
+
+    thread = threading.Thread(target=worker)
+    thread.start()
+    thread.join()
+    assert window["log"].get_value() == ""
+    app.backend.update(0.05)
+    assert window["log"].get_value() == "a\nb"
+    assert window["lab"].get_value() == "from a thread"
+    assert list(window["tab"]._widget._view) == [1, 0]
+    assert app.log == ["posted"]
@@ -0,0 +1,126 @@
+import pytest
+
+import pyWin
+
+
+class Clock:
+    def __init__(self, now=100.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+class FakeWidget:
+    # the after() side of a Tk widget, timers are fired by hand
+    def __init__(self):
+        self.timers = []
+
+    def after(self, ms, func):
+        self.timers.append((ms, func))
+        return len(self.timers)
+
+    def after_idle(self, func):
+        return self.after("idle", func)
+
+    def winfo_exists(self):
+        return True
+
+    def fire(self):
+        timers, self.timers = self.timers, []
+        for _, func in timers:
+            func()
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(pyWin.time, "perf_counter", clock)
+    return clock
+
+
+def test_period_parsing():
+    assert pyWin._parse_period("150ms") == 150
+    assert pyWin._parse_period("0.5s") == 500
+    assert pyWin._parse_period("20hz") == 50
+    with pytest.raises(pyWin.InvalidEventError):
+        pyWin._parse_period("fast")
+
+
+def test_invalid_modifiers():
+    with pytest.raises(pyWin.InvalidEventError):
+        pyWin._RateLimiter(FakeWidget(), print, "sometimes")
+    with pytest.raises(pyWin.InvalidEventError):
+        pyWin._RateLimiter(FakeWidget(), print, "debounce")
+
+
+def test_debounce_calls_once_with_the_last_event(clock):
+    widget, calls = FakeWidget(), []
+    limiter = pyWin._RateLimiter(widget, calls.append, "debounce=100ms")
+    for event in "abc":
+        limiter(event)
+        clock.now += 0.05
+    assert len(widget.timers) == 1
+    widget.fire()
+    # the last event came 50ms ago: waits for the rest of the period
+    assert calls == [] and len(widget.timers) == 1
+    clock.now += 0.05
+    widget.fire()
+    assert calls == ["c"]
+
+
+def test_throttle_calls_at_once_then_at_most_once_per_period(clock):
+    widget, calls = FakeWidget(), []
+    limiter = pyWin._RateLimiter(widget, calls.append, "throttle=10hz")
+    limiter("a")
+    assert calls == ["a"]
+    clock.now += 0.02
+    limiter("b")
+    limiter("c")
+    assert calls == ["a"] and len(widget.timers) == 1
+    clock.now += 0.08
+    widget.fire()
+    assert calls == ["a", "c"]
+
+
+def test_coalesce_and_idle(clock):
+    for modifier, delay in [("coalesce", 0), ("idle", "idle")]:
+        widget, calls = FakeWidget(), []
+        limiter = pyWin._RateLimiter(widget, calls.append, modifier)
+        for event in "abc":
+            limiter(event)
+        assert [ms for ms, _ in widget.timers] == [delay]
+        widget.fire()
+        assert calls == ["c"]
+
+
+def test_scheduler_stays_on_its_grid_and_skips_missed_runs(make_app, clock):
+    app = make_app()
+    runs = []
+    timer = app.scheduler.every("100ms", lambda: runs.append(clock.now))
+    start = clock.now
+    # late ticks don't push the next due time
+    for late in [0.1, 0.23, 0.31]:
+        clock.now = start + late
+        app.scheduler._tick()
+    assert len(runs) == 3
+    assert timer.due == pytest.approx(start + 0.4)
+    assert timer.skipped == 0
+    # a 350ms stall runs once and skips what was missed
+    clock.now = start + 0.75
+    app.scheduler._tick()
+    assert len(runs) == 4
+    assert timer.skipped == 3
+    assert timer.due == pytest.approx(start + 0.8)
+
+
+def test_scheduler_pauses_timers_of_hidden_windows(make_app, clock):
+    app = make_app()
+    runs = []
+    timer = app.scheduler.every(100, lambda window: runs.append(window), app.window)
+    app.window._window.withdraw()
+    clock.now += 0.1
+    app.scheduler._tick()
+    assert runs == [] and timer.paused
+    timer.cancel()
+    assert app.scheduler.stats() == {}
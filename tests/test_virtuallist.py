@@ -0,0 +1,16 @@
+def test_item_options_reach_the_rows(make_app):
+    app = make_app()
+    vlist = app.window["p2"]
+    vlist.set_items(["a", "b", "c"])
+    vlist._widget.select(1)
+    vlist.set("font", "Courier 12")
+    vlist.set("bg", "red")
+    with app.window.batch():
+        vlist.set("fg", "green")
+        vlist.set("selectbackground", "blue")
+        vlist.set("width", 50)
+    rows = vlist._widget._rows
+    assert [rows[0].cget("font"), rows[0].cget("bg"), rows[0].cget("fg")] == ["Courier 12", "red", "green"]
+    # the selected row keeps the selection colours
+    assert [rows[1].cget("bg"), rows[1].cget("fg")] == ["blue", "white"]
+    assert vlist._widget.cget("font") == "Courier 12" and vlist._widget.cget("width") == 50
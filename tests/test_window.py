@@ -0,0 +1,88 @@
+import pytest
+
+import pyWin
+
+
+def test_args_are_read_only_and_copied_on_write(make_app):
+    app = make_app()
+    first = app.window["lab"]
+    second = app.create_window(app.get_interface("main"))["lab"]
+    assert first.args is not second.args
+    with pytest.raises(TypeError):
+        first.args["fg"] = "red"
+    first.set("fg", "red")
+    assert first.args["fg"] == "red"
+    assert "fg" not in second.args
+    assert app.window["name"].binds == ("Return enter",)
+    assert app.window["go"].binds == ()
+
+
+def test_indexing(make_app):
+    window = make_app().window
+    widgets = window.widgets
+    widgets[0].delete()
+    label = window.create_widget("label", text="new")
+    assert window["lab"].tag == "lab"
+    assert window[0] is window.widgets[0] is widgets[1]
+    assert window[-1] is label
+    assert window.by_id(label.id) is label
+    with pytest.raises(KeyError):
+        window.by_id(widgets[0].id)
+    with pytest.raises(KeyError):
+        window["missing"]
+    window.delete_many(label.id, "lab")
+    assert label.id not in window._ids and "lab" not in window._tags
+
+
+def test_text_change_event_only_when_bound(make_app):
+    app = make_app()
+    text = app.window["log"]._widget
+    text.tk.eval("set ::generated 0; rename event pyWin_test_event; "
+                 "proc event {args} {if {[lindex $args 0] eq {generate}} {incr ::generated}; "
+                 "uplevel [linsert $args 0 pyWin_test_event]}")
+    app.window["log"].extend(["a", "b"])
+    assert text.tk.eval("set ::generated") == "0"
+    changes = []
+    text.bind("<<Change>>", changes.append)
+    app.window["log"].append("c")
+    app.backend.update()
+    assert len(changes) == 1
+    assert app.window["log"].get_value() == "a\nb\nc"
+
+
+def test_calls_on_lazy_widgets_keep_keyword_arguments(make_app):
+    window = make_app().window
+    lazy = window["p2"]
+    assert not lazy.built
+    lazy.set_items(["a", "b", "c"], count=2)
+    window["nb"]._widget.select(1)
+    window.app.backend.update()
+    assert lazy.built
+    assert window["p2"]._widget._count == 2
+
+
+def test_resource_paths(make_app, tmp_path):
+    app = make_app()
+    resources = pyWin._Resources(app)
+    assert resources.resolve("assets/a.png") == app.path + "/assets/a.png"
+    absolute = str(tmp_path / "a.png")
+    assert resources.resolve(absolute) == absolute
+
+
+def test_recycled_window_is_reset(make_app):
+    app = make_app()
+    app.pool(app.get_interface("main"), size=1)
+    window = app.create_window(app.get_interface("main"))
+    window["name"].set_value("typed")
+    window["tab"].append_rows([("bob", 3), ("al", 5)])
+    window["tab"].sort("age", True)
+    window["tab"].filter(("age", ">", 3))
+    window["cv"].draw("oval", [(1, 2, 3, 4)], group="dots")
+    window.close()
+
+    again = app.create_window(app.get_interface("main"))
+    assert again is window
+    assert again["name"].get_value() == ""
+    table = again["tab"]._widget
+    assert len(table.store) == 0 and table._sort == (None, False) and table._conditions == ()
+    assert again["cv"]._widget.find_all() == () and again["cv"]._widget._groups == {}